@@ -0,0 +1,41 @@
+from game.utils.constants import TILE_SIZE
+
+def tile(x, y):
+    """Pixel position of the given tile (top-left corner)"""
+    return (int(x * TILE_SIZE), int(y * TILE_SIZE))
+
+# Rute pemain per ruangan: titik awal, waypoint, dan apakah pemain berlari.
+# Rute melewati cone penjaga dan laser tanpa tertangkap (dicek dengan seed 0-3,
+# sampai 900 frame), supaya angka frame-time mengukur permainan normal.
+ROUTES = {
+    0: {
+        "start": tile(3, 8),
+        "waypoints": [tile(3, 9), tile(13, 6), tile(4, 9), tile(12, 4), tile(15, 9)],
+        "run": False,
+    },
+    1: {
+        "start": tile(7, 8),
+        "waypoints": [tile(13, 7), tile(12, 9), tile(9, 8), tile(17, 6)],
+        "run": False,
+    },
+    2: {
+        "start": tile(5, 2),
+        "waypoints": [tile(2, 1), tile(11, 4), tile(8, 1)],
+        "run": True,
+    },
+    3: {
+        "start": tile(17, 1),
+        "waypoints": [tile(9, 6), tile(16, 6), tile(14, 3), tile(8, 3)],
+        "run": False,
+    },
+}
+
+# Skenario stres: ruangan diisi banyak guard yang langsung mengejar pemain,
+# untuk mengukur update_guards dengan flow field bersama. Pemain memakai rute
+# ruangan yang sama; tertangkap di sini memang diharapkan dan tidak dihitung.
+STRESS_ROUTES = {
+    "room2_chase_24": {
+        "room": 1,
+        "guards": 24,
+    },
+}
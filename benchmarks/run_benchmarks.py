@@ -0,0 +1,212 @@
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Jangan cetak banner pygame ke stdout supaya output JSON tetap valid
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from game.game_manager import GameManager
+from game.entities.guard import Guard
+from game.simulation import ScriptedInput, FIXED_DT
+from game.utils.constants import TILE_SIZE
+from benchmarks.routes import ROUTES, STRESS_ROUTES
+
+# Rute harus lolos tanpa tertangkap; di atas batas ini angka frame-time
+# sebagian besar mengukur status tertangkap, bukan rute yang direkam
+MAX_CAUGHT_FRACTION = 0.02
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+def summarize(samples):
+    """mean/p95/p99/max of a list of durations in seconds, reported in ms"""
+    return {
+        "mean_ms": round(sum(samples) / len(samples) * 1000, 4),
+        "p95_ms": round(percentile(samples, 95) * 1000, 4),
+        "p99_ms": round(percentile(samples, 99) * 1000, 4),
+        "max_ms": round(max(samples) * 1000, 4),
+    }
+
+def enter_room(game_manager, room_index, route):
+    """Put the player at the start of route inside room_index"""
+    game_manager.current_room_index = room_index
+    game_manager.current_room = game_manager.get_room(room_index)
+    game_manager.player.x, game_manager.player.y = route["start"]
+    return game_manager.current_room
+
+def play_route(room_index, frames, seed, frames_per_waypoint, on_frame, setup=None):
+    """
+    Drive the player along the room's route for frames fixed steps.
+    on_frame(room, game_manager) runs the frame's update + draw;
+    setup(room), if given, runs once after entering the room.
+    Returns how many times the player was caught.
+    """
+    route = ROUTES[room_index]
+    game_manager = GameManager(headless=True, seed=seed)
+    room = enter_room(game_manager, room_index, route)
+    if setup:
+        setup(room)
+    script = ScriptedInput.follow_route(route["waypoints"], frames_per_waypoint, run=route["run"])
+
+    caught_frames = 0
+    for frame in range(frames):
+        events, game_manager.mouse_pos = script.poll(frame)
+        for event in events:
+            game_manager.handle_event(event)
+
+        was_game_over = game_manager.game_over
+        on_frame(room, game_manager)
+        if game_manager.game_over and not was_game_over:
+            caught_frames += 1
+            # Abaikan game over supaya rute tetap berjalan di ruangan yang sama
+            game_manager.game_over = False
+    return caught_frames
+
+def time_room(room_index, frames, seed, frames_per_waypoint):
+    """Timing pass, without tracemalloc: update/draw durations per frame"""
+    update_times = []
+    draw_times = []
+
+    def on_frame(room, game_manager):
+        start = time.perf_counter()
+        room.update(FIXED_DT, game_manager.mouse_held, game_manager.mouse_pos)
+        update_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        room.draw()
+        draw_times.append(time.perf_counter() - start)
+
+    caught_frames = play_route(room_index, frames, seed, frames_per_waypoint, on_frame)
+    return caught_frames, summarize(update_times), summarize(draw_times)
+
+def trace_room(room_index, frames, seed, frames_per_waypoint):
+    """
+    Allocation pass over the same route with tracemalloc on: the peak of
+    traced memory above each frame's starting point, averaged in KiB.
+    """
+    peaks = []
+
+    def on_frame(room, game_manager):
+        tracemalloc.reset_peak()
+        base, _ = tracemalloc.get_traced_memory()
+        room.update(FIXED_DT, game_manager.mouse_held, game_manager.mouse_pos)
+        room.draw()
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - base)
+
+    tracemalloc.start()
+    try:
+        play_route(room_index, frames, seed, frames_per_waypoint, on_frame)
+    finally:
+        tracemalloc.stop()
+    return round(sum(peaks) / len(peaks) / 1024, 2)
+
+def run_room(room_index, frames, seed, frames_per_waypoint, track_allocations):
+    caught_frames, update, draw = time_room(room_index, frames, seed, frames_per_waypoint)
+    result = {
+        "room": room_index + 1,
+        "frames": frames,
+        "caught_frames": caught_frames,
+        "update": update,
+        "draw": draw,
+    }
+    if track_allocations:
+        result["traced_peak_kb_per_frame"] = trace_room(room_index, frames, seed, frames_per_waypoint)
+    return result
+
+def run_benchmarks(rooms=None, frames=600, seed=0, frames_per_waypoint=120, track_allocations=True):
+    rooms = rooms if rooms is not None else sorted(ROUTES)
+    return {
+        "frames_per_room": frames,
+        "seed": seed,
+        "dt": FIXED_DT,
+        "rooms": [run_room(room_index, frames, seed, frames_per_waypoint, track_allocations) for room_index in rooms],
+    }
+
+def fill_with_chasers(room, count):
+    """
+    Replace room.guards with count copies of its first guard, spread over
+    the walkable cells and all chasing the player from the first frame.
+    """
+    template = room.guards[0]
+    guard_data = {"speed": template.get_speed(), "vision_range": template.get_vision_range(),
+                  "color": template.get_vision_color()}
+    walkable = room.pathfinder.walkable
+    cells = [(cx, cy) for cy, row in enumerate(walkable) for cx, open_cell in enumerate(row) if open_cell]
+    step = max(1, len(cells) // count)
+    room.guards = [Guard(cx * TILE_SIZE, cy * TILE_SIZE, template.guard_type, [(cx, cy)],
+                         template.frames, guard_data, room.collision_grid)
+                   for cx, cy in cells[::step][:count]]
+    room.attach_guards()
+    for guard in room.guards:
+        guard.set_alert_level(100)
+        guard.set_state("chase")
+
+def run_stress(name, frames, seed, frames_per_waypoint):
+    """Timing pass for a STRESS_ROUTES entry: update_guards and whole update() per frame"""
+    scenario = STRESS_ROUTES[name]
+    guard_times = []
+    update_times = []
+
+    def setup(room):
+        fill_with_chasers(room, scenario["guards"])
+        update_guards = room.update_guards
+
+        def timed_update_guards(dt):
+            start = time.perf_counter()
+            update_guards(dt)
+            guard_times.append(time.perf_counter() - start)
+        room.update_guards = timed_update_guards
+
+    def on_frame(room, game_manager):
+        start = time.perf_counter()
+        room.update(FIXED_DT, game_manager.mouse_held, game_manager.mouse_pos)
+        update_times.append(time.perf_counter() - start)
+
+    play_route(scenario["room"], frames, seed, frames_per_waypoint, on_frame, setup)
+    return {
+        "name": name,
+        "room": scenario["room"] + 1,
+        "guards": scenario["guards"],
+        "frames": frames,
+        "update_guards": summarize(guard_times),
+        "update": summarize(update_times),
+    }
+
+def caught_rooms(results, max_caught_fraction=MAX_CAUGHT_FRACTION):
+    """Rooms whose route got the player caught too often to be a valid measurement"""
+    return [room for room in results["rooms"]
+            if room["caught_frames"] > room["frames"] * max_caught_fraction]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-room frame time benchmark (headless)")
+    parser.add_argument("--rooms", type=int, nargs="*", help="room numbers to run (1-4), default all")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-alloc", action="store_true", help="skip the separate tracemalloc pass")
+    parser.add_argument("--stress", action="store_true", help="also run the STRESS_ROUTES scenarios")
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    rooms = [number - 1 for number in args.rooms] if args.rooms else None
+    results = run_benchmarks(rooms, args.frames, args.seed, track_allocations=not args.no_alloc)
+    if args.stress:
+        results["stress"] = [run_stress(name, args.frames, args.seed, 120) for name in sorted(STRESS_ROUTES)]
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    failed = caught_rooms(results)
+    if failed:
+        rooms = ", ".join(f"room {room['room']} ({room['caught_frames']}/{room['frames']})" for room in failed)
+        sys.exit(f"player caught too often, results are not valid: {rooms}")
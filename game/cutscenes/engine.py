@@ -0,0 +1,325 @@
+import pygame
+import sys
+import math
+from game.utils.constants import *
+from game.utils.text import get_font, render_text
+from game.utils.dirty_rects import DirtyRenderer, IDLE_TIMEOUT
+from game.utils.asset_loader import load_background
+
+FONT_PATH = "game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf"
+
+# Warna teks per pembicara: (dialog saat ini, dialog sebelumnya)
+SPEAKER_COLORS = {
+    "Narator": ((0, 255, 0), (0, 200, 0)),
+    "Mangki": ((135, 206, 250), (100, 180, 220)),
+}
+DEFAULT_COLORS = ((255, 255, 255), (200, 200, 200))
+
+def wrap_text(text, font, max_width):
+    """Split text into lines no wider than max_width (long words are cut)"""
+    words = text.split(' ')
+    lines = []
+    current_line = []
+
+    for word in words:
+        # Coba tambahkan kata ke baris saat ini
+        test_line = ' '.join(current_line + [word])
+        if font.size(test_line)[0] <= max_width:
+            current_line.append(word)
+        elif current_line:
+            # Baris saat ini sudah penuh, mulai baris baru
+            lines.append(' '.join(current_line))
+            current_line = [word]
+        elif font.size(word)[0] > max_width:
+            # Kata terlalu panjang untuk satu baris, potong per karakter
+            for i in range(len(word)):
+                if font.size(word[:i+1])[0] > max_width:
+                    if i > 0:
+                        lines.append(word[:i])
+                        current_line = [word[i:]]
+                    else:
+                        current_line = [word]
+                    break
+        else:
+            lines.append(word)
+
+    # Tambahkan baris terakhir
+    if current_line:
+        lines.append(' '.join(current_line))
+
+    return lines
+
+def speaker_of(line):
+    for speaker in SPEAKER_COLORS:
+        if line.startswith(speaker + ":"):
+            return speaker
+    return None
+
+def load_cutscene_background(path):
+    """Background darkened by the usual 150/255 overlay, black when the image is missing"""
+    try:
+        return load_background(path, (SCREEN_WIDTH, SCREEN_HEIGHT), darken=150)
+    except (pygame.error, FileNotFoundError):
+        # Fallback jika gambar tidak ada
+        background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        background.fill((0, 0, 0))
+        return background
+
+class CutscenePlayer:
+    """
+    Plays a dialogue cutscene described by a script dict:
+      caption, title, lines        - window caption, title and dialogue lines
+      background (optional)        - image path, drawn darkened with a slow parallax
+      backdrop (optional)          - callable(screen, player) drawn behind the text
+      backdrop_rect (optional)     - screen area the backdrop animates, redrawn every frame
+      title_shadow, line_margin    - optional styling (shadow color, text margin)
+    background_step, if given, is called once per frame after the frame is
+    presented (e.g. one step of a room prefetch) until it returns False.
+    Text is wrapped once, finished lines are rendered once, and only the
+    line that is currently typing is re-rendered when it grows. Frames are
+    presented through a DirtyRenderer, so only the dialog box is redrawn
+    while text types and nothing is redrawn while waiting for input.
+    """
+    text_speed = 45  # Karakter per detik (satu langkah tiap 60 / text_speed frame)
+    line_spacing = 30
+    max_visible_lines = 12
+    fade_speed = 3
+
+    def __init__(self, script, screen, background_step=None):
+        self.script = script
+        self.screen = screen
+        self.background_step = background_step
+        self.font = get_font(24, FONT_PATH)
+        title_font = get_font(36, FONT_PATH)
+
+        # Latar: gambar digelapkan sekali (overlay 150/255) daripada setiap frame
+        self.background = None
+        if script.get("background"):
+            self.background = load_cutscene_background(script["background"])
+        self.backdrop = script.get("backdrop")
+
+        self.title_surface = render_text(title_font, script["title"], (255, 255, 255))
+        self.title_shadow = render_text(title_font, script["title"], script.get("title_shadow", (0, 0, 0)))
+        self.continue_surface = render_text(self.font, "Tekan SPASI untuk melanjutkan...", (255, 255, 255))
+
+        # Dialog dipecah sekali saja
+        max_line_width = SCREEN_WIDTH - script.get("line_margin", 300)
+        self.dialogs = []
+        for line in script["lines"]:
+            self.dialogs.append({
+                "lines": wrap_text(line, self.font, max_line_width),
+                "speaker": speaker_of(line),
+            })
+
+        self.line_surfaces = {}  # (dialog, baris, selesai?) -> Surface
+        self.dialog_boxes = {}  # tinggi -> Surface kotak dialog
+        self.typing_surface = None
+        self.typing_key = None
+        self.fade_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.fade_surface.fill((0, 0, 0))
+
+        self.dialog_index = 0
+        self.line_index = 0
+        self.text_position = 0
+        self.text_timer = 0
+        self.dialog_complete = False
+        self.fade_alpha = 255
+        self.fade_in = True
+        self.fade_out = False
+        self.time_passed = 0
+        self.running = True
+
+        # Status yang terakhir digambar, untuk menentukan area yang berubah
+        self.renderer = DirtyRenderer(screen)
+        self.drawn_scene = None
+        self.drawn_text = None
+        self.drawn_box = None
+
+    def handle_event(self, event):
+        self.renderer.handle_event(event)
+        if event.type == pygame.QUIT:
+            pygame.quit()
+            sys.exit()
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                self.running = False
+            elif event.key == pygame.K_SPACE:
+                if self.dialog_complete:
+                    # Pindah ke dialog berikutnya
+                    if self.dialog_index < len(self.dialogs) - 1:
+                        self.dialog_index += 1
+                        self.line_index = 0
+                        self.text_position = 0
+                        self.dialog_complete = False
+                    else:
+                        self.fade_out = True
+                else:
+                    # Tampilkan semua teks dialog saat ini
+                    lines = self.dialogs[self.dialog_index]["lines"]
+                    self.dialog_complete = True
+                    self.line_index = len(lines) - 1
+                    self.text_position = len(lines[self.line_index])
+
+    def update(self, dt):
+        self.time_passed += dt
+
+        # Efek fade in/out
+        if self.fade_in:
+            self.fade_alpha = max(0, self.fade_alpha - self.fade_speed)
+            if self.fade_alpha <= 0:
+                self.fade_in = False
+        if self.fade_out:
+            self.fade_alpha = min(255, self.fade_alpha + self.fade_speed)
+            if self.fade_alpha >= 255:
+                self.running = False
+
+        # Animasi teks
+        if not self.dialog_complete:
+            self.text_timer += 1
+            if self.text_timer >= 60 / self.text_speed:
+                self.text_timer = 0
+                self.text_position += 1
+                lines = self.dialogs[self.dialog_index]["lines"]
+                if self.text_position > len(lines[self.line_index]):
+                    self.text_position = len(lines[self.line_index])
+                    if self.line_index < len(lines) - 1:
+                        self.line_index += 1
+                        self.text_position = 0
+                    else:
+                        self.dialog_complete = True
+
+    def line_surface(self, dialog_index, line_index, current):
+        key = (dialog_index, line_index, current)
+        surface = self.line_surfaces.get(key)
+        if surface is None:
+            dialog = self.dialogs[dialog_index]
+            color = SPEAKER_COLORS.get(dialog["speaker"], DEFAULT_COLORS)[0 if current else 1]
+            surface = self.font.render(dialog["lines"][line_index], True, color)
+            self.line_surfaces[key] = surface
+        return surface
+
+    def typing_line_surface(self):
+        # Render ulang hanya jika baris yang sedang diketik bertambah
+        key = (self.dialog_index, self.line_index, self.text_position)
+        if key != self.typing_key:
+            dialog = self.dialogs[self.dialog_index]
+            color = SPEAKER_COLORS.get(dialog["speaker"], DEFAULT_COLORS)[0]
+            self.typing_surface = self.font.render(dialog["lines"][self.line_index][:self.text_position], True, color)
+            self.typing_key = key
+        return self.typing_surface
+
+    def dialog_box(self, height):
+        box = self.dialog_boxes.get(height)
+        if box is None:
+            box = pygame.Surface((SCREEN_WIDTH - 100, height), pygame.SRCALPHA)
+            box.fill((0, 0, 0, 180))
+            pygame.draw.rect(box, (255, 255, 255, 50), box.get_rect(), 2)
+            self.dialog_boxes[height] = box
+        return box
+
+    def visible_lines(self):
+        """Rendered surfaces of every line shown so far, oldest first"""
+        for d_idx in range(self.dialog_index):
+            for l_idx in range(len(self.dialogs[d_idx]["lines"])):
+                yield self.line_surface(d_idx, l_idx, False)
+        for l_idx in range(self.line_index):
+            yield self.line_surface(self.dialog_index, l_idx, True)
+        yield self.typing_line_surface()
+
+    def parallax_offset(self):
+        return (int(math.sin(self.time_passed * 0.0005) * 10),
+                int(math.cos(self.time_passed * 0.0003) * 5))
+
+    def box_rect(self):
+        visible = min(sum(len(d["lines"]) for d in self.dialogs[:self.dialog_index]) + self.line_index + 1,
+                      self.max_visible_lines)
+        dialog_height = min(80 + visible * self.line_spacing, SCREEN_HEIGHT - 200)
+        return self.dialog_box(dialog_height).get_rect(centerx=SCREEN_WIDTH // 2, bottom=SCREEN_HEIGHT - 50)
+
+    @property
+    def animating(self):
+        return self.fade_in or self.fade_out or not self.dialog_complete
+
+    def mark_changes(self):
+        """Mark the screen areas that differ from the last presented frame"""
+        # Latar bergerak atau fade aktif: seluruh layar berubah
+        scene = (self.parallax_offset() if self.background is not None else None,
+                 self.fade_alpha if self.fade_in or self.fade_out else None)
+        if scene != self.drawn_scene:
+            self.renderer.mark_all()
+            self.drawn_scene = scene
+
+        blink_on = self.dialog_complete and (self.time_passed // 500) % 2 == 0
+        text = (self.dialog_index, self.line_index, self.text_position, blink_on)
+        if text != self.drawn_text:
+            box = self.box_rect()
+            # Kotak dialog bisa tumbuh ke atas: tandai area lama dan baru
+            self.renderer.mark(box.union(self.drawn_box) if self.drawn_box else box)
+            self.drawn_text = text
+            self.drawn_box = box
+
+        self.renderer.mark(self.script.get("backdrop_rect"))
+
+    def draw(self):
+        screen = self.screen
+        screen.fill((0, 0, 0))
+        if self.background is not None:
+            # Latar dengan efek parallax sederhana
+            screen.blit(self.background, self.parallax_offset())
+        if self.backdrop:
+            self.backdrop(screen, self)
+
+        # Judul dengan bayangan
+        screen.blit(self.title_shadow, self.title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 2, 100 + 2)))
+        screen.blit(self.title_surface, self.title_surface.get_rect(center=(SCREEN_WIDTH // 2, 100)))
+
+        # Kotak dialog setinggi baris yang terlihat
+        box_rect = self.box_rect()
+        screen.blit(self.dialog_box(box_rect.height), box_rect.topleft)
+        lines = list(self.visible_lines())[-self.max_visible_lines:]
+
+        y_offset = 40
+        for surface in lines:
+            screen.blit(surface, surface.get_rect(midleft=(box_rect.left + 40, box_rect.top + y_offset)))
+            y_offset += self.line_spacing
+
+        # Indikator "tekan spasi" yang berkedip setiap 500ms
+        if self.dialog_complete and (self.time_passed // 500) % 2 == 0:
+            screen.blit(self.continue_surface, self.continue_surface.get_rect(center=(SCREEN_WIDTH // 2, box_rect.bottom - 30)))
+
+        if self.fade_in or self.fade_out:
+            self.fade_surface.set_alpha(self.fade_alpha)
+            screen.blit(self.fade_surface, (0, 0))
+
+    def render(self):
+        """Redraw and present only what changed since the last frame"""
+        self.mark_changes()
+        self.renderer.redraw(self.draw)
+        self.renderer.present()
+
+    def run(self):
+        clock = pygame.time.Clock()
+        dt = clock.tick(60)
+        while self.running:
+            for event in self.renderer.events():
+                self.handle_event(event)
+            self.update(dt)
+            if not self.running:
+                break
+            self.render()
+            # Kerja latar (prefetch ruangan) di sela frame, bukan sebelum cutscene dimulai
+            if self.background_step and not self.background_step():
+                self.background_step = None
+            if self.animating:
+                # Teks dan fade dihitung per frame, jadi tetap 60 FPS
+                timeout = 1000 // 60
+            else:
+                # Menunggu SPASI: bangun untuk kedipan indikator atau parallax
+                timeout = min(IDLE_TIMEOUT, 500 - self.time_passed % 500)
+            dt = self.renderer.wait(clock, 60, timeout)
+
+def run_cutscene(script, background_step=None):
+    """Open the cutscene window and play script until it ends or ESC is pressed"""
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    pygame.display.set_caption(script["caption"])
+    CutscenePlayer(script, screen, background_step).run()
@@ -1,5 +1,6 @@
 import pygame
 import sys
+from game.utils.asset_loader import load_background
 
 def run_cutscene_intro():
     pygame.init()
@@ -10,8 +11,7 @@ def run_cutscene_intro():
     pygame.display.set_caption("Whitehouse Heist - Intro")
 
     # Load asset
-    background = pygame.image.load("game/assets/background/cut_scene_intro.png")
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+    background = load_background("game/assets/background/cut_scene_intro.png", (WIDTH, HEIGHT))
 
     # Font
     font_path = "game/assets/font/Orbitron/static/Orbitron-Black.ttf"
@@ -1,5 +1,6 @@
 import pygame
 import sys
+from game.utils.asset_loader import load_background
 
 def run_cutscene_walkin():
     pygame.init()
@@ -10,8 +11,7 @@ def run_cutscene_walkin():
     pygame.display.set_caption("Whitehouse Heist - Shadow Approaches")
 
     # Load background
-    background = pygame.image.load("game/assets/background/cut_scene_walkin3.png")
-    background = pygame.transform.scale(background, (WIDTH, HEIGHT))
+    background = load_background("game/assets/background/cut_scene_walkin3.png", (WIDTH, HEIGHT))
 
     # Load sprite sheet
     sprite_sheet = pygame.image.load("game/assets/sprite/thief.png").convert_alpha()
@@ -2,9 +2,13 @@ import pygame
 import math
 import random
 from game.utils.constants import *
+from game.utils.asset_loader import load_sound
+from game.utils.vision import draw_vision_cone
+from game.utils.text import get_font, render_text
+from game.utils.profiler import profiler
 
 class Guard:
-    def __init__(self, x, y, guard_type, patrol_route, frames, guard_data, colliders):
+    def __init__(self, x, y, guard_type, patrol_route, frames, guard_data, collision_grid):
         # Atribut posisi dan tampilan (public)
         self.x = x
         self.y = y
@@ -26,12 +30,13 @@ class Guard:
         self._alert_threshold = 70  # Protected - batas untuk beralih ke chase
         self._suspicion_threshold = 30  # Protected - batas untuk beralih ke alert
         self._hearing_range = 150  # Protected - jangkauan pendengaran
+        self._fov = 60  # Protected - sudut pandang (derajat)
         self._sound_alert_increase = 20  # Protected - peningkatan kewaspadaan dari suara
         
         # Atribut public yang tetap bisa diakses langsung
         self.width = 24 * SCALE
         self.height = 32 * SCALE
-        self.colliders = colliders
+        self.collision_grid = collision_grid
         
         # Rute patroli
         self.patrol_route = patrol_route
@@ -70,9 +75,16 @@ class Guard:
         self.__backup_call_timer = 0  # Private
         self.__backup_call_cooldown = 5000  # Private
         
-        # Variabel untuk pathfinding sederhana
+        # Variabel untuk pathfinding
+        self.pathfinder = None  # GridPathfinder ruangan, dipasang oleh BaseRoom
+        self.flow_field = None  # FlowField ke arah player, dipakai bersama saat chase
+        self.line_of_sight = None  # LineOfSightTable ruangan
+        self.noise_field = None  # NoiseField ruangan, suara player yang merambat lewat grid
+        self.perception_arrays = None  # GuardArrays ruangan; baris perception_index milik guard ini
+        self.perception_index = 0
         self.path = []
         self.path_index = 0
+        self.path_goal_cell = None
         self.path_recalculate_timer = 0
         self.path_recalculate_interval = 500
         self.stuck_timer = 0
@@ -90,7 +102,7 @@ class Guard:
         self.alert_sound_played = False
         self.alert_sound_channel = None
         try:
-            self.alert_sound = pygame.mixer.Sound("game/assets/sound/alert.wav")
+            self.alert_sound = load_sound("game/assets/sound/alert.wav")
             self.alert_sound.set_volume(0.7)
         except pygame.error as e:
             print(f"Tidak dapat memuat file suara alert: {e}")
@@ -104,6 +116,14 @@ class Guard:
         """Getter untuk jangkauan penglihatan"""
         return self.__vision_range
     
+    def get_hearing_range(self):
+        """Getter untuk jangkauan pendengaran"""
+        return self._hearing_range
+    
+    def get_fov(self):
+        """Getter untuk sudut pandang (derajat)"""
+        return self._fov
+    
     def get_vision_color(self):
         """Getter untuk warna vision cone"""
         return self.__vision_color
@@ -151,6 +171,8 @@ class Guard:
         """Setter untuk status guard dengan validasi"""
         valid_states = ["patrol", "alert", "chase", "search", "return"]
         if new_state in valid_states:
+            if new_state != self.__state:
+                self.path = []  # Path lama milik status sebelumnya
             self.__state = new_state
     
     def reset_alert_timer(self):
@@ -209,36 +231,41 @@ class Guard:
         # Periksa gerakan horizontal
         if dx != 0:
             next_rect = self.get_rect().move(dx, 0)
-            if not any(next_rect.colliderect(c) for c in self.colliders):
+            if not self.collision_grid.collides_rect(next_rect):
                 self.x += dx
             else:
                 up_rect = self.get_rect().move(dx, -5)
                 down_rect = self.get_rect().move(dx, 5)
                 
-                if not any(up_rect.colliderect(c) for c in self.colliders):
+                if not self.collision_grid.collides_rect(up_rect):
                     self.x += dx
                     self.y -= 5
-                elif not any(down_rect.colliderect(c) for c in self.colliders):
+                elif not self.collision_grid.collides_rect(down_rect):
                     self.x += dx
                     self.y += 5
 
         # Periksa gerakan vertikal
         if dy != 0:
             next_rect = self.get_rect().move(0, dy)
-            if not any(next_rect.colliderect(c) for c in self.colliders):
+            if not self.collision_grid.collides_rect(next_rect):
                 self.y += dy
             else:
                 left_rect = self.get_rect().move(-5, dy)
                 right_rect = self.get_rect().move(5, dy)
                 
-                if not any(left_rect.colliderect(c) for c in self.colliders):
+                if not self.collision_grid.collides_rect(left_rect):
                     self.x -= 5
                     self.y += dy
-                elif not any(right_rect.colliderect(c) for c in self.colliders):
+                elif not self.collision_grid.collides_rect(right_rect):
                     self.x += 5
                     self.y += dy
 
     def update(self, dt, player=None, guards=None, hiding_spots=None):
+        self.update_movement(dt, player)
+        self.update_awareness(dt, player, guards, hiding_spots)
+    
+    def update_movement(self, dt, player=None):
+        """Movement half of update: stuck detection and the state machine"""
         # Deteksi jika penjaga terjebak
         current_pos = (self.x, self.y)
         if self.__state == "chase":
@@ -275,7 +302,16 @@ class Guard:
         # Jika state berubah dari chase ke state lain, hentikan suara alert
         if previous_state == "chase" and self.__state != "chase":
             self.stop_alert_sound()
-            
+        
+        if self.perception_arrays is not None:
+            self.perception_arrays.write(self)
+    
+    def update_awareness(self, dt, player=None, guards=None, hiding_spots=None, context=None):
+        """
+        Awareness half of update: player detection, emotes, animation and
+        alert decay. context is the room's PerceptionContext for this frame;
+        it carries the hidden flag and this guard's batched senses.
+        """
         # Update emote timer
         if self.show_emote:
             self.emote_timer += dt
@@ -286,15 +322,20 @@ class Guard:
     
         # Cek deteksi pemain jika pemain ada
         if player:
-            player_is_hidden = False
-            if hiding_spots:
-                for spot in hiding_spots:
-                    if spot.contains_player(player):
-                        player_is_hidden = True
-                        break
+            perception = None
+            if context is not None:
+                player_is_hidden = context.hidden
+                perception = context.senses.get(self)
+            else:
+                player_is_hidden = False
+                if hiding_spots:
+                    for spot in hiding_spots:
+                        if spot.contains_player(player):
+                            player_is_hidden = True
+                            break
         
             if not player_is_hidden:
-                self.check_player_detection(player, dt)
+                self.check_player_detection(player, dt, perception)
             
                 if self.__alert_level >= self._alert_threshold and self.__state == "chase":
                     self.show_emote = True
@@ -416,7 +457,7 @@ class Guard:
             offset_y = math.sin(rad) * TILE_SIZE
             
             test_rect = pygame.Rect(target_x + offset_x - 10, target_y + offset_y - 10, 20, 20)
-            if not any(test_rect.colliderect(c) for c in self.colliders):
+            if not self.collision_grid.collides_rect(test_rect):
                 potential_points.append((target_x + offset_x, target_y + offset_y))
         
         if potential_points:
@@ -426,6 +467,64 @@ class Guard:
         
         return [(start_x, start_y)]
             
+    def plan_path(self, target_x, target_y):
+        guard_center_x = self.x + self.width // 2
+        guard_center_y = self.y + self.height // 2
+        
+        # A* di grid tile ruangan, fallback ke probing lama jika tidak ada path
+        if self.pathfinder is not None:
+            if self.pathfinder.segment_clear((guard_center_x, guard_center_y), (target_x, target_y)):
+                return [(target_x, target_y)]
+            path = self.pathfinder.find_path((guard_center_x, guard_center_y), (target_x, target_y))
+            if path:
+                return path
+        elif not self.collision_grid.segment_blocked(guard_center_x, guard_center_y, target_x, target_y):
+            return [(target_x, target_y)]
+        
+        return self.find_path_around_obstacle(guard_center_x, guard_center_y, target_x, target_y)
+    
+    def follow_path(self, target_x, target_y, speed, dt):
+        """
+        Walk towards the target along a planned path. The path is replanned
+        when the target moves to another tile or every path_recalculate_interval.
+        Returns True once the end of the path is reached.
+        """
+        goal_cell = (int(target_x // TILE_SIZE), int(target_y // TILE_SIZE))
+        self.path_recalculate_timer += dt
+        if (self.path_recalculate_timer > self.path_recalculate_interval or not self.path
+                or goal_cell != self.path_goal_cell):
+            self.path = self.plan_path(target_x, target_y)
+            self.path_index = 0
+            self.path_goal_cell = goal_cell
+            self.path_recalculate_timer = 0
+        
+        if self.path and self.path_index < len(self.path):
+            waypoint_x, waypoint_y = self.path[self.path_index]
+            
+            path_point_distance = self.step_towards(waypoint_x, waypoint_y, speed)
+            
+            if path_point_distance < 10:
+                self.path_index += 1
+                if self.path_index >= len(self.path):
+                    self.path = []
+                    return True
+        return False
+    
+    def step_towards(self, target_x, target_y, speed):
+        """Move one step towards a point and face it; returns the distance before moving"""
+        dx = target_x - (self.x + self.width // 2)
+        dy = target_y - (self.y + self.height // 2)
+        distance = (dx**2 + dy**2)**0.5
+        
+        if distance > 0:
+            if abs(dx) > abs(dy):
+                self.direction = 'right' if dx > 0 else 'left'
+            else:
+                self.direction = 'down' if dy > 0 else 'up'
+            
+            self.move(dx / distance * speed, dy / distance * speed)
+        return distance
+            
     def update_chase(self, dt, player):
         if not player or self.__alert_level < self._suspicion_threshold:
             self.set_state("search")
@@ -445,55 +544,18 @@ class Guard:
         if distance < 20:
             return
         
-        self.path_recalculate_timer += dt
-        if self.path_recalculate_timer > self.path_recalculate_interval or not self.path:
-            guard_center_x = self.x + self.width // 2
-            guard_center_y = self.y + self.height // 2
-            
-            direct_path_blocked = False
-            for collider in self.colliders:
-                if collider.clipline(guard_center_x, guard_center_y, 
-                                    self.last_known_player_pos[0], self.last_known_player_pos[1]):
-                    direct_path_blocked = True
-                    break
-            
-            if direct_path_blocked:
-                self.path = self.find_path_around_obstacle(
-                    guard_center_x, guard_center_y,
-                    self.last_known_player_pos[0], self.last_known_player_pos[1]
-                )
-            else:
-                self.path = [self.last_known_player_pos]
-            
-            self.path_index = 0
-            self.path_recalculate_timer = 0
-            
-        if self.path and self.path_index < len(self.path):
-            target_x, target_y = self.path[self.path_index]
-            
-            dx = target_x - (self.x + self.width // 2)
-            dy = target_y - (self.y + self.height // 2)
-            path_point_distance = (dx**2 + dy**2)**0.5
-            
-            if path_point_distance < 10:
-                self.path_index += 1
-                if self.path_index >= len(self.path):
-                    self.path = []
-                    return
-            
-            if path_point_distance > 0:
-                dir_x = dx / path_point_distance
-                dir_y = dy / path_point_distance
-                
-                if abs(dx) > abs(dy):
-                    self.direction = 'right' if dx > 0 else 'left'
-                else:
-                    self.direction = 'down' if dy > 0 else 'up'
-                
-                chase_speed = self.__speed * 2.2
-                move_x = dir_x * chase_speed
-                move_y = dir_y * chase_speed
-                self.move(move_x, move_y)
+        chase_speed = self.__speed * 2.2
+        
+        # Flow field ruangan sudah menghitung langkah ke player untuk semua guard
+        if self.flow_field is not None:
+            waypoint = self.flow_field.next_step((self.x + self.width // 2, self.y + self.height // 2),
+                                                 self.last_known_player_pos)
+            if waypoint is not None:
+                self.path = []
+                self.step_towards(waypoint[0], waypoint[1], chase_speed)
+                return
+        
+        self.follow_path(self.last_known_player_pos[0], self.last_known_player_pos[1], chase_speed, dt)
             
     def update_search(self, dt):
         self.__search_timer += dt
@@ -518,6 +580,7 @@ class Guard:
             self.is_waiting = True
             self.wait_timer = 0
             self.wait_duration = 1000
+            self.path = []
             return
             
         if self.is_waiting:
@@ -527,18 +590,13 @@ class Guard:
             return
             
         if distance > 0:
-            dir_x = dx / distance
-            dir_y = dy / distance
-            
-            if abs(dx) > abs(dy):
-                self.direction = 'right' if dx > 0 else 'left'
-            else:
-                self.direction = 'down' if dy > 0 else 'up'
-            
             search_speed = self.__speed * 1.2
-            move_x = dir_x * search_speed
-            move_y = dir_y * search_speed
-            self.move(move_x, move_y)
+            if self.follow_path(target_x, target_y, search_speed, dt):
+                # Titik pencarian di dalam furnitur: cukup sampai sedekat mungkin
+                self.__current_search_point = (self.__current_search_point + 1) % len(self.__search_points)
+                self.is_waiting = True
+                self.wait_timer = 0
+                self.wait_duration = 1000
             
     def find_closest_patrol_point(self):
         min_distance = float('inf')
@@ -572,24 +630,19 @@ class Guard:
             self.return_point = None
             self.is_waiting = True
             self.wait_timer = 0
+            self.path = []
             return
             
         if distance > 0:
-            dir_x = dx / distance
-            dir_y = dy / distance
-            
-            if abs(dx) > abs(dy):
-                self.direction = 'right' if dx > 0 else 'left'
-            else:
-                self.direction = 'down' if dy > 0 else 'up'
-            
-            move_x = dir_x * self.__speed
-            move_y = dir_y * self.__speed
-            self.move(move_x, move_y)
+            self.follow_path(target_x, target_y, self.__speed, dt)
             
-    def check_player_detection(self, player, dt):
-        can_see = self.can_see_player(player)
-        can_hear = self.can_hear_player(player)
+    def check_player_detection(self, player, dt, perception=None):
+        if perception is None:
+            can_see = self.can_see_player(player)
+            can_hear = self.can_hear_player(player)
+        else:
+            in_view, can_hear = perception
+            can_see = in_view and self.has_line_of_sight(player)
         
         if can_see:
             player_center_x = player.x + player.width // 2
@@ -666,25 +719,28 @@ class Guard:
         angle_diff = abs(angle_to_player - guard_angle)
         angle_diff = min(angle_diff, 2 * math.pi - angle_diff)
         
-        fov_rad = math.radians(60) / 2
+        fov_rad = math.radians(self._fov) / 2
         
         if angle_diff <= fov_rad:
-            segments = 10
-            for i in range(1, segments + 1):
-                segment_x = guard_center_x + (dx * i / segments)
-                segment_y = guard_center_y + (dy * i / segments)
-                
-                segment_rect = pygame.Rect(segment_x - 2, segment_y - 2, 4, 4)
-                
-                for collider in self.colliders:
-                    if segment_rect.colliderect(collider):
-                        return False
-                        
-            return True
+            return self.has_line_of_sight(player)
             
         return False
+    
+    def has_line_of_sight(self, player):
+        player_center_x = player.x + player.width // 2
+        player_center_y = player.y + player.height // 2
+        guard_center_x = self.x + self.width // 2
+        guard_center_y = self.y + self.height // 2
+        
+        if self.line_of_sight is not None:
+            return self.line_of_sight.is_visible(guard_center_x, guard_center_y, player_center_x, player_center_y)
+        return not self.collision_grid.segment_blocked(guard_center_x, guard_center_y, player_center_x, player_center_y)
         
     def can_hear_player(self, player):
+        if self.noise_field is not None:
+            return self.noise_field.loudness_at((self.x + self.width // 2, self.y + self.height // 2),
+                                                self._hearing_range) > 0
+        
         player_center_x = player.x + player.width // 2
         player_center_y = player.y + player.height // 2
         guard_center_x = self.x + self.width // 2
@@ -730,7 +786,8 @@ class Guard:
                             guard.reset_alert_timer()
 
     def draw(self, surface):
-        self.draw_vision_cone(surface)
+        with profiler.measure("draw_cones"):
+            self.draw_vision_cone(surface)
         
         frame = self.frames[self.direction][self.frame_index]
         surface.blit(frame, (self.x, self.y))
@@ -739,11 +796,11 @@ class Guard:
             emote_x = self.x + self.width + 5
             emote_y = self.y - 10
         
-            font = pygame.font.SysFont(None, 24)
+            font = get_font(24)
             if self.emote_type == "alert":
-                emote_text = font.render("!!", True, (255, 0, 0))
+                emote_text = render_text(font, "!!", (255, 0, 0))
             elif self.emote_type == "confused":
-                emote_text = font.render("??", True, (255, 255, 0))
+                emote_text = render_text(font, "??", (255, 255, 0))
         
             surface.blit(emote_text, (emote_x, emote_y))
     
@@ -770,27 +827,6 @@ class Guard:
         center_x = self.x + self.width // 2
         center_y = self.y + self.height // 2
         
-        if self.direction == 'up':
-            dir_x, dir_y = 0, -1
-        elif self.direction == 'down':
-            dir_x, dir_y = 0, 1
-        elif self.direction == 'left':
-            dir_x, dir_y = -1, 0
-        else:
-            dir_x, dir_y = 1, 0
-        
-        vision_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        angle = math.atan2(dir_y, dir_x)
-        fov_rad = math.radians(60)
-        
-        points = [(center_x, center_y)]
-        for i in range(21):
-            a = angle - fov_rad/2 + (fov_rad * i / 20)
-            end_x = center_x + math.cos(a) * self.__vision_range
-            end_y = center_y + math.sin(a) * self.__vision_range
-            points.append((end_x, end_y))
-        
         if self.__state == "patrol":
             color = self.__vision_color + (30,)
         elif self.__state == "alert":
@@ -800,8 +836,7 @@ class Guard:
         else:
             color = (255, 165, 0, 40)
             
-        pygame.draw.polygon(vision_surface, color, points)
-        surface.blit(vision_surface, (0, 0))
+        draw_vision_cone(surface, center_x, center_y, self.direction, self.__vision_range, self._fov, color)
 
     # Compatibility properties untuk backward compatibility
     @property
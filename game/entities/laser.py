@@ -1,6 +1,34 @@
 import pygame
 import math
 
+# Cache sprite glow: (dx, dy, color, thickness) -> (surface, offset)
+_glow_cache = {}
+
+def get_glow_sprite(dx, dy, color, thickness):
+    """
+    Return a cached glow sprite for a laser spanning (dx, dy) pixels.
+    Lasers with the same length and direction (static or moving) share one sprite.
+    """
+    key = (dx, dy, color, thickness)
+    cached = _glow_cache.get(key)
+    if cached is not None:
+        return cached
+
+    # Padding untuk garis glow paling tebal
+    pad = thickness + 4
+    start = (pad - min(dx, 0), pad - min(dy, 0))
+    end = (start[0] + dx, start[1] + dy)
+    glow_surface = pygame.Surface((abs(dx) + pad * 2 + 1, abs(dy) + pad * 2 + 1), pygame.SRCALPHA)
+    for i in range(3):
+        glow_thickness = thickness + i*2
+        alpha = 100 - i*30
+        glow_color = color + (alpha,)
+        pygame.draw.line(glow_surface, glow_color, start, end, glow_thickness)
+
+    cached = (glow_surface, (-start[0], -start[1]))
+    _glow_cache[key] = cached
+    return cached
+
 class Laser:
     def __init__(self, x1, y1, x2, y2, color=(255, 0, 0), thickness=2, blink_speed=500):
         self.x1 = x1
@@ -36,7 +64,7 @@ class Laser:
             
         return pygame.Rect(left, top, width, height)
     
-    def update(self, dt, player):
+    def update(self, dt, player, context=None):
         self.timer += dt
         
         # Blink effect
@@ -53,9 +81,9 @@ class Laser:
         # Cek tabrakan dengan player jika laser aktif
         if self.active and not self.triggered and player:
             # Deteksi tabrakan dengan rect sederhana
-            if self.rect.colliderect(player.get_rect()):
+            player_rect = context.rect if context is not None else player.get_rect()
+            if self.rect.colliderect(player_rect):
                 # Deteksi tabrakan yang lebih akurat dengan garis
-                player_rect = player.get_rect()
                 player_lines = [
                     (player_rect.left, player_rect.top, player_rect.right, player_rect.top),
                     (player_rect.right, player_rect.top, player_rect.right, player_rect.bottom),
@@ -100,12 +128,8 @@ class Laser:
             pygame.draw.circle(surface, self.color, (self.x1, self.y1), self.thickness + 2)
             pygame.draw.circle(surface, self.color, (self.x2, self.y2), self.thickness + 2)
             
-            # Tambahkan efek glow
-            glow_surface = pygame.Surface((surface.get_width(), surface.get_height()), pygame.SRCALPHA)
-            for i in range(3):
-                thickness = self.thickness + i*2
-                alpha = 100 - i*30
-                glow_color = self.color + (alpha,)
-                pygame.draw.line(glow_surface, glow_color, (self.x1, self.y1), (self.x2, self.y2), thickness)
-            
-            surface.blit(glow_surface, (0, 0), special_flags=pygame.BLEND_ADD)
+            # Tambahkan efek glow dari sprite yang sudah di-cache
+            x1, y1 = int(self.x1), int(self.y1)
+            dx, dy = int(self.x2) - x1, int(self.y2) - y1
+            glow_surface, (offset_x, offset_y) = get_glow_sprite(dx, dy, self.color, self.thickness)
+            surface.blit(glow_surface, (x1 + offset_x, y1 + offset_y), special_flags=pygame.BLEND_ADD)
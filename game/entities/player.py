@@ -1,6 +1,8 @@
 import pygame
 from game.utils.constants import *
+from game.utils.shared import shared_across_resets
 
+@shared_across_resets
 class Player:
     def __init__(self, x, y, frames, crouch_frames):
         self.x = x
@@ -31,11 +33,11 @@ class Player:
             # Regular collider
             return pygame.Rect(self.x + 10, self.y + self.height - 20, self.width - 20, 18)
 
-    def move(self, dx, dy, colliders):
+    def move(self, dx, dy, collision_grid):
         # Periksa gerakan horizontal
         if dx != 0:
             next_rect = self.get_rect().move(dx, 0)
-            if not any(next_rect.colliderect(c) for c in colliders):
+            if not collision_grid.collides_rect(next_rect):
                 self.x += dx
             else:
                 # Coba geser sedikit ke atas atau ke bawah untuk menghindari nyangkut
@@ -43,14 +45,14 @@ class Player:
                 
                 # Coba geser ke atas
                 up_rect = self.get_rect().move(dx, -slide_amount)
-                if not any(up_rect.colliderect(c) for c in colliders):
+                if not collision_grid.collides_rect(up_rect):
                     self.x += dx
                     self.y -= slide_amount
                     return
                 
                 # Coba geser ke bawah
                 down_rect = self.get_rect().move(dx, slide_amount)
-                if not any(down_rect.colliderect(c) for c in colliders):
+                if not collision_grid.collides_rect(down_rect):
                     self.x += dx
                     self.y += slide_amount
                     return
@@ -58,7 +60,7 @@ class Player:
         # Periksa gerakan vertikal
         if dy != 0:
             next_rect = self.get_rect().move(0, dy)
-            if not any(next_rect.colliderect(c) for c in colliders):
+            if not collision_grid.collides_rect(next_rect):
                 self.y += dy
             else:
                 # Coba geser sedikit ke kiri atau ke kanan untuk menghindari nyangkut
@@ -66,14 +68,14 @@ class Player:
                 
                 # Coba geser ke kiri
                 left_rect = self.get_rect().move(-slide_amount, dy)
-                if not any(left_rect.colliderect(c) for c in colliders):
+                if not collision_grid.collides_rect(left_rect):
                     self.x -= slide_amount
                     self.y += dy
                     return
                 
                 # Coba geser ke kanan
                 right_rect = self.get_rect().move(slide_amount, dy)
-                if not any(right_rect.colliderect(c) for c in colliders):
+                if not collision_grid.collides_rect(right_rect):
                     self.x += slide_amount
                     self.y += dy
                     return
@@ -90,7 +92,7 @@ class Player:
                 self.speed = WALK_SPEED
             self.stealth_bonus = 0
 
-    def update(self, dt, mouse_held, mouse_pos, colliders):
+    def update(self, dt, mouse_held, mouse_pos, collision_grid):
         # Update stamina
         if self.speed >= RUN_SPEED and mouse_held:
             # Kurangi stamina saat berlari
@@ -122,7 +124,7 @@ class Player:
                 
                 move_x = dir_x * self.speed
                 move_y = dir_y * self.speed
-                self.move(move_x, move_y, colliders)
+                self.move(move_x, move_y, collision_grid)
 
                 if abs(dx) > abs(dy):
                     self.direction = 'right' if dx > 0 else 'left'
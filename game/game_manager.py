@@ -1,7 +1,11 @@
+import os
+import random
 import pygame
 from game.utils.constants import *
 from game.entities.player import Player
-from game.utils.asset_loader import get_frames
+from game.utils.asset_loader import get_frames, load_image, pack_sprite, evict_assets, start_asset_log, stop_asset_log, silence_sounds
+from game.utils.text import get_font, render_text
+from game.utils.profiler import profiler
 from game.maps.room1 import Room1
 from game.maps.room2 import Room2
 from game.maps.room3 import Room3
@@ -11,10 +15,23 @@ from game.cutscenes.room2_intro import run_cutscene_room2
 from game.cutscenes.room3_intro import run_cutscene_room3
 from game.cutscenes.room4_intro import run_cutscene_room4
 from game.cutscenes.intro_mission import run_cutscene_intro_mission
+from game.utils.shared import shared_across_resets
 
+@shared_across_resets
 class GameManager:
-    def __init__(self):
+    def __init__(self, headless=False, seed=None):
+        # Headless mode: no window, no audio, no cutscenes (simulation and CI)
+        self.headless = headless
+        if headless:
+            os.environ["SDL_VIDEODRIVER"] = "dummy"
+            os.environ["SDL_AUDIODRIVER"] = "dummy"
+        if seed is not None:
+            random.seed(seed)
+        
         pygame.init()
+        if headless:
+            # Tanpa audio: jangan baca atau buat file suara di source tree
+            silence_sounds()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("Stealth Game Mansion with Thief and Guards")
         self.clock = pygame.time.Clock()
@@ -26,24 +43,34 @@ class GameManager:
         self.game_completed = False
         self.score = 0
         self.mouse_held = False
+        self.mouse_button = None
         self.mouse_pos = (0, 0)
         
+        # Font for UI
+        self.font = get_font(24)
+        self.big_font = get_font(72)
+        
         # Load player
         self.load_player()
         
-        # Initialize rooms
+        # Initialize rooms (built lazily on first entry)
         self.rooms = []
         self.current_room_index = 0
+        self.resident_rooms = []  # Room indices with render caches, most recent last
         
         # Create rooms
         self.setup_rooms()
-        self.current_room = self.rooms[self.current_room_index]
+        self.current_room = self.get_room(self.current_room_index)
+        self.mark_room_resident(self.current_room_index)
+        self.prefetch_next_room()
         
         # Load and play in-game background music
         self.load_background_music()
     
     def load_background_music(self):
         """Load and play in-game background music"""
+        if self.headless:
+            return
         try:
             pygame.mixer.music.load("game/assets/sound/game.wav")
             pygame.mixer.music.set_volume(0.3)  # Set volume ke 30%
@@ -53,7 +80,7 @@ class GameManager:
     
     def load_player(self):
         # Load player sprite
-        sprite_sheet = pygame.image.load("game/assets/player_img/thief.png").convert_alpha()
+        sprite_sheet = load_image("game/assets/player_img/thief.png")
         FRAME_WIDTH, FRAME_HEIGHT = 24, 32
         frames = {
             'down': get_frames(sprite_sheet, 2, 3, FRAME_WIDTH, FRAME_HEIGHT),
@@ -72,37 +99,118 @@ class GameManager:
                 crouch_frame = pygame.transform.scale(crouch_frame, (frame.get_width(), new_height))
                 final_frame = pygame.Surface((frame.get_width(), frame.get_height()), pygame.SRCALPHA)
                 final_frame.blit(crouch_frame, (0, frame.get_height() - new_height))
-                crouch_frames[direction].append(final_frame)
+                crouch_frames[direction].append(pack_sprite(final_frame))
         
         # Initialize player
         self.player = Player(9 * TILE_SIZE, 11 * TILE_SIZE, frames, crouch_frames)
         self.player.direction = 'up'
     
     def setup_rooms(self):
-
-        # Create rooms
+        # Room classes in play order; instances are created by get_room
+        self.room_classes = [Room1, Room2, Room3, Room4]
+        # More rooms can be added here
         
-        self.rooms.append(Room1(self))
-        self.rooms.append(Room2(self))
-        self.rooms.append(Room3(self))
-        self.rooms.append(Room4(self))
+        self.rooms = [None] * len(self.room_classes)
+        self.room_assets = [set() for _ in self.room_classes]  # Asset paths each room loaded
+        self.suspended_rooms = [None] * len(self.room_classes)  # BaseRoom.suspend() of dropped rooms
+        self.room_builds = {}  # room index -> build_room() generator that is still running
+    
+    def get_room(self, room_index):
+        """
+        Return the room at room_index, building it on first use or after
+        it was dropped (restoring the state it had when it was dropped).
+        A prefetch that is still running is finished now.
+        """
+        if self.rooms[room_index] is None:
+            for _ in self.room_builds.pop(room_index, None) or self.build_room(room_index):
+                pass
+        return self.rooms[room_index]
+    
+    def build_room(self, room_index):
+        """
+        Generator building room_index one BaseRoom.build_steps() phase per
+        next(), recording the asset paths it loads. Yields True after each
+        phase; the room is stored in self.rooms when it is done.
+        """
+        room = self.room_classes[room_index](self, deferred=True)
+        self.room_assets[room_index] = set()
+        steps = room.build_steps()
+        while True:
+            start_asset_log()
+            done = next(steps, False) is False
+            self.room_assets[room_index] |= stop_asset_log()
+            if done:
+                break
+            yield True
         
- 
-        # More rooms can be added here
+        if self.suspended_rooms[room_index] is not None:
+            room.resume(self.suspended_rooms[room_index])
+            self.suspended_rooms[room_index] = None
+        self.rooms[room_index] = room
+    
+    def prefetch_next_room(self):
+        """
+        Start building the next room in sequence. The build runs one step
+        at a time from advance_prefetch(), between cutscene frames and
+        after gameplay updates, so it never stalls a single frame.
+        """
+        next_index = self.current_room_index + 1
+        if (next_index < len(self.rooms) and self.rooms[next_index] is None
+                and next_index not in self.room_builds):
+            self.room_builds[next_index] = self.build_room(next_index)
+    
+    def advance_prefetch(self):
+        """Run one step of a pending room build; returns False when nothing is pending"""
+        for room_index, steps in self.room_builds.items():
+            if not next(steps, False):
+                del self.room_builds[room_index]
+            return True
+        return False
+    
+    def mark_room_resident(self, room_index):
+        """
+        Record room_index as recently used and drop every built room that
+        is neither among the last MAX_RESIDENT_ROOMS used nor the next
+        room (the prefetch target). A dropped room keeps only its
+        suspend() state and is rebuilt by get_room; assets no built room
+        uses any more are evicted from the shared cache.
+        """
+        if room_index in self.resident_rooms:
+            self.resident_rooms.remove(room_index)
+        self.resident_rooms.append(room_index)
+        del self.resident_rooms[:-MAX_RESIDENT_ROOMS]
+        
+        keep = set(self.resident_rooms) | {room_index + 1}
+        dropped = [i for i in self.room_builds if i not in keep]
+        for i in dropped:
+            del self.room_builds[i]  # Prefetch yang sudah tidak dibutuhkan
+        for i, room in enumerate(self.rooms):
+            if room is not None and i not in keep:
+                self.suspended_rooms[i] = room.suspend()
+                self.rooms[i] = None
+                dropped.append(i)
+        
+        if dropped:
+            still_used = set().union(*(self.room_assets[i] for i, room in enumerate(self.rooms) if room is not None))
+            for path in set().union(*(self.room_assets[i] for i in dropped)) - still_used:
+                evict_assets(path)
     
     def show_room_cutscene(self, room_index):
+        if self.headless:
+            return
+        
         # Pause background music during cutscene
         pygame.mixer.music.pause()
         
-        # Show appropriate cutscene based on room index
+        # Show appropriate cutscene based on room index; prefetch berjalan di sela frame cutscene
         if room_index == 0:
-            run_cutscene_room1()
+            run_cutscene_room1(self.advance_prefetch)
         elif room_index == 1:
-            run_cutscene_room2()
+            run_cutscene_room2(self.advance_prefetch)
         elif room_index == 2:
-            run_cutscene_room3()
+            run_cutscene_room3(self.advance_prefetch)
         elif room_index == 3:
-            run_cutscene_room4()
+            run_cutscene_room4(self.advance_prefetch)
         # Add more cutscenes for additional rooms here
         
         # Resume background music after cutscene
@@ -111,6 +219,8 @@ class GameManager:
     def stop_all_alert_sounds(self):
         """Hentikan semua suara alert dari semua guard di semua ruangan"""
         for room in self.rooms:
+            if room is None:
+                continue
             for guard in room.guards:
                 # Hentikan suara alert jika sedang diputar
                 if hasattr(guard, 'alert_sound_played') and guard.alert_sound_played:
@@ -124,7 +234,7 @@ class GameManager:
     
     def reset_guard_states_in_previous_room(self, previous_room_index):
         """Reset status guard di ruangan sebelumnya ke mode patrol"""
-        if 0 <= previous_room_index < len(self.rooms):
+        if 0 <= previous_room_index < len(self.rooms) and self.rooms[previous_room_index] is not None:
             previous_room = self.rooms[previous_room_index]
             for guard in previous_room.guards:
                 # Reset status guard ke patrol
@@ -155,7 +265,9 @@ class GameManager:
         
         # Change current room
         self.current_room_index = room_index
-        self.current_room = self.rooms[room_index]
+        self.current_room = self.get_room(room_index)
+        self.mark_room_resident(room_index)
+        self.prefetch_next_room()
         
         # Show cutscene for the room
         self.show_room_cutscene(room_index)
@@ -190,11 +302,15 @@ class GameManager:
         # Hentikan semua suara alert
         self.stop_all_alert_sounds()
         
-        # Reset rooms
-        self.rooms = []
-        self.setup_rooms()
+        # Reset rooms in place (assets stay loaded); dropped rooms are rebuilt fresh
+        for room in self.rooms:
+            if room is not None:
+                room.reset()
+        self.suspended_rooms = [None] * len(self.room_classes)
         self.current_room_index = 0
-        self.current_room = self.rooms[self.current_room_index]
+        self.current_room = self.get_room(self.current_room_index)
+        self.mark_room_resident(self.current_room_index)
+        self.prefetch_next_room()
         
         # Reset game variables
         self.game_over = False
@@ -218,11 +334,133 @@ class GameManager:
         # Stop all sound effects (termasuk alert)
         pygame.mixer.stop()
     
-    def run(self):
-        # Font for UI
-        font = pygame.font.SysFont(None, 24)
-        big_font = pygame.font.SysFont(None, 72)
+    def handle_event(self, event):
+        """Apply one input event. Returns False when the game should quit."""
+        if event.type == pygame.QUIT:
+            return False
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return False
+            if event.key == pygame.K_d:
+                self.current_room.show_debug = not self.current_room.show_debug
+            elif event.key == pygame.K_c:
+                # Toggle crouch
+                if self.current_room.player_is_hidden and self.current_room.current_hiding_spot:
+                    # Return player to last position before hiding
+                    if self.current_room.current_hiding_spot.name in self.current_room.last_positions_before_hiding:
+                        saved_x, saved_y = self.current_room.last_positions_before_hiding[self.current_room.current_hiding_spot.name]
+                        self.player.x = saved_x
+                        self.player.y = saved_y
+                        
+                        # Remove saved position after using it
+                        del self.current_room.last_positions_before_hiding[self.current_room.current_hiding_spot.name]
+                    else:
+                        # Fallback if no saved position
+                        exit_x = self.current_room.current_hiding_spot.rect.centerx
+                        exit_y = self.current_room.current_hiding_spot.rect.bottom + 10
+                        
+                        # Move player to exit position
+                        self.player.x = exit_x - self.player.width // 2
+                        self.player.y = exit_y
+                    
+                    # Make sure player is no longer crouching
+                    self.player.is_crouching = False
+                    self.player.stealth_bonus = 0
+                    if self.player.speed <= CROUCH_SPEED:
+                        self.player.speed = WALK_SPEED
+                else:
+                    # Normal toggle crouch behavior
+                    self.player.toggle_crouch()
+                
+                # Update speed based on mouse button
+                if self.mouse_held:
+                    if self.mouse_button == 3:  # Right mouse button
+                        if not self.player.is_crouching and not self.player.is_exhausted:
+                            self.player.speed = RUN_SPEED
+                    else:  # Left mouse button
+                        if not self.player.is_crouching:
+                            self.player.speed = WALK_SPEED
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:
+                if not self.player.is_crouching:
+                    self.player.speed = WALK_SPEED
+                self.mouse_held = True
+                self.mouse_button = 1
+            elif event.button == 3:
+                if not self.player.is_crouching and not self.player.is_exhausted:
+                    self.player.speed = RUN_SPEED
+                self.mouse_held = True
+                self.mouse_button = 3
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button in (1, 3):
+                self.mouse_held = False
+        return True
+    
+    def step(self, dt):
+        """Advance the game by dt milliseconds"""
+        # If game over, reset after a few seconds
+        if self.game_over:
+            self.game_over_timer += dt
+            if self.game_over_timer >= self.game_over_duration:
+                self.reset_game()
+            return
+        
+        # If game completed, only fade out music
+        if self.game_completed:
+            pygame.mixer.music.fadeout(1000)
+            return
         
+        # Frame profiler follows the debug toggle (K_d)
+        profiler.enabled = self.current_room.show_debug
+        profiler.begin_frame()
+        
+        # Update current room
+        self.current_room.update(dt, self.mouse_held, self.mouse_pos)
+        
+        # Lanjutkan prefetch ruangan berikutnya satu langkah per frame
+        with profiler.measure("prefetch"):
+            self.advance_prefetch()
+    
+    def render(self):
+        """Draw the current frame to self.screen"""
+        if self.game_over:
+            # Render game over screen
+            self.screen.fill((0, 0, 0))
+            self.current_room.draw()
+            
+            # Draw game over message
+            game_over_text = render_text(self.big_font, "GAME OVER", (255, 0, 0))
+            text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+            self.screen.blit(game_over_text, text_rect)
+            
+            # Draw score
+            score_text = render_text(self.font, f"Score: {self.score}", (255, 255, 255))
+            self.screen.blit(score_text, (SCREEN_WIDTH//2 - 50, SCREEN_HEIGHT//2 + 50))
+        elif self.game_completed:
+            # Render game completed screen
+            self.screen.fill((0, 0, 0))
+            
+            # Draw completion message
+            complete_text = render_text(self.big_font, "LEVEL COMPLETE!", (0, 255, 0))
+            text_rect = complete_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
+            self.screen.blit(complete_text, text_rect)
+            
+            # Draw score
+            score_text = render_text(self.font, f"Final Score: {self.score}", (255, 255, 255))
+            self.screen.blit(score_text, (SCREEN_WIDTH//2 - 70, SCREEN_HEIGHT//2 + 50))
+            
+            # Draw continue message
+            continue_text = render_text(self.font, "Press ESC to exit", (255, 255, 255))
+            self.screen.blit(continue_text, (SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2 + 100))
+        else:
+            self.screen.fill((0, 0, 0))
+            self.current_room.draw()
+            
+            # Frame-time graph and per-subsystem table
+            if self.current_room.show_debug:
+                profiler.draw(self.screen)
+    
+    def run(self):
         # Game loop
         running = True
         while running:
@@ -231,118 +469,16 @@ class GameManager:
             
             # Handle events
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if not self.handle_event(event):
                     running = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_ESCAPE:
-                        running = False
-                    if event.key == pygame.K_d:
-                        self.current_room.show_debug = not self.current_room.show_debug
-                    elif event.key == pygame.K_c:
-                        # Toggle crouch
-                        if self.current_room.player_is_hidden and self.current_room.current_hiding_spot:
-                            # Return player to last position before hiding
-                            if self.current_room.current_hiding_spot.name in self.current_room.last_positions_before_hiding:
-                                saved_x, saved_y = self.current_room.last_positions_before_hiding[self.current_room.current_hiding_spot.name]
-                                self.player.x = saved_x
-                                self.player.y = saved_y
-                                
-                                # Remove saved position after using it
-                                del self.current_room.last_positions_before_hiding[self.current_room.current_hiding_spot.name]
-                            else:
-                                # Fallback if no saved position
-                                exit_x = self.current_room.current_hiding_spot.rect.centerx
-                                exit_y = self.current_room.current_hiding_spot.rect.bottom + 10
-                                
-                                # Move player to exit position
-                                self.player.x = exit_x - self.player.width // 2
-                                self.player.y = exit_y
-                            
-                            # Make sure player is no longer crouching
-                            self.player.is_crouching = False
-                            self.player.stealth_bonus = 0
-                            if self.player.speed <= CROUCH_SPEED:
-                                self.player.speed = WALK_SPEED
-                        else:
-                            # Normal toggle crouch behavior
-                            self.player.toggle_crouch()
-                        
-                        # Update speed based on mouse button
-                        if self.mouse_held:
-                            if pygame.mouse.get_pressed()[2]:  # Right mouse button
-                                if not self.player.is_crouching and not self.player.is_exhausted:
-                                    self.player.speed = RUN_SPEED
-                            else:  # Left mouse button
-                                if not self.player.is_crouching:
-                                    self.player.speed = WALK_SPEED
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    if event.button == 1:
-                        if not self.player.is_crouching:
-                            self.player.speed = WALK_SPEED
-                        self.mouse_held = True
-                    elif event.button == 3:
-                        if not self.player.is_crouching and not self.player.is_exhausted:
-                            self.player.speed = RUN_SPEED
-                        self.mouse_held = True
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    if event.button in (1, 3):
-                        self.mouse_held = False
-            
-            # If game over, show message and reset after a few seconds
-            if self.game_over:
-                self.game_over_timer += dt
-                if self.game_over_timer >= self.game_over_duration:
-                    self.reset_game()
-                
-                # Render game over screen
-                self.screen.fill((0, 0, 0))
-                self.current_room.draw()
-                
-                # Draw game over message
-                game_over_text = big_font.render("GAME OVER", True, (255, 0, 0))
-                text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                self.screen.blit(game_over_text, text_rect)
-                
-                # Draw score
-                score_text = font.render(f"Score: {self.score}", True, (255, 255, 255))
-                self.screen.blit(score_text, (SCREEN_WIDTH//2 - 50, SCREEN_HEIGHT//2 + 50))
-                
-                pygame.display.flip()
-                continue
-            
-            # If game completed, show victory message
-            if self.game_completed:
-                # Fade out music when game completed
-                pygame.mixer.music.fadeout(1000)
-                
-                # Render game completed screen
-                self.screen.fill((0, 0, 0))
-                
-                # Draw completion message
-                complete_text = big_font.render("LEVEL COMPLETE!", True, (0, 255, 0))
-                text_rect = complete_text.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2))
-                self.screen.blit(complete_text, text_rect)
-                
-                # Draw score
-                score_text = font.render(f"Final Score: {self.score}", True, (255, 255, 255))
-                self.screen.blit(score_text, (SCREEN_WIDTH//2 - 70, SCREEN_HEIGHT//2 + 50))
-                
-                # Draw continue message
-                continue_text = font.render("Press ESC to exit", True, (255, 255, 255))
-                self.screen.blit(continue_text, (SCREEN_WIDTH//2 - 80, SCREEN_HEIGHT//2 + 100))
-                
-                pygame.display.flip()
-                continue
-            
-            # Update current room
-            self.current_room.update(dt, self.mouse_held, self.mouse_pos)
-            
-            # Render
-            self.screen.fill((0, 0, 0))
-            self.current_room.draw()
             
+            self.step(dt)
+            self.render()
             pygame.display.flip()
+            profiler.end_frame()
         
         # Stop music when exiting game
         pygame.mixer.music.stop()
+        # Surface/Sound cache tidak berlaku lagi setelah pygame.quit()
+        evict_assets()
         pygame.quit()
@@ -3,6 +3,16 @@ import math
 import random
 from game.utils.constants import *
 from game.utils.asset_loader import load_and_transform, get_frames
+from game.utils.collision import CollisionGrid
+from game.utils.pathfinding import GridPathfinder, FlowField
+from game.utils.line_of_sight import LineOfSightTable
+from game.utils.noise import NoiseField, BASE_HEARING_RANGE
+from game.utils.particles import ParticleSystem
+from game.utils.item_sprites import SHAPES, sparkle_color, get_key_sprite, get_shape_sprite
+from game.utils.perception import PerceptionContext, GuardArrays, perceive_player
+from game.utils.shared import is_shared
+from game.utils.text import get_font, render_text
+from game.utils.profiler import profiler
 
 class HidingSpot:
     def __init__(self, rect, name=""):
@@ -10,8 +20,9 @@ class HidingSpot:
         self.name = name
         self.occupied = False
     
-    def contains_player(self, player):
-        player_rect = player.get_rect()
+    def contains_player(self, player, player_rect=None):
+        if player_rect is None:
+            player_rect = player.get_rect()
         return self.rect.colliderect(player_rect) and player.is_crouching
 
 class CollectibleItem:
@@ -56,7 +67,7 @@ class CollectibleItem:
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
         
-    def update(self, dt, player=None):
+    def update(self, dt, player=None, context=None):
         # Pulsing animation
         self.pulse_timer += dt * self.pulse_speed
         self.pulse_size = math.sin(self.pulse_timer) * 4
@@ -79,8 +90,11 @@ class CollectibleItem:
         
         # Magnetic effect when player gets close
         if player and not self.collected and not self.is_attracted:
-            player_center_x = player.x + player.width // 2
-            player_center_y = player.y + player.height // 2
+            if context is not None:
+                player_center_x, player_center_y = context.center
+            else:
+                player_center_x = player.x + player.width // 2
+                player_center_y = player.y + player.height // 2
             item_center_x = self.x + self.width // 2
             item_center_y = self.y + self.height // 2
             
@@ -96,8 +110,11 @@ class CollectibleItem:
         if self.is_attracted and player and not self.collected:
             self.attraction_progress = min(1.0, self.attraction_progress + self.attraction_speed * (dt / 16.67))
             
-            player_center_x = player.x + player.width // 2
-            player_center_y = player.y + player.height // 2
+            if context is not None:
+                player_center_x, player_center_y = context.center
+            else:
+                player_center_x = player.x + player.width // 2
+                player_center_y = player.y + player.height // 2
             
             eased_progress = self.ease_in_out_cubic(self.attraction_progress)
             
@@ -130,83 +147,127 @@ class CollectibleItem:
             size_mod = int(self.pulse_size)
             base_size = self.width // 2 + size_mod
             
-            # Base color and sparkle color
-            base_color = self.color
-            sparkle_color = (255, 255, 255)
-            
-            # If sparkling, blend colors
+            # If sparkling, blend toward white
             if self.is_sparkling:
                 sparkle_intensity = min(1.0, self.sparkle_timer / (self.sparkle_duration * 0.5))
                 if self.sparkle_timer > self.sparkle_duration * 0.5:
                     sparkle_intensity = 1.0 - ((self.sparkle_timer - self.sparkle_duration * 0.5) / (self.sparkle_duration * 0.5))
-                
-                r = min(255, int(base_color[0] + (sparkle_color[0] - base_color[0]) * sparkle_intensity))
-                g = min(255, int(base_color[1] + (sparkle_color[1] - base_color[1]) * sparkle_intensity))
-                b = min(255, int(base_color[2] + (sparkle_color[2] - base_color[2]) * sparkle_intensity))
-                
-                current_color = (r, g, b)
+                current_color = sparkle_color(self.color, sparkle_intensity)
             else:
-                current_color = base_color
+                current_color = self.color
             
-            # Draw shape based on type
+            # Sprites are cached per color, size and (quantized) rotation
             if self.item_type == "key":
-                # Draw key (simple shape)
-                key_surface = pygame.Surface((self.width + 10, self.height + 10), pygame.SRCALPHA)
-                pygame.draw.rect(key_surface, current_color, (5, 10, 15, 5))
-                pygame.draw.circle(key_surface, current_color, (15, 7), 7)
-                pygame.draw.circle(key_surface, (0, 0, 0), (15, 7), 3)
-                rotated_key = pygame.transform.rotate(key_surface, self.rotation_angle)
+                rotated_key = get_key_sprite(current_color, self.width, self.height, self.rotation_angle)
                 key_rect = rotated_key.get_rect(center=(center_x, center_y))
                 surface.blit(rotated_key, key_rect.topleft)
-            elif self.shape == "circle":
-                pygame.draw.circle(surface, current_color, (center_x, center_y), base_size)
-                pygame.draw.circle(surface, (255, 255, 255), 
-                                  (center_x - base_size//3, center_y - base_size//3), 
-                                  base_size//4)
-            elif self.shape == "square":
-                pygame.draw.rect(surface, current_color, 
-                               (center_x - base_size, center_y - base_size, 
-                                base_size*2, base_size*2))
-                pygame.draw.circle(surface, (255, 255, 255), 
-                                  (center_x - base_size//2, center_y - base_size//2), 
-                                  base_size//4)
-            elif self.shape == "diamond":
-                points = [
-                    (center_x, center_y - base_size),
-                    (center_x + base_size, center_y),
-                    (center_x, center_y + base_size),
-                    (center_x - base_size, center_y)
-                ]
-                pygame.draw.polygon(surface, current_color, points)
-                pygame.draw.circle(surface, (255, 255, 255), 
-                                  (center_x - base_size//3, center_y - base_size//3), 
-                                  base_size//4)
-            elif self.shape == "triangle":
-                points = [
-                    (center_x, center_y - base_size),
-                    (center_x + base_size, center_y + base_size),
-                    (center_x - base_size, center_y + base_size)
-                ]
-                pygame.draw.polygon(surface, current_color, points)
-                pygame.draw.circle(surface, (255, 255, 255), 
-                                  (center_x - base_size//3, center_y - base_size//3), 
-                                  base_size//4)
-            elif self.shape == "star":
-                # Draw a simple star
-                points = []
-                for i in range(10):
-                    angle = math.pi/2 + (2*math.pi * i / 10)
-                    radius = base_size if i % 2 == 0 else base_size/2
-                    x = center_x + radius * math.cos(angle)
-                    y = center_y + radius * math.sin(angle)
-                    points.append((x, y))
-                pygame.draw.polygon(surface, current_color, points)
-                pygame.draw.circle(surface, (255, 255, 255), 
-                                  (center_x - base_size//3, center_y - base_size//3), 
-                                  base_size//4)
+            elif self.shape in SHAPES:
+                sprite = get_shape_sprite(self.shape, current_color, base_size)
+                surface.blit(sprite, (center_x - base_size - 1, center_y - base_size - 1))
+
+def _is_entity(value):
+    """Game objects (guards, items, lasers, ...) whose attributes are room state"""
+    module = type(value).__module__
+    return module.startswith("game.") and not module.startswith("game.utils.")
+
+def _capture(value):
+    # Salin list/dict/Rect dan atribut entity; aset dan subsistem (is_shared) tetap dipakai bersama
+    if is_shared(value):
+        return value
+    if isinstance(value, list):
+        return [_capture(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _capture(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_capture(v) for v in value)
+    if isinstance(value, pygame.Rect):
+        return value.copy()
+    if _is_entity(value):
+        return _EntityState(value, {k: _capture(v) for k, v in vars(value).items()})
+    return value
+
+def _restore(value):
+    if isinstance(value, list):
+        return [_restore(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _restore(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_restore(v) for v in value)
+    if isinstance(value, pygame.Rect):
+        return value.copy()
+    if isinstance(value, _EntityState):
+        value.entity.__dict__.clear()
+        value.entity.__dict__.update({k: _restore(v) for k, v in value.state.items()})
+        return value.entity
+    return value
+
+class _EntityState:
+    def __init__(self, entity, state):
+        self.entity = entity
+        self.state = state
+
+# Penanda aset/subsistem di state ruangan yang ditangguhkan; diisi dari ruangan baru
+_ASSET = object()
+
+def _detach(value):
+    # Seperti _capture, tapi tanpa referensi ke aset, subsistem atau entity lama,
+    # supaya state ruangan yang dilepas tidak menahan surface di memori
+    if is_shared(value):
+        return _ASSET
+    if isinstance(value, list):
+        return [_detach(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _detach(v) for k, v in value.items()}
+    if isinstance(value, tuple):
+        return tuple(_detach(v) for v in value)
+    if isinstance(value, pygame.Rect):
+        return value.copy()
+    if _is_entity(value):
+        return _DetachedEntity(type(value), id(value), {k: _detach(v) for k, v in vars(value).items()})
+    return value
+
+def _attach(value, fresh, entities, claimed):
+    # Kebalikan _detach: aset diambil dari nilai di posisi yang sama pada ruangan baru
+    if value is _ASSET:
+        return fresh
+    if isinstance(value, list):
+        fresh = fresh if isinstance(fresh, list) else []
+        return [_attach(v, fresh[i] if i < len(fresh) else None, entities, claimed) for i, v in enumerate(value)]
+    if isinstance(value, dict):
+        fresh = fresh if isinstance(fresh, dict) else {}
+        return {k: _attach(v, fresh.get(k), entities, claimed) for k, v in value.items()}
+    if isinstance(value, tuple):
+        fresh = fresh if isinstance(fresh, tuple) else ()
+        return tuple(_attach(v, fresh[i] if i < len(fresh) else None, entities, claimed) for i, v in enumerate(value))
+    if isinstance(value, pygame.Rect):
+        return value.copy()
+    if isinstance(value, _DetachedEntity):
+        # Satu entity lama -> satu objek; pakai ulang entity ruangan baru di posisi yang sama
+        entity = entities.get(value.key)
+        if entity is not None:
+            return entity
+        if type(fresh) is value.cls and id(fresh) not in claimed:
+            entity = fresh
+            fresh_state = dict(vars(fresh))
+            entity.__dict__.clear()
+        else:
+            entity = value.cls.__new__(value.cls)
+            fresh_state = {}
+        entities[value.key] = entity
+        claimed.add(id(entity))
+        entity.__dict__.update({k: _attach(v, fresh_state.get(k), entities, claimed) for k, v in value.state.items()})
+        return entity
+    return value
+
+class _DetachedEntity:
+    def __init__(self, cls, key, state):
+        self.cls = cls
+        self.key = key
+        self.state = state
 
 class BaseRoom:
-    def __init__(self, game_manager):
+    def __init__(self, game_manager, deferred=False):
+        """deferred=True leaves loading and setup to build_steps(), for building over several frames"""
         self.game_manager = game_manager
         self.screen = game_manager.screen
         self.player = game_manager.player
@@ -217,13 +278,17 @@ class BaseRoom:
         self.objects = {}
         self.object_positions = []
         self.colliders = []
+        self.collision_grid = CollisionGrid()
         self.hiding_spots = []
         self.guards = []
         self.collectible_items = []
-        self.collection_effects = []
+        self.particles = ParticleSystem()  # Efek partikel (ambil item, dll.)
         self.notifications = []
         self.last_positions_before_hiding = {}
         
+        # Static background (tilemap + objects) baked into one surface
+        self.background = None
+        
         # Player hiding state
         self.player_is_hidden = False
         self.current_hiding_spot = None
@@ -239,16 +304,59 @@ class BaseRoom:
         self.footstep_interval = 300
         self.player_noise_level = 0
         
+        # Snapshot pemain per frame (PerceptionContext), dibuat di update
+        self.perception = None
+        
         # Variables for debug
         self.show_debug = False
         
         # Font for UI
-        self.font = pygame.font.SysFont(None, 24)
-        self.big_font = pygame.font.SysFont(None, 72)
+        self.font = get_font(24)
+        self.big_font = get_font(72)
         
         # Initialize room
+        if not deferred:
+            for _ in self.build_steps():
+                pass
+    
+    def build_steps(self):
+        """
+        Load assets and set the room up, yielding between the slow phases
+        so GameManager can spread a prefetch over cutscene or idle frames.
+        """
         self.load_assets()
+        yield
         self.setup_room()
+        self.collision_grid.rebuild(self.colliders)
+        yield
+        
+        # Grid pathfinder shared by the room's guards
+        self.pathfinder = GridPathfinder(self.collision_grid, len(self.tilemap[0]), len(self.tilemap))
+        self.flow_field = FlowField(self.pathfinder)
+        self.noise_field = NoiseField(self.pathfinder, max((guard.get_hearing_range() for guard in self.guards
+                                                             if hasattr(guard, "get_hearing_range")),
+                                                            default=BASE_HEARING_RANGE))
+        yield
+        
+        # Tabel line of sight antar sel, dimuat dari cache disk jika ada
+        self.line_of_sight = LineOfSightTable(self.collision_grid, len(self.tilemap[0]), len(self.tilemap),
+                                              name=type(self).__name__.lower())
+        self.attach_guards()
+        yield
+        
+        # Snapshot of the dynamic state right after setup, used by reset()
+        self.initial_state = self.capture_state()
+    
+    def attach_guards(self):
+        """Give self.guards the room's shared subsystems and rebuild their perception rows"""
+        for guard in self.guards:
+            guard.pathfinder = self.pathfinder
+            guard.flow_field = self.flow_field
+            guard.noise_field = self.noise_field
+            guard.line_of_sight = self.line_of_sight
+        
+        # Baris array persepsi per guard, ditulis ulang oleh Guard.update_movement
+        self.guard_arrays = GuardArrays([guard for guard in self.guards if hasattr(guard, "update_awareness")])
     
     def load_assets(self):
         """
@@ -270,28 +378,39 @@ class BaseRoom:
         """
         # Update player
         old_x, old_y = self.player.x, self.player.y
-        self.player.update(dt, mouse_held, mouse_pos, self.colliders)
+        with profiler.measure("player"):
+            self.player.update(dt, mouse_held, mouse_pos, self.collision_grid)
         
         # Calculate player noise level
-        self.update_player_noise(dt, old_x, old_y)
+        with profiler.measure("noise"):
+            self.update_player_noise(dt, old_x, old_y)
+        
+        # One snapshot of the player shared by hiding, items, guards and lasers
+        self.perception = PerceptionContext(self.player, self.player_noise_level)
         
         # Check if player is hiding
-        self.check_player_hiding()
+        with profiler.measure("hiding"):
+            self.check_player_hiding()
         
         # Update items
-        self.update_items(dt)
+        with profiler.measure("items"):
+            self.update_items(dt)
         
         # Update collection effects
-        self.update_collection_effects(dt)
+        with profiler.measure("effects"):
+            self.update_collection_effects(dt)
         
         # Update notifications
-        self.update_notifications(dt)
+        with profiler.measure("notifications"):
+            self.update_notifications(dt)
         
         # Update guards
-        self.update_guards(dt)
+        with profiler.measure("guards"):
+            self.update_guards(dt)
         
         # Check room transition
-        self.check_room_transition()
+        with profiler.measure("transition"):
+            self.check_room_transition()
     
     def update_player_noise(self, dt, old_x, old_y):
         if self.player.x != old_x or self.player.y != old_y:
@@ -309,16 +428,24 @@ class BaseRoom:
                 # Here you could add code to play footstep sound
                 # pygame.mixer.Sound("game/assets/sound/footstep.wav").play()
                 self.footstep_timer = 0
-        else:
-            # If player is not moving, no noise
+        elif self.player.is_crouching:
+            # Diam sambil jongkok: tidak ada suara
             self.player_noise_level = 0
+        else:
+            # Diam berdiri: tetap terdengar oleh guard yang sangat dekat
+            self.player_noise_level = 20
+        
+        # Sebarkan suara lewat grid tile, dipakai bersama oleh semua guard
+        self.noise_field.update((self.player.x + self.player.width // 2, self.player.y + self.player.height // 2),
+                                self.player_noise_level)
     
     def check_player_hiding(self):
         self.player_is_hidden = False
         self.current_hiding_spot = None
         
+        player_rect = self.perception.rect if self.perception else None
         for spot in self.hiding_spots:
-            if spot.contains_player(self.player):
+            if spot.contains_player(self.player, player_rect):
                 # If player just started hiding in this spot, save position
                 if not self.player_is_hidden and spot.name not in self.last_positions_before_hiding:
                     self.last_positions_before_hiding[spot.name] = (self.player.x, self.player.y)
@@ -326,10 +453,14 @@ class BaseRoom:
                 self.player_is_hidden = True
                 self.current_hiding_spot = spot
                 break
+        
+        if self.perception:
+            self.perception.hidden = self.player_is_hidden
+            self.perception.hiding_spot = self.current_hiding_spot
     
     def update_items(self, dt):
         for item in self.collectible_items:
-            if item.update(dt, self.player):
+            if item.update(dt, self.player, self.perception):
                 # Item has been collected via magnetic effect
                 # Add score
                 self.game_manager.score += item.value
@@ -355,16 +486,7 @@ class BaseRoom:
                     self.add_notification("Door has opened!", (0, 255, 0), SCREEN_WIDTH // 2, 100, velocity=0)
     
     def update_collection_effects(self, dt):
-        for effect in self.collection_effects[:]:
-            effect["timer"] += dt
-            
-            for particle in effect["particles"]:
-                particle["dx"] *= 0.95
-                particle["dy"] *= 0.95
-                particle["alpha"] = max(0, particle["alpha"] - 5)
-                
-            if effect["timer"] >= effect["duration"]:
-                self.collection_effects.remove(effect)
+        self.particles.update(dt)
     
     def update_notifications(self, dt):
         for notification in self.notifications[:]:
@@ -375,14 +497,33 @@ class BaseRoom:
                 self.notifications.remove(notification)
     
     def update_guards(self, dt):
+        # Satu flow field ke sel player, dihitung ulang hanya saat player pindah sel
+        if any(guard.state == "chase" for guard in self.guards):
+            self.flow_field.update((self.player.x + self.player.width // 2,
+                                    self.player.y + self.player.height // 2))
+        
+        context = self.perception or PerceptionContext(self.player, self.player_noise_level)
+        
+        # Gerakkan semua guard dulu, lalu hitung persepsi mereka sekaligus
+        batched = self.guard_arrays.guards
+        for guard in self.guards:
+            if hasattr(guard, "update_awareness"):
+                guard.update_movement(dt, self.player)
+            else:
+                guard.update(dt, self.player, self.guards, self.hiding_spots, context)
+        
+        if batched:
+            with profiler.measure("perception"):
+                in_view, can_hear = perceive_player(self.guard_arrays, self.player, self.noise_field)
+                context.senses = dict(zip(batched, zip(in_view.tolist(), can_hear.tolist())))
+            for guard in batched:
+                guard.update_awareness(dt, self.player, self.guards, self.hiding_spots, context)
+        
         for guard in self.guards:
-            guard.update(dt, self.player, self.guards, self.hiding_spots)
-            
             # Check if guard catches player
-            if guard.state == "chase" and not self.player_is_hidden:
+            if guard.state == "chase" and not context.hidden:
                 # Calculate distance to player
-                player_center_x = self.player.x + self.player.width // 2
-                player_center_y = self.player.y + self.player.height // 2
+                player_center_x, player_center_y = context.center
                 guard_center_x = guard.x + guard.width // 2
                 guard_center_y = guard.y + guard.height // 2
                 
@@ -416,6 +557,84 @@ class BaseRoom:
         """
         pass
     
+    def set_colliders(self, colliders):
+        """
+        Replace the room colliders and rebuild the collision grid
+        shared by the player and guards.
+        """
+        self.colliders = colliders
+        self.collision_grid.rebuild(colliders)
+        self.pathfinder.rebuild()
+        self.line_of_sight.update(colliders)
+    
+    def free_item_positions(self):
+        """Top-left corners of the half-tile item spots that overlap no collider"""
+        if self.collision_grid.colliders != self.colliders:
+            self.collision_grid.rebuild(self.colliders)
+        positions = []
+        for x in range(1, MAP_WIDTH - 1):
+            for y in range(1, MAP_HEIGHT - 1):
+                test_rect = pygame.Rect(x * TILE_SIZE + TILE_SIZE//4, y * TILE_SIZE + TILE_SIZE//4,
+                                        TILE_SIZE//2, TILE_SIZE//2)
+                if not self.collision_grid.collides_rect(test_rect):
+                    positions.append(test_rect.topleft)
+        return positions
+    
+    def capture_state(self):
+        """
+        Capture the room's dynamic state (guards, items, lasers, door,
+        alarm, ...). Assets and subsystems registered with
+        shared_across_resets are left out and stay shared.
+        """
+        return {key: _capture(value) for key, value in vars(self).items()
+                if key != "initial_state" and not is_shared(value)}
+    
+    def reset(self):
+        """
+        Restore the state captured after setup_room without reloading
+        assets, then re-roll the random parts like a fresh room would.
+        """
+        for key in [key for key, value in vars(self).items()
+                    if key != "initial_state" and not is_shared(value) and key not in self.initial_state]:
+            delattr(self, key)
+        for key, value in self.initial_state.items():
+            setattr(self, key, _restore(value))
+        
+        self.collision_grid.rebuild(self.colliders)
+        self.pathfinder.rebuild()
+        self.line_of_sight.update(self.colliders)
+        self.particles.clear()
+        self.invalidate_background()
+        self.randomize()
+    
+    def suspend(self):
+        """
+        Room state without assets, subsystems or entity objects, so
+        GameManager can drop the room and rebuild it later with resume().
+        """
+        state = {key: _detach(value) for key, value in vars(self).items()
+                 if key != "initial_state" and not is_shared(value)}
+        # Snapshot pemain per frame merujuk guard lama; dibuat ulang di update berikutnya
+        state["perception"] = None
+        return state
+    
+    def resume(self, state):
+        """Apply a suspend() result to this freshly built room"""
+        fresh = dict(vars(self))
+        entities, claimed = {}, set()
+        for key, value in state.items():
+            setattr(self, key, _attach(value, fresh.get(key), entities, claimed))
+        
+        self.collision_grid.rebuild(self.colliders)
+        self.pathfinder.rebuild()
+        self.line_of_sight.update(self.colliders)
+        self.attach_guards()
+        self.invalidate_background()
+    
+    def randomize(self):
+        """Re-roll random room content (item placement, ...) after reset; rooms override"""
+        pass
+    
     def add_notification(self, text, color, x, y, duration=1000, velocity=-0.5):
         self.notifications.append({
             "text": text,
@@ -428,48 +647,40 @@ class BaseRoom:
         })
     
     def add_collection_effect(self, x, y, color):
-        self.collection_effects.append({
-            "x": x,
-            "y": y,
-            "color": color,
-            "particles": [],
-            "timer": 0,
-            "duration": 500
-        })
-        
-        # Create particles
-        for _ in range(20):
-            angle = random.uniform(0, math.pi * 2)
-            speed = random.uniform(0.5, 2.0)
-            size = random.randint(2, 5)
-            self.collection_effects[-1]["particles"].append({
-                "dx": math.cos(angle) * speed,
-                "dy": math.sin(angle) * speed,
-                "size": size,
-                "alpha": 255
-            })
+        self.particles.emit_burst(x, y, color)
     
     def draw(self):
         """
         Draw all elements in the room
         """
         # Draw tilemap and objects
-        self.draw_tilemap()
-        self.draw_objects()
-        self.draw_items()
+        with profiler.measure("draw_background"):
+            self.draw_background()
+        with profiler.measure("draw_items"):
+            self.draw_items()
         
         # Draw guards
-        for guard in self.guards:
-            guard.draw(self.screen)
+        with profiler.measure("draw_guards"):
+            for guard in self.guards:
+                guard.draw(self.screen)
         
         # Draw player (only if not hiding)
-        if not self.player_is_hidden:
-            self.player.draw(self.screen)
-            self.player.draw_stamina_bar(self.screen)
+        with profiler.measure("draw_player"):
+            if not self.player_is_hidden:
+                self.player.draw(self.screen)
+                self.player.draw_stamina_bar(self.screen)
         
         # Draw collection effects
-        self.draw_collection_effects()
+        with profiler.measure("draw_effects"):
+            self.draw_collection_effects()
         
+        with profiler.measure("draw_hud"):
+            self.draw_hud()
+    
+    def draw_hud(self):
+        """
+        Draw notifications, hiding indicator, score and debug info
+        """
         # Draw notifications
         self.draw_notifications()
         
@@ -478,34 +689,54 @@ class BaseRoom:
             self.draw_hiding_indicator()
         
         #Draw score
-        score_text = self.font.render(f"Score: {self.game_manager.score}", True, (255, 255, 255))
+        score_text = render_text(self.font, f"Score: {self.game_manager.score}", (255, 255, 255))
         self.screen.blit(score_text, (10, 10))
         
         # Draw debug info if enabled
         if self.show_debug:
             self.draw_debug_info()
     
-    def draw_tilemap(self):
-        for y, row in enumerate(self.tilemap):
-            for x, tile_id in enumerate(row):
-                self.screen.blit(self.tiles[tile_id], (x * TILE_SIZE, y * TILE_SIZE))
+    def build_background(self):
+        """
+        Bake the tilemap and static objects into a single surface.
+        """
+        width = len(self.tilemap[0]) * TILE_SIZE
+        height = len(self.tilemap) * TILE_SIZE
+        self.background = pygame.Surface((width, height)).convert()
+        self.draw_tilemap(self.background)
+        self.draw_objects(self.background)
+    
+    def invalidate_background(self):
+        """
+        Drop the baked background so it is rebuilt on the next draw.
+        Call this whenever the tilemap or object_positions change.
+        """
+        self.background = None
+    
+    def draw_background(self):
+        if self.background is None:
+            self.build_background()
+        self.screen.blit(self.background, (0, 0))
     
-    def draw_objects(self):
-        for obj in self.object_positions:
-            self.screen.blit(obj["img"], (obj["x"] * TILE_SIZE, obj["y"] * TILE_SIZE))
+    def draw_tilemap(self, surface=None):
+        if surface is None:
+            surface = self.screen
+        surface.blits([(self.tiles[tile_id], (x * TILE_SIZE, y * TILE_SIZE))
+                       for y, row in enumerate(self.tilemap)
+                       for x, tile_id in enumerate(row)], doreturn=False)
+    
+    def draw_objects(self, surface=None):
+        if surface is None:
+            surface = self.screen
+        surface.blits([(obj["img"], (obj["x"] * TILE_SIZE, obj["y"] * TILE_SIZE))
+                       for obj in self.object_positions], doreturn=False)
     
     def draw_items(self):
         for item in self.collectible_items:
             item.draw(self.screen)
     
     def draw_collection_effects(self):
-        for effect in self.collection_effects:
-            for particle in effect["particles"]:
-                if particle["alpha"] > 0:
-                    color = effect["color"] + (particle["alpha"],)
-                    px = effect["x"] + particle["dx"] * effect["timer"] / 16.67
-                    py = effect["y"] + particle["dy"] * effect["timer"] / 16.67
-                    pygame.draw.circle(self.screen, color, (int(px), int(py)), particle["size"])
+        self.particles.draw(self.screen)
     
     def draw_notifications(self):
         for notification in self.notifications:
@@ -515,20 +746,15 @@ class BaseRoom:
             elif notification["timer"] > notification["duration"] - 300:
                 alpha = int(255 * (notification["duration"] - notification["timer"]) / 300)
             
-            color = notification["color"] + (alpha,)
-            notification_font = pygame.font.SysFont(None, 24)
-            text_surface = notification_font.render(notification["text"], True, color)
+            # Surface dari cache dipakai bersama, jadi fade dilakukan pada salinannya
+            text_surface = render_text(self.font, notification["text"], notification["color"]).copy()
             text_rect = text_surface.get_rect(center=(notification["x"], notification["y"]))
             
-            alpha_surface = pygame.Surface(text_surface.get_size(), pygame.SRCALPHA)
-            alpha_surface.fill((255, 255, 255, alpha))
-            
-            text_surface.blit(alpha_surface, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            text_surface.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
             self.screen.blit(text_surface, text_rect)
     
     def draw_hiding_indicator(self):
-        font = pygame.font.SysFont(None, 24)
-        text = font.render("HIDDEN", True, (0, 255, 0))
+        text = render_text(self.font, "HIDDEN", (0, 255, 0))
         text_rect = text.get_rect(center=(self.current_hiding_spot.rect.centerx, self.current_hiding_spot.rect.top - 20))
         self.screen.blit(text, text_rect)
     
@@ -537,7 +763,7 @@ class BaseRoom:
         # Display guard info
         for i, guard in enumerate(self.guards):
             text = f"Guard {i+1}: {guard.guard_type} - {guard.state}"
-            text_surf = self.font.render(text, True, (255, 255, 255))
+            text_surf = render_text(self.font, text, (255, 255, 255))
             self.screen.blit(text_surf, (10, y_offset))
             y_offset += 25
         
@@ -550,13 +776,13 @@ class BaseRoom:
         stamina_text = f"Stamina: {self.player.stamina:.1f}/{self.player.max_stamina}"
         exhausted_text = f"Exhausted: {self.player.is_exhausted}"
         
-        state_surf = self.font.render(state_text, True, (255, 255, 255))
-        speed_surf = self.font.render(speed_text, True, (255, 255, 255))
-        stealth_surf = self.font.render(stealth_text, True, (255, 255, 255))
-        noise_surf = self.font.render(noise_text, True, (255, 255, 255))
-        hidden_surf = self.font.render(hidden_text, True, (255, 255, 255))
-        stamina_surf = self.font.render(stamina_text, True, (255, 255, 255))
-        exhausted_surf = self.font.render(exhausted_text, True, (255, 255, 255))
+        state_surf = render_text(self.font, state_text, (255, 255, 255))
+        speed_surf = render_text(self.font, speed_text, (255, 255, 255))
+        stealth_surf = render_text(self.font, stealth_text, (255, 255, 255))
+        noise_surf = render_text(self.font, noise_text, (255, 255, 255))
+        hidden_surf = render_text(self.font, hidden_text, (255, 255, 255))
+        stamina_surf = render_text(self.font, stamina_text, (255, 255, 255))
+        exhausted_surf = render_text(self.font, exhausted_text, (255, 255, 255))
         
         self.screen.blit(state_surf, (10, y_offset))
         self.screen.blit(speed_surf, (10, y_offset + 25))
@@ -576,9 +802,9 @@ class BaseRoom:
         key_text = f"Key Spawned: {self.key_spawned}, Key Collected: {self.key_collected}"
         door_text = f"Door Opened: {self.door_opened}"
         
-        items_surf = self.font.render(items_text, True, (255, 255, 255))
-        key_surf = self.font.render(key_text, True, (255, 255, 255))
-        door_surf = self.font.render(door_text, True, (255, 255, 255))
+        items_surf = render_text(self.font, items_text, (255, 255, 255))
+        key_surf = render_text(self.font, key_text, (255, 255, 255))
+        door_surf = render_text(self.font, door_text, (255, 255, 255))
         
         self.screen.blit(items_surf, (10, y_offset + 175))
         self.screen.blit(key_surf, (10, y_offset + 200))
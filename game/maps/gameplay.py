@@ -3,7 +3,6 @@ import sys
 from game.game_manager import GameManager
 from game.assets.background.create_placeholder import create_placeholder_image
 from game.assets.sound.create_placeholder_sounds import create_placeholder_menu_music, create_placeholder_alert_sound, create_placeholder_game_music
-from game.cutscenes.room1_intro import run_cutscene_room1
 
 def show_loading_screen(screen, text="Please Wait..."):
     """Menampilkan layar loading dengan teks yang diberikan"""
@@ -53,9 +52,9 @@ def run_gameplay():
     # Beri waktu untuk loading (simulasi)
     pygame.time.delay(500)  # Delay 500ms untuk simulasi loading
     
-    # Tampilkan cutscene room1 sebelum memulai gameplay
-    run_cutscene_room1()
-    
-    # Buat dan jalankan game manager
+    # Buat game manager (ruangan 1) selagi layar loading tampil
     game_manager = GameManager()
+    
+    # Tampilkan cutscene room1 sebelum memulai gameplay; ruangan 2 di-prefetch selama cutscene
+    game_manager.show_room_cutscene(0)
     game_manager.run()
@@ -2,7 +2,7 @@ import pygame
 import random
 import math
 from game.utils.constants import *
-from game.utils.asset_loader import load_and_transform, get_frames
+from game.utils.asset_loader import load_and_transform, get_frames, load_image
 from game.maps.base_room import BaseRoom, HidingSpot, CollectibleItem
 
 class Room1(BaseRoom):
@@ -122,13 +122,13 @@ class Room1(BaseRoom):
         
         guard_types = {
             "ranger": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/rangerr.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/rangerr.png"),
                 "speed": GUARD_SPEED,
                 "vision_range": 200,
                 "color": (255, 0, 0)
             },
             "aristocrate": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/aristocrate.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/aristocrate.png"),
                 "speed": GUARD_SPEED * 1.2,
                 "vision_range": 180,
                 "color": (255, 0, 0)
@@ -146,23 +146,21 @@ class Room1(BaseRoom):
             }
         
         self.guards = [
-            Guard(3 * TILE_SIZE, 3 * TILE_SIZE, "ranger", patrol_routes[0], guard_frames["ranger"], guard_types["ranger"], self.colliders),
-            Guard(16 * TILE_SIZE, 2 * TILE_SIZE, "aristocrate", patrol_routes[1], guard_frames["aristocrate"], guard_types["aristocrate"], self.colliders)
+            Guard(3 * TILE_SIZE, 3 * TILE_SIZE, "ranger", patrol_routes[0], guard_frames["ranger"], guard_types["ranger"], self.collision_grid),
+            Guard(16 * TILE_SIZE, 2 * TILE_SIZE, "aristocrate", patrol_routes[1], guard_frames["aristocrate"], guard_types["aristocrate"], self.collision_grid)
         ]
         
         # Setup collectible items
         self.setup_collectible_items()
     
+    def randomize(self):
+        # Posisi, bentuk dan warna item diacak ulang setiap reset
+        self.collectible_items = []
+        self.setup_collectible_items()
+    
     def setup_collectible_items(self):
         # Define valid areas for items (avoid walls and objects)
-        valid_item_positions = []
-        for x in range(1, MAP_WIDTH - 1):
-            for y in range(1, MAP_HEIGHT - 1):
-                test_rect = pygame.Rect(x * TILE_SIZE + TILE_SIZE//4, y * TILE_SIZE + TILE_SIZE//4, 
-                                       TILE_SIZE//2, TILE_SIZE//2)
-                
-                if not any(test_rect.colliderect(c) for c in self.colliders):
-                    valid_item_positions.append((x * TILE_SIZE + TILE_SIZE//4, y * TILE_SIZE + TILE_SIZE//4))
+        valid_item_positions = self.free_item_positions()
         
         # Shuffle valid positions and pick some for items
         random.shuffle(valid_item_positions)
@@ -204,9 +202,10 @@ class Room1(BaseRoom):
     def open_door(self):
         # Replace tilemap with version that has open door
         self.tilemap = self.tilemap_with_door
+        self.invalidate_background()
         
         # Remove collider for door
-        self.colliders = [c for c in self.colliders if not (c.left == 19 * TILE_SIZE and c.top == 5 * TILE_SIZE)]
+        self.set_colliders([c for c in self.colliders if not (c.left == 19 * TILE_SIZE and c.top == 5 * TILE_SIZE)])
     
     def check_room_transition(self):
         # Check if player is at exit door (right side of room) - lebih ketat
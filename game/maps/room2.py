@@ -2,7 +2,10 @@ import pygame
 import random
 import math
 from game.utils.constants import *
-from game.utils.asset_loader import load_and_transform, get_frames
+from game.utils.asset_loader import load_and_transform, get_frames, load_image, load_sound
+from game.utils.lighting import LightingLayer
+from game.utils.text import get_font, render_text
+from game.utils.profiler import profiler
 from game.maps.base_room import BaseRoom, HidingSpot, CollectibleItem
 from game.entities.laser import Laser
 
@@ -34,7 +37,7 @@ class Room2(BaseRoom):
         self.ambient_light = 80  # Tingkat cahaya ambient (0-255, 0 = gelap total)
         
         # Buat surface untuk efek pencahayaan
-        self.light_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.lighting = LightingLayer(self.ambient_light)
     
     def setup_room(self):
         # Setup tilemap (different layout for room 2)
@@ -111,19 +114,19 @@ class Room2(BaseRoom):
         
         guard_types = {
             "ranger": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/rangerr.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/rangerr.png"),
                 "speed": GUARD_SPEED,
                 "vision_range": 300,
                 "color": (5, 165, 245)
             },
             "aristocrate": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/aristocrate.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/aristocrate.png"),
                 "speed": GUARD_SPEED * 1.2,
                 "vision_range": 250,
                 "color": (5, 245, 157)
             },
             "kakek": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/kakek1.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/kakek1.png"),
                 "speed": GUARD_SPEED * 0.5,
                 "vision_range": 120,
                 "color": (84, 92, 85)
@@ -141,9 +144,9 @@ class Room2(BaseRoom):
             }
         
         self.guards = [
-            Guard(5 * TILE_SIZE, 3 * TILE_SIZE, "ranger", patrol_routes[0], guard_frames["ranger"], guard_types["ranger"], self.colliders),
-            Guard(10 * TILE_SIZE, 2 * TILE_SIZE, "aristocrate", patrol_routes[1], guard_frames["aristocrate"], guard_types["aristocrate"], self.colliders),
-            Guard(2 * TILE_SIZE, 2 * TILE_SIZE, "kakek", patrol_routes[2], guard_frames["kakek"], guard_types["kakek"], self.colliders)
+            Guard(5 * TILE_SIZE, 3 * TILE_SIZE, "ranger", patrol_routes[0], guard_frames["ranger"], guard_types["ranger"], self.collision_grid),
+            Guard(10 * TILE_SIZE, 2 * TILE_SIZE, "aristocrate", patrol_routes[1], guard_frames["aristocrate"], guard_types["aristocrate"], self.collision_grid),
+            Guard(2 * TILE_SIZE, 2 * TILE_SIZE, "kakek", patrol_routes[2], guard_frames["kakek"], guard_types["kakek"], self.collision_grid)
         ]
         
         # Setup collectible items
@@ -166,21 +169,19 @@ class Room2(BaseRoom):
         self.alarm_sound = None
         self.alarm_sound_channel = None  # Track the sound channel
         try:
-            self.alarm_sound = pygame.mixer.Sound("game/assets/sound/alert.wav")
+            self.alarm_sound = load_sound("game/assets/sound/alert.wav")
             self.alarm_sound.set_volume(0.7)
         except pygame.error as e:
             print(f"Tidak dapat memuat file suara alarm: {e}")
     
+    def randomize(self):
+        # Posisi, bentuk dan warna item diacak ulang setiap reset
+        self.collectible_items = []
+        self.setup_collectible_items()
+    
     def setup_collectible_items(self):
         # Same as Room1, but with different positions
-        valid_item_positions = []
-        for x in range(1, MAP_WIDTH - 1):
-            for y in range(1, MAP_HEIGHT - 1):
-                test_rect = pygame.Rect(x * TILE_SIZE + TILE_SIZE//4, y * TILE_SIZE + TILE_SIZE//4, 
-                                       TILE_SIZE//2, TILE_SIZE//2)
-                
-                if not any(test_rect.colliderect(c) for c in self.colliders):
-                    valid_item_positions.append((x * TILE_SIZE + TILE_SIZE//4, y * TILE_SIZE + TILE_SIZE//4))
+        valid_item_positions = self.free_item_positions()
         
         random.shuffle(valid_item_positions)
         num_items = min(15, len(valid_item_positions))
@@ -219,9 +220,10 @@ class Room2(BaseRoom):
     def open_door(self):
         # Replace tilemap with version that has open door
         self.tilemap = self.tilemap_with_door
+        self.invalidate_background()
         
         # Remove collider for door
-        self.colliders = [c for c in self.colliders if not (c.left == 9 * TILE_SIZE and c.top == 11 * TILE_SIZE)]
+        self.set_colliders([c for c in self.colliders if not (c.left == 9 * TILE_SIZE and c.top == 11 * TILE_SIZE)])
     
     def update(self, dt, mouse_held, mouse_pos):
         # Update base room elements
@@ -229,9 +231,10 @@ class Room2(BaseRoom):
         
         # Update lasers
         laser_triggered = False
-        for laser in self.lasers:
-            if laser.update(dt, self.player):
-                laser_triggered = True
+        with profiler.measure("lasers"):
+            for laser in self.lasers:
+                if laser.update(dt, self.player, self.perception):
+                    laser_triggered = True
         
         # Jika laser dipicu dan alarm belum aktif, aktifkan alarm
         if laser_triggered and not self.alarm_triggered:
@@ -316,65 +319,55 @@ class Room2(BaseRoom):
     
     def draw(self):
         # Gambar latar belakang dan objek dasar
-        self.draw_tilemap()
-        self.draw_objects()
-        self.draw_items()
+        with profiler.measure("draw_background"):
+            self.draw_background()
+        with profiler.measure("draw_items"):
+            self.draw_items()
         
         # Gambar laser
-        for laser in self.lasers:
-            laser.draw(self.screen)
+        with profiler.measure("draw_lasers"):
+            for laser in self.lasers:
+                laser.draw(self.screen)
         
         # Gambar guard
-        for guard in self.guards:
-            guard.draw(self.screen)
+        with profiler.measure("draw_guards"):
+            for guard in self.guards:
+                guard.draw(self.screen)
         
         # Gambar player (hanya jika tidak bersembunyi)
-        if not self.player_is_hidden:
-            self.player.draw(self.screen)
-            self.player.draw_stamina_bar(self.screen)
+        with profiler.measure("draw_player"):
+            if not self.player_is_hidden:
+                self.player.draw(self.screen)
+                self.player.draw_stamina_bar(self.screen)
         
         # Gambar efek koleksi
-        self.draw_collection_effects()
-        
-        # Gambar notifikasi
-        self.draw_notifications()
+        with profiler.measure("draw_effects"):
+            self.draw_collection_effects()
         
-        # Gambar indikator bersembunyi jika player sedang bersembunyi
-        if self.player_is_hidden and self.current_hiding_spot:
-            self.draw_hiding_indicator()
-        
-        # Gambar skor
-        score_text = self.font.render(f"Score: {self.game_manager.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
-        
-        # Gambar info debug jika diaktifkan
-        if self.show_debug:
-            self.draw_debug_info()
+        # Gambar notifikasi, indikator bersembunyi, skor dan info debug
+        with profiler.measure("draw_hud"):
+            self.draw_hud()
         
         # Terapkan efek pencahayaan
-        self.apply_lighting_effect()
+        with profiler.measure("draw_lighting"):
+            self.apply_lighting_effect()
         
         # Gambar efek alarm jika aktif
-        if self.alarm_triggered:
-            self.draw_alarm_effect()
+        with profiler.measure("draw_alarm"):
+            if self.alarm_triggered:
+                self.draw_alarm_effect()
     
     def apply_lighting_effect(self):
-        # Buat surface untuk efek pencahayaan
-        self.light_surface.fill((0, 0, 0, 255 - self.ambient_light))
+        self.lighting.clear_lights()
         
         # Buat lingkaran cahaya di sekitar player jika tidak bersembunyi
         if not self.player_is_hidden:
             player_center_x = int(self.player.x + self.player.width // 2)
             player_center_y = int(self.player.y + self.player.height // 2)
-            
-            # Buat gradient cahaya
-            for radius in range(self.light_radius, 0, -1):
-                alpha = int(255 * (1 - radius / self.light_radius))
-                pygame.draw.circle(self.light_surface, (0, 0, 0, alpha), 
-                                  (player_center_x, player_center_y), radius, 1)
+            self.lighting.add_light(player_center_x, player_center_y, self.light_radius)
         
         # Terapkan efek pencahayaan ke layar
-        self.screen.blit(self.light_surface, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+        self.lighting.render(self.screen)
     
     def draw_alarm_effect(self):
         # Buat efek kedip merah untuk alarm
@@ -384,8 +377,7 @@ class Room2(BaseRoom):
             self.screen.blit(alarm_surface, (0, 0))
             
             # Gambar teks alarm
-            alarm_font = pygame.font.SysFont(None, 48)
-            alarm_text = alarm_font.render("! ALARM !", True, (255, 0, 0))
+            alarm_text = render_text(get_font(48), "! ALARM !", (255, 0, 0))
             text_rect = alarm_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
             self.screen.blit(alarm_text, text_rect)
 
@@ -2,7 +2,10 @@ import pygame
 import random
 import math
 from game.utils.constants import *
-from game.utils.asset_loader import load_and_transform, get_frames
+from game.utils.asset_loader import load_and_transform, get_frames, load_image, load_sound
+from game.utils.lighting import LightingLayer
+from game.utils.text import get_font, render_text
+from game.utils.profiler import profiler
 from game.maps.base_room import BaseRoom, HidingSpot, CollectibleItem
 from game.entities.laser import Laser
 
@@ -35,7 +38,7 @@ class Room3(BaseRoom):
         self.ambient_light = 60  # Tingkat cahaya ambient (0-255, 0 = gelap total) (lebih gelap dari ruangan2)
         
         # Buat surface untuk efek pencahayaan
-        self.light_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.lighting = LightingLayer(self.ambient_light)
         
         # Variabel untuk laser bergerak
         self.moving_lasers = []
@@ -120,25 +123,25 @@ class Room3(BaseRoom):
         
         guard_types = {
             "ariana": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/ariana.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/ariana.png"),
                 "speed": GUARD_SPEED,
                 "vision_range": 200,
                 "color": (61, 52, 235)
             },
             "aristocrate": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/aristocrate.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/aristocrate.png"),
                 "speed": GUARD_SPEED * 1.2,
                 "vision_range": 180,
                 "color": (255, 0, 0)
             },
             "rapper": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/rapper.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/rapper.png"),
                 "speed": GUARD_SPEED * 1.2,
                 "vision_range": 180,
                 "color": (203, 219, 26)
             },
             "nia": {
-                "sprite_sheet": pygame.image.load("game/assets/guard_img/nia.png").convert_alpha(),
+                "sprite_sheet": load_image("game/assets/guard_img/nia.png"),
                 "speed": GUARD_SPEED * 1.2,
                 "vision_range": 180,
                 "color": (245, 29, 220)
@@ -157,15 +160,15 @@ class Room3(BaseRoom):
         
         # Buat 4 penjaga dengan tipe dan rute berbeda
         self.guards = [
-    Guard(15 * TILE_SIZE, 8 * TILE_SIZE, "ariana", patrol_routes[0], guard_frames["ariana"], guard_types["ariana"], self.colliders),
-    Guard(10 * TILE_SIZE, 9 * TILE_SIZE, "aristocrate", patrol_routes[1], guard_frames["aristocrate"], guard_types["aristocrate"], self.colliders),
-    Guard(18 * TILE_SIZE, 5 * TILE_SIZE, "rapper", patrol_routes[2], guard_frames["rapper"], guard_types["rapper"], self.colliders),
+    Guard(15 * TILE_SIZE, 8 * TILE_SIZE, "ariana", patrol_routes[0], guard_frames["ariana"], guard_types["ariana"], self.collision_grid),
+    Guard(10 * TILE_SIZE, 9 * TILE_SIZE, "aristocrate", patrol_routes[1], guard_frames["aristocrate"], guard_types["aristocrate"], self.collision_grid),
+    Guard(18 * TILE_SIZE, 5 * TILE_SIZE, "rapper", patrol_routes[2], guard_frames["rapper"], guard_types["rapper"], self.collision_grid),
     Guard(8 * TILE_SIZE, 8 * TILE_SIZE, "nia", patrol_routes[3], guard_frames["nia"], 
          {"sprite_sheet": guard_types["aristocrate"]["sprite_sheet"], 
           "speed": GUARD_SPEED * 1.3,  # Penjaga ini lebih cepat
           "vision_range": 220,  # Dan melihat lebih jauh
           "color": (255, 0, 0)}, 
-         self.colliders)
+         self.collision_grid)
 ]
         
         # Setup laser statis
@@ -195,7 +198,7 @@ class Room3(BaseRoom):
         self.alarm_sound = None
         self.alarm_sound_channel = None  # Track the sound channel
         try:
-            self.alarm_sound = pygame.mixer.Sound("game/assets/sound/alert.wav")
+            self.alarm_sound = load_sound("game/assets/sound/alert.wav")
             self.alarm_sound.set_volume(0.7)
         except pygame.error as e:
             print(f"Tidak dapat memuat file suara alarm: {e}")
@@ -267,14 +270,7 @@ class Room3(BaseRoom):
     
     def setup_collectible_item(self):
         # Define valid areas for items (avoid walls and objects)
-        valid_item_positions = []
-        for x in range(1, MAP_WIDTH - 1):
-            for y in range(1, MAP_HEIGHT - 1):
-                test_rect = pygame.Rect(x * TILE_SIZE + TILE_SIZE//4, y * TILE_SIZE + TILE_SIZE//4, 
-                                       TILE_SIZE//2, TILE_SIZE//2)
-                
-                if not any(test_rect.colliderect(c) for c in self.colliders):
-                    valid_item_positions.append((x * TILE_SIZE + TILE_SIZE//4, y * TILE_SIZE + TILE_SIZE//4))
+        valid_item_positions = self.free_item_positions()
         
         # Shuffle valid positions and pick some for items
         random.shuffle(valid_item_positions)
@@ -366,25 +362,27 @@ class Room3(BaseRoom):
     def open_door(self):
         # Replace tilemap with version that has open door
         self.tilemap = self.tilemap_with_door
+        self.invalidate_background()
         
         # Remove collider for door
-        self.colliders = [c for c in self.colliders if not (c.left == 9 * TILE_SIZE and c.top == 11 * TILE_SIZE)]
+        self.set_colliders([c for c in self.colliders if not (c.left == 9 * TILE_SIZE and c.top == 11 * TILE_SIZE)])
     
     def update(self, dt, mouse_held, mouse_pos):
         # Update base room elements
         super().update(dt, mouse_held, mouse_pos)
         
-        # Update laser statis
         laser_triggered = False
-        for laser in self.lasers:
-            if laser.update(dt, self.player):
-                laser_triggered = True
-        
-        # Update laser bergerak
-        self.update_moving_lasers(dt)
-        for moving_laser in self.moving_lasers:
-            if moving_laser["laser"].update(dt, self.player):
-                laser_triggered = True
+        with profiler.measure("lasers"):
+            # Update laser statis
+            for laser in self.lasers:
+                if laser.update(dt, self.player, self.perception):
+                    laser_triggered = True
+            
+            # Update laser bergerak
+            self.update_moving_lasers(dt)
+            for moving_laser in self.moving_lasers:
+                if moving_laser["laser"].update(dt, self.player, self.perception):
+                    laser_triggered = True
         
         # Jika laser dipicu dan alarm belum aktif, aktifkan alarm
         if laser_triggered and not self.alarm_triggered:
@@ -501,69 +499,59 @@ class Room3(BaseRoom):
     
     def draw(self):
         # Gambar latar belakang dan objek dasar
-        self.draw_tilemap()
-        self.draw_objects()
-        self.draw_items()
-        
-        # Gambar laser statis
-        for laser in self.lasers:
-            laser.draw(self.screen)
-        
-        # Gambar laser bergerak
-        for laser_data in self.moving_lasers:
-            laser_data["laser"].draw(self.screen)
+        with profiler.measure("draw_background"):
+            self.draw_background()
+        with profiler.measure("draw_items"):
+            self.draw_items()
+        
+        with profiler.measure("draw_lasers"):
+            # Gambar laser statis
+            for laser in self.lasers:
+                laser.draw(self.screen)
+            
+            # Gambar laser bergerak
+            for laser_data in self.moving_lasers:
+                laser_data["laser"].draw(self.screen)
         
         # Gambar guard
-        for guard in self.guards:
-            guard.draw(self.screen)
+        with profiler.measure("draw_guards"):
+            for guard in self.guards:
+                guard.draw(self.screen)
         
         # Gambar player (hanya jika tidak bersembunyi)
-        if not self.player_is_hidden:
-            self.player.draw(self.screen)
-            self.player.draw_stamina_bar(self.screen)
+        with profiler.measure("draw_player"):
+            if not self.player_is_hidden:
+                self.player.draw(self.screen)
+                self.player.draw_stamina_bar(self.screen)
         
         # Gambar efek koleksi
-        self.draw_collection_effects()
-        
-        # Gambar notifikasi
-        self.draw_notifications()
-        
-        # Gambar indikator bersembunyi jika player sedang bersembunyi
-        if self.player_is_hidden and self.current_hiding_spot:
-            self.draw_hiding_indicator()
-        
-        # Gambar skor
-        score_text = self.font.render(f"Score: {self.game_manager.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
+        with profiler.measure("draw_effects"):
+            self.draw_collection_effects()
         
-        # Gambar info debug jika diaktifkan
-        if self.show_debug:
-            self.draw_debug_info()
+        # Gambar notifikasi, indikator bersembunyi, skor dan info debug
+        with profiler.measure("draw_hud"):
+            self.draw_hud()
         
         # Terapkan efek pencahayaan
-        self.apply_lighting_effect()
+        with profiler.measure("draw_lighting"):
+            self.apply_lighting_effect()
         
         # Gambar efek alarm jika aktif
-        if self.alarm_triggered:
-            self.draw_alarm_effect()
+        with profiler.measure("draw_alarm"):
+            if self.alarm_triggered:
+                self.draw_alarm_effect()
     
     def apply_lighting_effect(self):
-        # Buat surface untuk efek pencahayaan
-        self.light_surface.fill((0, 0, 0, 255 - self.ambient_light))
+        self.lighting.clear_lights()
         
         # Buat lingkaran cahaya di sekitar player jika tidak bersembunyi
         if not self.player_is_hidden:
             player_center_x = int(self.player.x + self.player.width // 2)
             player_center_y = int(self.player.y + self.player.height // 2)
-            
-            # Buat gradient cahaya
-            for radius in range(self.light_radius, 0, -1):
-                alpha = int(255 * (1 - radius / self.light_radius))
-                pygame.draw.circle(self.light_surface, (0, 0, 0, alpha), 
-                                  (player_center_x, player_center_y), radius, 1)
+            self.lighting.add_light(player_center_x, player_center_y, self.light_radius)
         
         # Terapkan efek pencahayaan ke layar
-        self.screen.blit(self.light_surface, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+        self.lighting.render(self.screen)
     
     def draw_alarm_effect(self):
         # Buat efek kedip merah untuk alarm
@@ -573,8 +561,7 @@ class Room3(BaseRoom):
             self.screen.blit(alarm_surface, (0, 0))
             
             # Gambar teks alarm
-            alarm_font = pygame.font.SysFont(None, 48)
-            alarm_text = alarm_font.render("! ALARM !", True, (255, 0, 0))
+            alarm_text = render_text(get_font(48), "! ALARM !", (255, 0, 0))
             text_rect = alarm_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
             self.screen.blit(alarm_text, text_rect)
 
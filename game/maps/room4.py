@@ -3,14 +3,19 @@ import random
 import math
 import sys
 from game.utils.constants import *
-from game.utils.asset_loader import load_and_transform
+from game.utils.asset_loader import load_and_transform, load_image, load_sound
+from game.utils.lighting import LightingLayer
+from game.utils.text import get_font, render_text
+from game.utils.profiler import profiler
 from game.maps.base_room import BaseRoom, HidingSpot, CollectibleItem
+from game.utils.collision import CollisionGrid
+from game.utils.vision import draw_vision_cone
 
 class StaticGuard:
-    def __init__(self, x, y, image_path, colliders=None, vision_range=250, vision_color=(255, 0, 0)):
+    def __init__(self, x, y, image_path, collision_grid=None, vision_range=250, vision_color=(255, 0, 0)):
         self.x = x
         self.y = y
-        self.image = pygame.image.load(image_path).convert_alpha()
+        self.image = load_and_transform(image_path)
         self.width = self.image.get_width()
         self.height = self.image.get_height()
         self.vision_range = vision_range
@@ -21,7 +26,8 @@ class StaticGuard:
         self.alert_level = 0
         self.state = "patrol"
         self.last_known_player_pos = None
-        self.colliders = colliders or []  # Store colliders
+        self.collision_grid = collision_grid or CollisionGrid()  # Shared room collision grid
+        self.line_of_sight = None  # Room LineOfSightTable, set by BaseRoom
         
         # Emote variables
         self.show_emote = False
@@ -34,7 +40,7 @@ class StaticGuard:
         self.alert_sound = None
         self.alert_sound_channel = None
         try:
-            self.alert_sound = pygame.mixer.Sound("game/assets/sound/alert.wav")
+            self.alert_sound = load_sound("game/assets/sound/alert.wav")
             self.alert_sound.set_volume(0.7)
         except pygame.error as e:
             print(f"Could not load alert sound file: {e}")
@@ -45,14 +51,9 @@ class StaticGuard:
         self.patrol_speed = self.base_patrol_speed
         self.patrol_timer = 0
         self.speed_change_timer = 0
-        self.speed_change_interval = random.randint(800, 2000)  # Random interval for speed changes
-        self.direction_change_interval = random.randint(500, 1500)  # Random interval for direction changes
-        self.move_direction = [random.choice([-1, 1]), random.choice([-1, 1])]  # Random initial direction
         self.movement_pattern = "straight"  # Can be "straight", "zigzag", or "erratic"
         self.pattern_change_timer = 0
-        self.pattern_change_interval = random.randint(2000, 4000)  # Change pattern every 2-4 seconds
-        self.zigzag_amplitude = random.uniform(0.5, 1.5)  # For zigzag pattern
-        self.zigzag_frequency = random.uniform(0.005, 0.015)  # For zigzag pattern
+        self.randomize_patrol()
         self.patrol_bounds = {
             'min_x': TILE_SIZE * 1,
             'max_x': SCREEN_WIDTH - TILE_SIZE * 1 - self.width,
@@ -63,10 +64,19 @@ class StaticGuard:
         # Add a preference for vertical movement to ensure Trump moves up and down more often
         self.vertical_movement_bias = 0.7  # Higher chance to move vertically
     
+    def randomize_patrol(self):
+        """Roll the random patrol timings and initial direction"""
+        self.speed_change_interval = random.randint(800, 2000)  # Random interval for speed changes
+        self.direction_change_interval = random.randint(500, 1500)  # Random interval for direction changes
+        self.move_direction = [random.choice([-1, 1]), random.choice([-1, 1])]  # Random initial direction
+        self.pattern_change_interval = random.randint(2000, 4000)  # Change pattern every 2-4 seconds
+        self.zigzag_amplitude = random.uniform(0.5, 1.5)  # For zigzag pattern
+        self.zigzag_frequency = random.uniform(0.005, 0.015)  # For zigzag pattern
+    
     def get_rect(self):
         return pygame.Rect(self.x, self.y, self.width, self.height)
     
-    def update(self, dt, player, guards=None, hiding_spots=None):
+    def update(self, dt, player, guards=None, hiding_spots=None, context=None):
         # Update patrol movement
         if self.is_patrolling:
             # Update timers
@@ -163,12 +173,15 @@ class StaticGuard:
         
         # Check if player is visible
         if player:
-            player_is_hidden = False
-            if hiding_spots:
-                for spot in hiding_spots:
-                    if spot.contains_player(player):
-                        player_is_hidden = True
-                        break
+            if context is not None:
+                player_is_hidden = context.hidden
+            else:
+                player_is_hidden = False
+                if hiding_spots:
+                    for spot in hiding_spots:
+                        if spot.contains_player(player):
+                            player_is_hidden = True
+                            break
             
             if not player_is_hidden:
                 if self.can_see_player(player):
@@ -291,26 +304,17 @@ class StaticGuard:
         fov_rad = math.radians(90) / 2
         
         if angle_diff <= fov_rad:
-            # Simple ray casting to check for obstacles
-            segments = 10
-            for i in range(1, segments + 1):
-                segment_x = guard_center_x + (dx * i / segments)
-                segment_y = guard_center_y + (dy * i / segments)
-                
-                segment_rect = pygame.Rect(segment_x - 2, segment_y - 2, 4, 4)
-                
-                # Check collision with obstacles
-                for collider in self.colliders:
-                    if segment_rect.colliderect(collider):
-                        return False  # Obstacle blocking view
-                
-            return True  # No obstacles, can see player
+            # Line of sight from the room table, exact segment test as fallback
+            if self.line_of_sight is not None:
+                return self.line_of_sight.is_visible(guard_center_x, guard_center_y, player_center_x, player_center_y)
+            return not self.collision_grid.segment_blocked(guard_center_x, guard_center_y, player_center_x, player_center_y)
             
         return False  # Player outside field of view
     
     def draw(self, surface):
         # Draw vision cone
-        self.draw_vision_cone(surface)
+        with profiler.measure("draw_cones"):
+            self.draw_vision_cone(surface)
         
         # Draw the guard
         surface.blit(self.image, (self.x, self.y))
@@ -322,11 +326,11 @@ class StaticGuard:
             emote_y = self.y - 10
         
             # Draw emote based on type
-            font = pygame.font.SysFont(None, 24)
+            font = get_font(24)
             if self.emote_type == "alert":
-                emote_text = font.render("!!", True, (255, 0, 0))  # Red for alert
+                emote_text = render_text(font, "!!", (255, 0, 0))  # Red for alert
             elif self.emote_type == "confused":
-                emote_text = font.render("??", True, (255, 255, 0))  # Yellow for confusion
+                emote_text = render_text(font, "??", (255, 255, 0))  # Yellow for confusion
         
             surface.blit(emote_text, (emote_x, emote_y))
     
@@ -358,39 +362,14 @@ class StaticGuard:
         center_x = self.x + self.width // 2
         center_y = self.y + self.height // 2
         
-        # Direction vectors based on guard's facing direction
-        if self.direction == 'up':
-            dir_x, dir_y = 0, -1
-        elif self.direction == 'down':
-            dir_x, dir_y = 0, 1
-        elif self.direction == 'left':
-            dir_x, dir_y = -1, 0
-        else:  # right
-            dir_x, dir_y = 1, 0
-        
-        # Draw a semi-transparent vision cone
-        vision_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        
-        # Create a cone with 90-degree field of view (wider than regular guards)
-        angle = math.atan2(dir_y, dir_x)
-        fov_rad = math.radians(90)  # 90-degree field of view
-        
-        # Create a polygon for the vision cone
-        points = [(center_x, center_y)]
-        for i in range(21):  # More points = smoother cone
-            a = angle - fov_rad/2 + (fov_rad * i / 20)
-            end_x = center_x + math.cos(a) * self.vision_range
-            end_y = center_y + math.sin(a) * self.vision_range
-            points.append((end_x, end_y))
-        
         # Vision cone color based on guard state
         if self.state == "patrol":
             color = self.vision_color + (30,)  # 30% opacity
         else:  # chase
             color = (255, 0, 0, 50)  # Red with 50% opacity
-            
-        pygame.draw.polygon(vision_surface, color, points)
-        surface.blit(vision_surface, (0, 0))
+        
+        # 90-degree field of view (wider than regular guards), cached per direction
+        draw_vision_cone(surface, center_x, center_y, self.direction, self.vision_range, 90, color)
 
 class Room4(BaseRoom):
     def load_assets(self):
@@ -422,7 +401,7 @@ class Room4(BaseRoom):
         self.ambient_light = 100  # Ambient light level (0-255, 0 = completely dark)
         
         # Create surface for lighting effect
-        self.light_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self.lighting = LightingLayer(self.ambient_light)
         
         # Variable for document found
         self.document_found = False
@@ -481,7 +460,7 @@ class Room4(BaseRoom):
         # Setup the static guard (using the trum.png asset)
         self.guards = [
             StaticGuard(10 * TILE_SIZE, 5 * TILE_SIZE, "game/assets/guard_img/trum.png", 
-                colliders=self.colliders, vision_range=250, vision_color=(255, 0, 0))
+                collision_grid=self.collision_grid, vision_range=250, vision_color=(255, 0, 0))
         ]
         
         # Setup the secret document as a collectible item
@@ -495,11 +474,16 @@ class Room4(BaseRoom):
         self.alarm_sound = None
         self.alarm_sound_channel = None
         try:
-            self.alarm_sound = pygame.mixer.Sound("game/assets/sound/alert.wav")
+            self.alarm_sound = load_sound("game/assets/sound/alert.wav")
             self.alarm_sound.set_volume(0.7)
         except pygame.error as e:
             print(f"Could not load alarm sound file: {e}")
     
+    def randomize(self):
+        # Pola patroli guard diacak ulang setiap reset
+        for guard in self.guards:
+            guard.randomize_patrol()
+    
     def setup_secret_document(self):
         # Place the secret document in the center of the room
         document_x = 10 * TILE_SIZE
@@ -562,6 +546,11 @@ class Room4(BaseRoom):
                     self.alarm_sound_played = False
 
     def show_document_prolog(self):
+        # Headless runs skip the blocking prolog and finish the game directly
+        if self.game_manager.headless:
+            self.game_manager.game_completed = True
+            return
+        
         # Pause background music during document reveal
         pygame.mixer.music.pause()
         
@@ -570,8 +559,8 @@ class Room4(BaseRoom):
         pygame.display.set_caption("Whitehouse Heist - Document Revealed")
         
         # Load font
-        font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 24)
-        title_font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 36)
+        font = get_font(24, "game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf")
+        title_font = get_font(36, "game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf")
         
         # Document content
         self.prolog_content = [
@@ -713,8 +702,8 @@ class Room4(BaseRoom):
         screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         
         # Load font
-        font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 36)
-        small_font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 24)
+        font = get_font(36, "game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf")
+        small_font = get_font(24, "game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf")
         
         # Fade in
         fade_alpha = 255
@@ -745,7 +734,7 @@ class Room4(BaseRoom):
             
             # Draw guard image (use the same image as in the room)
             try:
-                guard_img = pygame.image.load("game/assets/guard_img/trum.png").convert_alpha()
+                guard_img = load_image("game/assets/guard_img/trum.png")
                 guard_img = pygame.transform.scale(guard_img, (guard_img.get_width() * 2, guard_img.get_height() * 2))
                 guard_rect = guard_img.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
                 screen.blit(guard_img, guard_rect)
@@ -818,8 +807,7 @@ class Room4(BaseRoom):
             overlay.fill((0, 0, 0, 100))  # Black with 100/255 opacity
             
             # Draw message
-            font = pygame.font.SysFont(None, 48)
-            message = font.render("DOKUMEN RAHASIA DITEMUKAN!", True, (255, 215, 0))
+            message = render_text(get_font(48), "DOKUMEN RAHASIA DITEMUKAN!", (255, 215, 0))
             message_rect = message.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             
             self.screen.blit(overlay, (0, 0))
@@ -838,65 +826,54 @@ class Room4(BaseRoom):
     
     def draw(self):
         # Draw background and base objects
-        self.draw_tilemap()
-        self.draw_objects()
-        self.draw_items()
+        with profiler.measure("draw_background"):
+            self.draw_background()
+        with profiler.measure("draw_items"):
+            self.draw_items()
         
         # Draw guards
-        for guard in self.guards:
-            guard.draw(self.screen)
+        with profiler.measure("draw_guards"):
+            for guard in self.guards:
+                guard.draw(self.screen)
         
         # Draw player (only if not hiding)
-        if not self.player_is_hidden:
-            self.player.draw(self.screen)
-            self.player.draw_stamina_bar(self.screen)
+        with profiler.measure("draw_player"):
+            if not self.player_is_hidden:
+                self.player.draw(self.screen)
+                self.player.draw_stamina_bar(self.screen)
         
         # Draw collection effects
-        self.draw_collection_effects()
-        
-        # Draw notifications
-        self.draw_notifications()
-        
-        # Draw hiding indicator if player is hiding
-        if self.player_is_hidden and self.current_hiding_spot:
-            self.draw_hiding_indicator()
+        with profiler.measure("draw_effects"):
+            self.draw_collection_effects()
         
-        # Draw score
-        score_text = self.font.render(f"Score: {self.game_manager.score}", True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
-        
-        # Draw debug info if enabled
-        if self.show_debug:
-            self.draw_debug_info()
+        # Draw notifications, hiding indicator, score and debug info
+        with profiler.measure("draw_hud"):
+            self.draw_hud()
         
         # Apply lighting effect
-        self.apply_lighting_effect()
+        with profiler.measure("draw_lighting"):
+            self.apply_lighting_effect()
         
         # Draw alarm effect if active
-        if self.alarm_triggered:
-            self.draw_alarm_effect()
+        with profiler.measure("draw_alarm"):
+            if self.alarm_triggered:
+                self.draw_alarm_effect()
         
         # Draw document found message if document was found
         if self.document_found:
             self.draw_document_found_message()
     
     def apply_lighting_effect(self):
-        # Create surface for lighting effect
-        self.light_surface.fill((0, 0, 0, 255 - self.ambient_light))
+        self.lighting.clear_lights()
         
         # Create light circle around player if not hiding
         if not self.player_is_hidden:
             player_center_x = int(self.player.x + self.player.width // 2)
             player_center_y = int(self.player.y + self.player.height // 2)
-            
-            # Create light gradient
-            for radius in range(self.light_radius, 0, -1):
-                alpha = int(255 * (1 - radius / self.light_radius))
-                pygame.draw.circle(self.light_surface, (0, 0, 0, alpha), 
-                                  (player_center_x, player_center_y), radius, 1)
+            self.lighting.add_light(player_center_x, player_center_y, self.light_radius)
         
         # Apply lighting effect to screen
-        self.screen.blit(self.light_surface, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
+        self.lighting.render(self.screen)
     
     def draw_alarm_effect(self):
         # Create red flashing effect for alarm
@@ -906,8 +883,7 @@ class Room4(BaseRoom):
             self.screen.blit(alarm_surface, (0, 0))
             
             # Draw alarm text
-            alarm_font = pygame.font.SysFont(None, 48)
-            alarm_text = alarm_font.render("! ALARM !", True, (255, 0, 0))
+            alarm_text = render_text(get_font(48), "! ALARM !", (255, 0, 0))
             text_rect = alarm_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
             self.screen.blit(alarm_text, text_rect)
 
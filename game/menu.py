@@ -4,18 +4,23 @@ from game.cutscenes.intro import run_cutscene_intro
 from game.cutscenes.walkin import run_cutscene_walkin
 from game.cutscenes.intro_mission import run_cutscene_intro_mission
 from game.maps.gameplay import run_gameplay
+from game.utils.dirty_rects import DirtyRenderer
+from game.utils.asset_loader import load_background
+from game.utils.text import get_font, render_text
+
+FONT_PATH = "game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf"
 
 def draw_text(screen, font, text, rect, hover=False):
     color = HOVER if hover else WHITE
-    label = font.render(text, True, color)
+    label = render_text(font, text, color)
     label_rect = label.get_rect(center=rect.center)
     screen.blit(label, label_rect)
 
 def show_how_to_play(screen, clock):
     # Setup font
-    title_font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 36)
-    font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 24)
-    small_font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 20)
+    title_font = get_font(36, FONT_PATH)
+    font = get_font(24, FONT_PATH)
+    small_font = get_font(20, FONT_PATH)
     
     # Judul dan instruksi
     title = "CARA BERMAIN"
@@ -42,56 +47,72 @@ def show_how_to_play(screen, clock):
         ""
     ]
     
+    # Halaman statis digambar sekali; per frame hanya indikator yang berkedip
+    page = pygame.Surface(screen.get_size())
+    page.fill((0, 0, 0))
+    
+    # Gambar judul
+    title_surface = title_font.render(title, True, (255, 255, 255))
+    title_rect = title_surface.get_rect(center=(screen.get_width() // 2, 80))
+    page.blit(title_surface, title_rect)
+    
+    # Gambar garis pemisah
+    pygame.draw.line(page, (100, 100, 100), 
+                     (100, title_rect.bottom + 20), 
+                     (screen.get_width() - 100, title_rect.bottom + 20), 3)
+    
+    # Gambar instruksi
+    y_offset = title_rect.bottom + 60
+    for line in instructions:
+        if line.startswith("KONTROL:") or line.startswith("TUJUAN PERMAINAN:") or line.startswith("TIPS:"):
+            # Gunakan font yang lebih besar untuk judul bagian
+            text_surface = font.render(line, True, (255, 200, 0))
+        elif line == "":
+            # Baris kosong, hanya tambahkan spasi
+            y_offset += 10
+            continue
+        else:
+            # Teks instruksi normal
+            text_surface = small_font.render(line, True, (200, 200, 200))
+        
+        text_rect = text_surface.get_rect(midleft=(100, y_offset))
+        page.blit(text_surface, text_rect)
+        y_offset += 30
+    
+    back_text = render_text(font, "Tekan SPASI untuk kembali ke menu", (255, 255, 255))
+    back_rect = back_text.get_rect(center=(screen.get_width() // 2, screen.get_height() - 50))
+    
+    def draw():
+        screen.blit(page, (0, 0))
+        if blink_on:
+            screen.blit(back_text, back_rect)
+    
     # Loop utama
+    renderer = DirtyRenderer(screen)
+    blink_on = None
     running = True
     while running:
-        for event in pygame.event.get():
+        for event in renderer.events():
+            renderer.handle_event(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE or event.key == pygame.K_SPACE:
                     running = False
+        if not running:
+            break
         
-        # Gambar latar belakang
-        screen.fill((0, 0, 0))
-        
-        # Gambar judul
-        title_surface = title_font.render(title, True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(screen.get_width() // 2, 80))
-        screen.blit(title_surface, title_rect)
-        
-        # Gambar garis pemisah
-        pygame.draw.line(screen, (100, 100, 100), 
-                         (100, title_rect.bottom + 20), 
-                         (screen.get_width() - 100, title_rect.bottom + 20), 3)
-        
-        # Gambar instruksi
-        y_offset = title_rect.bottom + 60
-        for line in instructions:
-            if line.startswith("KONTROL:") or line.startswith("TUJUAN PERMAINAN:") or line.startswith("TIPS:"):
-                # Gunakan font yang lebih besar untuk judul bagian
-                text_surface = font.render(line, True, (255, 200, 0))
-            elif line == "":
-                # Baris kosong, hanya tambahkan spasi
-                y_offset += 10
-                continue
-            else:
-                # Teks instruksi normal
-                text_surface = small_font.render(line, True, (200, 200, 200))
-            
-            text_rect = text_surface.get_rect(midleft=(100, y_offset))
-            screen.blit(text_surface, text_rect)
-            y_offset += 30
+        # Indikator "tekan spasi" berkedip setiap 500ms
+        ticks = pygame.time.get_ticks()
+        if ((ticks // 500) % 2 == 0) != blink_on:
+            blink_on = (ticks // 500) % 2 == 0
+            renderer.mark(back_rect)
         
-        # Gambar indikator "tekan spasi" yang berkedip
-        if (pygame.time.get_ticks() // 500) % 2 == 0:  # Berkedip setiap 500ms
-            back_text = font.render("Tekan SPASI untuk kembali ke menu", True, (255, 255, 255))
-            back_rect = back_text.get_rect(center=(screen.get_width() // 2, screen.get_height() - 50))
-            screen.blit(back_text, back_rect)
-        
-        pygame.display.flip()
-        clock.tick(60)
+        renderer.redraw(draw)
+        renderer.present()
+        # Tidur sampai input atau kedipan berikutnya
+        renderer.wait(clock, 60, timeout=500 - ticks % 500)
 
 def main_menu():
     # Inisialisasi pygame mixer jika belum diinisialisasi
@@ -112,11 +133,10 @@ def main_menu():
         print(f"Tidak dapat memuat file musik menu: {e}")
 
     # Load gambar latar belakang
-    background = pygame.image.load("game/assets/background/first.png")
-    background = pygame.transform.scale(background, (lebar, tinggi))
+    background = load_background("game/assets/background/first.png", (lebar, tinggi))
 
     # Load font
-    font = pygame.font.Font("game/assets/font/Share_Tech_Mono/ShareTechMono-Regular.ttf", 40)
+    font = get_font(40, FONT_PATH)
 
     # Warna
     global WHITE, DARK, HOVER
@@ -134,18 +154,21 @@ def main_menu():
     # Buat objek clock
     clock = pygame.time.Clock()
 
-    running = True
-    while running:
+    def draw_menu():
         screen.blit(background, (0, 0))
-
-        mouse_pos = pygame.mouse.get_pos()
-
         for name, rect in buttons.items():
-            is_hover = rect.collidepoint(mouse_pos)
             pygame.draw.rect(screen, DARK, rect, border_radius=12)
-            draw_text(screen, font, name, rect, hover=is_hover)
+            draw_text(screen, font, name, rect, hover=name == hovered)
+
+    # Menu hanya digambar ulang saat tombol yang di-hover berubah
+    renderer = DirtyRenderer(screen)
+    hovered = None
+    running = True
+    while running:
+        mouse_pos = pygame.mouse.get_pos()
 
-        for event in pygame.event.get():
+        for event in renderer.events():
+            renderer.handle_event(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
@@ -161,9 +184,20 @@ def main_menu():
                     running = False
                 elif buttons["Info"].collidepoint(mouse_pos):
                     show_how_to_play(screen, clock)
+                    renderer.mark_all()
                 elif buttons["Quit"].collidepoint(mouse_pos):
                     pygame.quit()
                     sys.exit()
+        if not running:
+            break
+
+        hover = next((name for name, rect in buttons.items() if rect.collidepoint(mouse_pos)), None)
+        if hover != hovered:
+            for name in (hovered, hover):
+                if name is not None:
+                    renderer.mark(buttons[name])
+            hovered = hover
 
-        pygame.display.flip()
-        clock.tick(60)
+        renderer.redraw(draw_menu)
+        renderer.present()
+        renderer.wait(clock, 60, timeout=500)
@@ -0,0 +1,93 @@
+import time
+import pygame
+from game.game_manager import GameManager
+from game.utils.profiler import profiler
+
+# Timestep tetap untuk simulasi headless (ms), setara 60 FPS
+FIXED_DT = 16
+
+class ScriptedInput:
+    """
+    Scripted mouse/keyboard input for headless runs.
+    Steps are (frame, action, value) tuples:
+      ("move", (x, y))  - set the mouse position
+      ("walk", None)    - hold the left mouse button
+      ("run", None)     - hold the right mouse button
+      ("release", None) - release the held mouse button
+      ("key", "c")      - tap a key by name
+    """
+    MOUSE_BUTTONS = {"walk": 1, "run": 3}
+
+    def __init__(self, steps=()):
+        self.steps = sorted(steps, key=lambda step: step[0])
+        self.index = 0
+        self.mouse_pos = (0, 0)
+        self.held_button = None
+
+    @classmethod
+    def follow_route(cls, waypoints, frames_per_waypoint=120, start_frame=0, run=False):
+        """Hold the mouse down and point it at each waypoint in turn"""
+        steps = [(start_frame, "run" if run else "walk", None)]
+        for i, point in enumerate(waypoints):
+            steps.append((start_frame + i * frames_per_waypoint, "move", point))
+        steps.append((start_frame + len(waypoints) * frames_per_waypoint, "release", None))
+        return cls(steps)
+
+    def poll(self, frame):
+        """Return the pygame events scheduled up to frame and the current mouse position"""
+        events = []
+        while self.index < len(self.steps) and self.steps[self.index][0] <= frame:
+            _, action, value = self.steps[self.index]
+            self.index += 1
+            if action == "move":
+                self.mouse_pos = value
+            elif action in self.MOUSE_BUTTONS:
+                self.held_button = self.MOUSE_BUTTONS[action]
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=self.held_button, pos=self.mouse_pos))
+            elif action == "release" and self.held_button is not None:
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONUP, button=self.held_button, pos=self.mouse_pos))
+                self.held_button = None
+            elif action == "key":
+                events.append(pygame.event.Event(pygame.KEYDOWN, key=pygame.key.key_code(value)))
+        return events, self.mouse_pos
+
+def run_simulation(script=None, frames=3600, seed=0, dt=FIXED_DT, render=False, game_manager=None):
+    """
+    Step the game headless with a fixed dt as fast as possible.
+    Returns a summary dict of the final game state.
+    """
+    game_manager = game_manager or GameManager(headless=True, seed=seed)
+    script = script or ScriptedInput()
+
+    start = time.perf_counter()
+    frame = 0
+    caught = 0
+    running = True
+    while running and frame < frames:
+        events, game_manager.mouse_pos = script.poll(frame)
+        for event in events:
+            if not game_manager.handle_event(event):
+                running = False
+
+        was_game_over = game_manager.game_over
+        game_manager.step(dt)
+        if game_manager.game_over and not was_game_over:
+            caught += 1
+        if render:
+            game_manager.render()
+        profiler.end_frame()
+        frame += 1
+
+    return {
+        "frames": frame,
+        "elapsed": time.perf_counter() - start,
+        "room": game_manager.current_room_index,
+        "game_over": game_manager.game_over,
+        "caught": caught,
+        "game_completed": game_manager.game_completed,
+        "score": game_manager.score,
+        "player_pos": (game_manager.player.x, game_manager.player.y),
+    }
+
+if __name__ == "__main__":
+    print(run_simulation())
@@ -1,7 +1,159 @@
+import atexit
+import hashlib
+import json
+import os
+import struct
 import pygame
+from collections import OrderedDict
+from game.utils.constants import CACHE_DIR
+from game.utils.atlas import TextureAtlas
 
-def load_and_transform(path, size=None, flip_x=False, flip_y=False, rotate_angle=0):
-    image = pygame.image.load(path).convert_alpha()
+# Subfolder cache disk untuk surface yang sudah di-decode/ditransformasi
+ASSET_CACHE_DIR = os.path.join(CACHE_DIR, "assets")
+
+# Header file cache: lebar, tinggi (uint32 little-endian), lalu byte RGBA
+_HEADER = struct.Struct("<II")
+
+# Indeks sumber: path -> (st_mtime_ns, st_size, sha1); file hanya di-hash ulang jika berubah
+ASSET_INDEX_PATH = os.path.join(ASSET_CACHE_DIR, "index.json")
+
+# Jumlah gambar latar layar penuh yang disimpan (masing-masing beberapa MB)
+BACKGROUND_CACHE_SIZE = 4
+
+# Cache aset global, dipakai bersama oleh semua ruangan
+# Surface dan Sound di cache dipakai bersama: jangan dimodifikasi langsung
+_image_cache = {}      # path -> Surface (convert_alpha)
+_transform_cache = {}  # (path, size, flip_x, flip_y, rotate_angle) -> Surface
+_frames_cache = {}     # (sheet, row, count, frame_width, frame_height, scale) -> [Surface]
+_sound_cache = {}      # path -> Sound
+_background_cache = OrderedDict()  # LRU: (path, size, darken) -> Surface (convert)
+_file_index = None     # isi ASSET_INDEX_PATH, dimuat saat pertama dipakai
+_index_dirty = False   # ada hash baru yang belum ditulis ke ASSET_INDEX_PATH
+_used_cache_files = set()  # file cache yang dipakai/ditulis proses ini (untuk prune)
+_atlas = TextureAtlas()  # halaman atlas bersama untuk tile, objek dan frame semua ruangan
+_asset_log = None      # path yang dimuat sejak start_asset_log(), atau None
+_cache_clearers = []   # clear() cache render modul lain, dipanggil evict_assets(None)
+_silent_sound = None   # Sound hening pengganti semua file suara (mode headless), atau None
+
+def register_cache(clear):
+    """Register clear() of a module-level render cache with evict_assets(None)"""
+    _cache_clearers.append(clear)
+    return clear
+
+def start_asset_log():
+    """Start recording the image and sound paths requested from the cache"""
+    global _asset_log
+    _asset_log = set()
+
+def stop_asset_log():
+    """Stop recording and return the paths requested since start_asset_log()"""
+    global _asset_log
+    paths, _asset_log = _asset_log or set(), None
+    return paths
+
+def _load_index():
+    global _file_index
+    if _file_index is None:
+        try:
+            with open(ASSET_INDEX_PATH) as f:
+                _file_index = json.load(f)
+        except (OSError, ValueError):
+            _file_index = {}
+    return _file_index
+
+def _save_index():
+    global _index_dirty
+    _index_dirty = False
+    try:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        temp_path = ASSET_INDEX_PATH + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(_file_index, f, indent=1, sort_keys=True)
+        os.replace(temp_path, ASSET_INDEX_PATH)
+    except OSError as e:
+        print(f"Tidak dapat menyimpan indeks cache aset: {e}")
+
+@atexit.register
+def flush_asset_index():
+    """Write the file index once if any file was hashed since the last save"""
+    if _index_dirty:
+        _save_index()
+
+def _file_hash(path):
+    """
+    sha1 of the file at path, recomputed only when its mtime or size
+    changed. New hashes only mark the index dirty; flush_asset_index()
+    writes it once.
+    """
+    global _index_dirty
+    index = _load_index()
+    stat = os.stat(path)
+    entry = index.get(path)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return entry[2]
+    with open(path, "rb") as f:
+        file_hash = hashlib.sha1(f.read()).hexdigest()
+    index[path] = [stat.st_mtime_ns, stat.st_size, file_hash]
+    _index_dirty = True
+    return file_hash
+
+def _disk_cache_path(path, transform):
+    """Cache file for path with transform (size, flip_x, flip_y, rotate_angle)"""
+    key = repr((_file_hash(path), transform))
+    name = hashlib.sha1(key.encode()).hexdigest() + ".rgba"
+    _used_cache_files.add(name)
+    return os.path.join(ASSET_CACHE_DIR, name)
+
+def _load_cached_surface(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _HEADER.size:
+        return None
+    width, height = _HEADER.unpack_from(data)
+    if len(data) != _HEADER.size + width * height * 4:
+        return None
+    image = pygame.image.frombuffer(data[_HEADER.size:], (width, height), "RGBA")
+    return image.convert_alpha()
+
+def _store_cached_surface(cache_path, image):
+    try:
+        os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+        # Tulis ke file sementara dulu supaya proses lain tidak membaca file setengah jadi
+        temp_path = cache_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_HEADER.pack(*image.get_size()))
+            f.write(pygame.image.tobytes(image, "RGBA"))
+        os.replace(temp_path, cache_path)
+    except OSError as e:
+        print(f"Tidak dapat menyimpan cache aset: {e}")
+
+def _load_through_disk_cache(path, transform, build):
+    """Surface for path + transform from the disk cache, or build() it and store it"""
+    cache_path = _disk_cache_path(path, transform)
+    image = _load_cached_surface(cache_path)
+    if image is None:
+        image = build()
+        _store_cached_surface(cache_path, image)
+    return image
+
+def load_image(path):
+    """Load an image once and return the shared converted surface"""
+    if _asset_log is not None:
+        _asset_log.add(path)
+    image = _image_cache.get(path)
+    if image is None:
+        image = _load_through_disk_cache(path, None, lambda: pygame.image.load(path).convert_alpha())
+        _image_cache[path] = image
+    return image
+
+def _transform(path, size, flip_x, flip_y, rotate_angle):
+    # Sumber hanya di-decode, tidak disimpan ke disk: yang dipakai hasil transformasinya
+    image = _image_cache.get(path)
+    if image is None:
+        image = pygame.image.load(path).convert_alpha()
     if size:
         image = pygame.transform.smoothscale(image, size)
     if flip_x or flip_y:
@@ -10,10 +162,158 @@ def load_and_transform(path, size=None, flip_x=False, flip_y=False, rotate_angle
         image = pygame.transform.rotate(image, rotate_angle)
     return image
 
+def load_and_transform(path, size=None, flip_x=False, flip_y=False, rotate_angle=0):
+    """
+    Shared transformed surface, packed into the shared texture atlas. On a
+    cold start the result comes from the on-disk cache (keyed by file hash
+    and transform) when available, so PNG decoding and smoothscale only
+    run once per asset version.
+    """
+    if _asset_log is not None:
+        _asset_log.add(path)
+    key = (path, tuple(size) if size else None, flip_x, flip_y, rotate_angle)
+    image = _transform_cache.get(key)
+    if image is not None:
+        return image
+
+    # Setelah evict_assets(path) slot atlas lamanya masih bisa dipakai lagi
+    image = _atlas.get(key)
+    if image is None:
+        image = pack_sprite(_load_through_disk_cache(path, key[1:], lambda: _transform(path, *key[1:])), key, path)
+    _transform_cache[key] = image
+    return image
+
+def load_background(path, size, darken=0):
+    """
+    Load an opaque full-screen image converted to the display format and
+    scaled to size, optionally darkened by a black overlay of alpha darken.
+    Kept in a small LRU cache shared by the menu and cutscenes.
+    """
+    key = (path, tuple(size), darken)
+    image = _background_cache.get(key)
+    if image is not None:
+        _background_cache.move_to_end(key)
+        return image
+
+    image = pygame.transform.scale(pygame.image.load(path).convert(), size)
+    if darken:
+        overlay = pygame.Surface(size, pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, darken))
+        image.blit(overlay, (0, 0))
+    _background_cache[key] = image
+    if len(_background_cache) > BACKGROUND_CACHE_SIZE:
+        _background_cache.popitem(last=False)
+    return image
+
 def get_frames(sheet, row, count, frame_width, frame_height, scale=2):
-    frames = []
-    for i in range(count):
-        frame = sheet.subsurface(pygame.Rect(i * frame_width, row * frame_height, frame_width, frame_height))
-        frame = pygame.transform.scale(frame, (frame_width * scale, frame_height * scale))
-        frames.append(frame)
-    return frames
+    key = (sheet, row, count, frame_width, frame_height, scale)
+    frames = _frames_cache.get(key)
+    if frames is None:
+        # Frame dari sheet yang dimuat load_image bisa dilepas bersama path-nya
+        path = next((path for path, image in _image_cache.items() if image is sheet), None)
+        frames = []
+        for i in range(count):
+            atlas_key = ("frames", path) + key[1:] + (i,) if path else None
+            frame = _atlas.get(atlas_key) if atlas_key else None
+            if frame is None:
+                frame = sheet.subsurface(pygame.Rect(i * frame_width, row * frame_height, frame_width, frame_height))
+                frame = pack_sprite(pygame.transform.scale(frame, (frame_width * scale, frame_height * scale)),
+                                    atlas_key, path)
+            frames.append(frame)
+        _frames_cache[key] = frames
+    return list(frames)
+
+def pack_sprite(surface, key=None, path=None):
+    """
+    Copy surface into the shared texture atlas and return the page view
+    that replaces it, so only the atlas pages keep the pixels. Sprites
+    with a key are released by evict_assets(path).
+    """
+    return _atlas.add(surface, key, path)
+
+def silence_sounds():
+    """Headless mode: load_sound returns one silent Sound instead of reading (or needing) files"""
+    global _silent_sound
+    _silent_sound = pygame.mixer.Sound(buffer=bytes(4))
+
+def load_sound(path):
+    """Load a sound once and return the shared Sound object"""
+    if _asset_log is not None:
+        _asset_log.add(path)
+    if _silent_sound is not None:
+        return _silent_sound
+    sound = _sound_cache.get(path)
+    if sound is None:
+        sound = pygame.mixer.Sound(path)
+        _sound_cache[path] = sound
+    return sound
+
+def evict_assets(path=None):
+    """
+    Drop cached assets loaded from path, or every cached asset (and the
+    registered render caches) when path is None. Surfaces already held
+    by rooms stay valid. The atlas slots of path are released: reloading
+    path reuses them while their page is alive.
+    """
+    global _atlas
+    if path is None:
+        # Halaman lama tetap hidup selama masih ada surface ruangan yang memakainya
+        _atlas = TextureAtlas()
+        _image_cache.clear()
+        _transform_cache.clear()
+        _frames_cache.clear()
+        _sound_cache.clear()
+        _background_cache.clear()
+        for clear in _cache_clearers:
+            clear()
+        flush_asset_index()
+        return
+
+    sheet = _image_cache.pop(path, None)
+    for key in [key for key in _transform_cache if key[0] == path]:
+        del _transform_cache[key]
+    if sheet is not None:
+        for key in [key for key in _frames_cache if key[0] is sheet]:
+            del _frames_cache[key]
+    _atlas.release(path)
+    _sound_cache.pop(path, None)
+    for key in [key for key in _background_cache if key[0] == path]:
+        del _background_cache[key]
+
+def prune_asset_cache():
+    """
+    Delete cached surfaces (and index entries) that this process did not
+    use. Call after every room was built, as build_asset_cache does.
+    Returns the number of removed files.
+    """
+    removed = 0
+    try:
+        names = os.listdir(ASSET_CACHE_DIR)
+    except OSError:
+        return 0
+    for name in names:
+        if name.endswith((".rgba", ".tmp")) and name not in _used_cache_files:
+            try:
+                os.remove(os.path.join(ASSET_CACHE_DIR, name))
+                removed += 1
+            except OSError as e:
+                print(f"Tidak dapat menghapus cache aset lama: {e}")
+    index = _load_index()
+    used_paths = {key[0] for key in _transform_cache} | set(_image_cache)
+    for path in [path for path in index if path not in used_paths]:
+        del index[path]
+    _save_index()
+    return removed
+
+def build_asset_cache():
+    """
+    Build every room once so each image and transform they use is in the
+    on-disk cache, then prune entries no room produces any more.
+    Returns (cached surfaces, removed stale files).
+    """
+    from game.game_manager import GameManager
+
+    game_manager = GameManager(headless=True)
+    for room_index in range(len(game_manager.room_classes)):
+        game_manager.get_room(room_index)
+    return len(_used_cache_files), prune_asset_cache()
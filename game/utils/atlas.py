@@ -0,0 +1,114 @@
+import pygame
+
+# Ukuran satu halaman atlas (px) dan jarak antar sprite supaya tidak saling bocor
+ATLAS_PAGE_SIZE = 1024
+ATLAS_PADDING = 1
+
+class TextureAtlas:
+    """
+    Packs many small SRCALPHA surfaces into a few large pages using shelf
+    packing: sprites are placed left to right on horizontal shelves, and a
+    new shelf starts below the tallest sprite of the previous one.
+    add() returns a subsurface view into the page, so callers keep that
+    instead of the original and draw it like any other Surface.
+
+    Sprites added with a key keep their slot after release(owner): get(key)
+    hands the same pixels out again instead of packing a second copy. A
+    page is dropped once every sprite on it was released.
+    """
+    def __init__(self, page_size=ATLAS_PAGE_SIZE, padding=ATLAS_PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        self.shelves = []  # per halaman: list [y, tinggi, x berikutnya]
+        self.count = 0
+        self.slots = {}  # key -> (indeks halaman, rect, owner)
+        self.live = []  # per halaman: key yang sedang dipakai
+        self.pinned = []  # per halaman: ada sprite tanpa key (tidak pernah dilepas)
+        self.owners = {}  # owner -> key miliknya
+
+    def get(self, key):
+        """Page view for a sprite added earlier with key, or None"""
+        slot = self.slots.get(key)
+        if slot is None:
+            return None
+        page_index, rect, owner = slot
+        self.live[page_index].add(key)
+        self.owners.setdefault(owner, set()).add(key)
+        return self.pages[page_index].subsurface(rect)
+
+    def add(self, surface, key=None, owner=None):
+        """
+        Copy surface into the atlas and return its page view, or surface
+        itself if it cannot be packed. key/owner make the slot reusable
+        through get() and releasable through release(owner).
+        """
+        # Surface tanpa alpha per pixel atau terlalu besar tetap dipakai langsung
+        width, height = surface.get_size()
+        if (not surface.get_flags() & pygame.SRCALPHA or
+                width + self.padding > self.page_size or height + self.padding > self.page_size):
+            return surface
+
+        page_index, x, y = self._place(width + self.padding, height + self.padding)
+        page = self.pages[page_index]
+        # BLEND_RGBA_MAX ke halaman kosong = salinan persis, termasuk alpha
+        page.blit(surface, (x, y), special_flags=pygame.BLEND_RGBA_MAX)
+        self.count += 1
+        rect = pygame.Rect(x, y, width, height)
+        if key is None:
+            self.pinned[page_index] = True
+        else:
+            self.slots[key] = (page_index, rect, owner)
+            self.live[page_index].add(key)
+            self.owners.setdefault(owner, set()).add(key)
+        return page.subsurface(rect)
+
+    def release(self, owner):
+        """
+        Mark the sprites of owner as unused. Their slots stay reserved for
+        get(); a page whose sprites are all released is dropped (its pixels
+        are freed once no view into it is left).
+        """
+        for key in self.owners.pop(owner, ()):
+            page_index = self.slots[key][0]
+            live = self.live[page_index]
+            live.discard(key)
+            if not live and not self.pinned[page_index] and self.pages[page_index] is not None:
+                self.pages[page_index] = None
+                self.shelves[page_index] = None
+        for key in [key for key, slot in self.slots.items() if self.pages[slot[0]] is None]:
+            del self.slots[key]
+
+    def _place(self, width, height):
+        for page_index, shelves in enumerate(self.shelves):
+            if shelves is None:
+                continue  # Halaman sudah dilepas
+            for shelf in shelves:
+                if height <= shelf[1] and shelf[2] + width <= self.page_size:
+                    x = shelf[2]
+                    shelf[2] += width
+                    return page_index, x, shelf[0]
+            # Rak baru di bawah rak terakhir halaman ini
+            top = shelves[-1][0] + shelves[-1][1]
+            if top + height <= self.page_size:
+                shelves.append([top, height, width])
+                return page_index, 0, top
+
+        # Halaman baru, di indeks halaman yang sudah dilepas jika ada
+        page = pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA)
+        if None in self.pages:
+            page_index = self.pages.index(None)
+        else:
+            page_index = len(self.pages)
+            self.pages.append(None)
+            self.shelves.append(None)
+            self.live.append(None)
+            self.pinned.append(None)
+        self.pages[page_index] = page
+        self.shelves[page_index] = [[0, height, width]]
+        self.live[page_index] = set()
+        self.pinned[page_index] = False
+        return page_index, 0, 0
+
+    def __len__(self):
+        return self.count
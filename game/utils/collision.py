@@ -0,0 +1,96 @@
+from game.utils.constants import TILE_SIZE
+from game.utils.shared import shared_across_resets
+
+@shared_across_resets
+class CollisionGrid:
+    """
+    Uniform grid of collider rects keyed by TILE_SIZE cells.
+    Queries only look at colliders registered in the cells they touch
+    instead of scanning the whole collider list.
+    """
+    # Colliders are registered with a small margin so segment queries with
+    # fractional endpoints never miss a rect that sits right on a cell border
+    MARGIN = 2
+
+    def __init__(self, colliders=None, cell_size=TILE_SIZE):
+        self.cell_size = cell_size
+        self.colliders = []
+        self.cells = {}
+        if colliders:
+            self.rebuild(colliders)
+
+    def rebuild(self, colliders):
+        """Rebuild the grid from a new list of colliders"""
+        self.colliders = list(colliders)
+        self.cells = {}
+        for rect in self.colliders:
+            padded = rect.inflate(self.MARGIN * 2, self.MARGIN * 2)
+            for cell in self._cells_for_rect(padded):
+                self.cells.setdefault(cell, []).append(rect)
+
+    def _cells_for_rect(self, rect):
+        size = self.cell_size
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                yield (cx, cy)
+
+    def _cells_for_segment(self, x1, y1, x2, y2):
+        # Amanatides-Woo traversal; on an exact corner both side cells are visited
+        size = self.cell_size
+        cx, cy = int(x1 // size), int(y1 // size)
+        end_x, end_y = int(x2 // size), int(y2 // size)
+        dx = x2 - x1
+        dy = y2 - y1
+        step_x = 1 if dx > 0 else -1
+        step_y = 1 if dy > 0 else -1
+        t_max_x = ((cx + (step_x > 0)) * size - x1) / dx if dx else float('inf')
+        t_max_y = ((cy + (step_y > 0)) * size - y1) / dy if dy else float('inf')
+        t_delta_x = size / abs(dx) if dx else float('inf')
+        t_delta_y = size / abs(dy) if dy else float('inf')
+
+        yield (cx, cy)
+        steps = abs(end_x - cx) + abs(end_y - cy)
+        while steps > 0 and (cx, cy) != (end_x, end_y):
+            if t_max_x < t_max_y:
+                cx += step_x
+                t_max_x += t_delta_x
+                steps -= 1
+            elif t_max_y < t_max_x:
+                cy += step_y
+                t_max_y += t_delta_y
+                steps -= 1
+            else:
+                yield (cx + step_x, cy)
+                yield (cx, cy + step_y)
+                cx += step_x
+                cy += step_y
+                t_max_x += t_delta_x
+                t_max_y += t_delta_y
+                steps -= 2
+            yield (cx, cy)
+
+    def collides_rect(self, rect):
+        """True if rect overlaps any collider"""
+        for cell in self._cells_for_rect(rect):
+            for collider in self.cells.get(cell, ()):
+                if rect.colliderect(collider):
+                    return True
+        return False
+
+    def segment_blocked(self, x1, y1, x2, y2):
+        """True if the segment (x1, y1)-(x2, y2) crosses any collider"""
+        checked = set()
+        for cell in self._cells_for_segment(x1, y1, x2, y2):
+            for collider in self.cells.get(cell, ()):
+                key = id(collider)
+                if key in checked:
+                    continue
+                checked.add(key)
+                if collider.clipline(x1, y1, x2, y2):
+                    return True
+        return False
+
+    def point_solid(self, x, y):
+        """True if the point lies inside a collider (only the point's cell is checked)"""
+        cell = (int(x // self.cell_size), int(y // self.cell_size))
+        return any(collider.collidepoint(x, y) for collider in self.cells.get(cell, ()))
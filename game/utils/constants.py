@@ -1,3 +1,5 @@
+import os as _os
+
 # --- Konstanta ---
 TILE_SIZE = 64
 MAP_WIDTH = 20
@@ -14,3 +16,11 @@ SCALE = 2
 # Ukuran ruangan 2 yang lebih besar
 ROOM2_WIDTH = 30
 ROOM2_HEIGHT = 19
+
+# Jumlah ruangan yang dibangun penuh sekaligus (ditambah ruangan berikutnya yang di-prefetch);
+# ruangan lain dilepas dan hanya state-nya yang disimpan
+MAX_RESIDENT_ROOMS = 2
+
+# Folder cache data turunan (tabel line of sight, aset yang sudah diproses),
+# relatif terhadap root repo, bukan folder kerja saat ini
+CACHE_DIR = _os.path.join(_os.path.dirname(_os.path.dirname(_os.path.dirname(_os.path.abspath(__file__)))), ".cache")
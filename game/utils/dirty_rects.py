@@ -0,0 +1,75 @@
+import pygame
+
+# Waktu tidur maksimum (ms) saat layar tidak berubah; input tetap membangunkan loop
+IDLE_TIMEOUT = 100
+
+class DirtyRenderer:
+    """
+    Tracks which parts of the screen changed this frame and only redraws
+    and presents those (pygame.display.update with a rect list). A frame
+    with nothing dirty draws nothing, and the next wait() sleeps until an
+    event arrives instead of ticking at full frame rate.
+    """
+    def __init__(self, screen):
+        self.screen = screen
+        self.rects = []
+        self.full = True  # Frame pertama selalu digambar penuh
+        self.idle = False
+        self.pending = []  # Event yang diambil wait(), dikembalikan oleh events()
+
+    def mark(self, rect):
+        if rect:
+            self.rects.append(pygame.Rect(rect))
+
+    def mark_all(self):
+        self.full = True
+
+    @property
+    def dirty(self):
+        return self.full or bool(self.rects)
+
+    def handle_event(self, event):
+        # Jendela tertutup/terbuka lagi: isi layar perlu digambar ulang penuh
+        if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            self.mark_all()
+
+    def redraw(self, draw):
+        """Call draw() once per dirty rect with the screen clipped to it"""
+        if self.full:
+            draw()
+            return
+        for rect in self.rects:
+            self.screen.set_clip(rect)
+            draw()
+        self.screen.set_clip(None)
+
+    def present(self):
+        """Push dirty areas to the display; returns False for an idle frame"""
+        if self.full:
+            pygame.display.flip()
+        elif self.rects:
+            pygame.display.update(self.rects)
+        self.idle = not self.dirty
+        self.full = False
+        self.rects = []
+        return not self.idle
+
+    def wait(self, clock, fps=60, timeout=IDLE_TIMEOUT):
+        """
+        Frame pacing: clock.tick(fps) after a drawn frame; after an idle
+        frame, block until an event arrives or timeout ms pass. The event
+        that woke the loop is handed out first by the next events() call,
+        so queue order is kept. Returns dt in ms.
+        """
+        if not self.idle:
+            return clock.tick(fps)
+        event = pygame.event.wait(max(1, int(timeout)))
+        if event.type != pygame.NOEVENT:
+            self.pending.append(event)
+        return clock.tick()
+
+    def events(self):
+        """pygame.event.get() preceded by the event consumed in wait()"""
+        events = self.pending + pygame.event.get()
+        self.pending = []
+        return events
@@ -0,0 +1,73 @@
+import math
+import pygame
+from game.utils.asset_loader import register_cache
+
+# Jumlah sudut rotasi kunci yang disimpan (5 derajat per langkah)
+ROTATION_STEPS = 72
+
+# Jumlah tingkat kilau (sparkle) yang dibedakan saat memilih warna
+SPARKLE_STEPS = 8
+
+SHAPES = ("circle", "square", "diamond", "triangle", "star")
+
+# Cache sprite: key -> Surface
+_key_cache = {}
+_shape_cache = {}
+
+def sparkle_color(base_color, intensity, sparkle=(255, 255, 255)):
+    """Blend base_color toward white, with intensity quantized to SPARKLE_STEPS"""
+    intensity = round(intensity * SPARKLE_STEPS) / SPARKLE_STEPS
+    return tuple(min(255, int(base + (target - base) * intensity)) for base, target in zip(base_color, sparkle))
+
+def get_key_sprite(color, width, height, angle):
+    """Key sprite rotated to the nearest of ROTATION_STEPS angles"""
+    step = int(round(angle * ROTATION_STEPS / 360)) % ROTATION_STEPS
+    key = (color, width, height, step)
+    sprite = _key_cache.get(key)
+    if sprite is None:
+        base = _key_cache.get((color, width, height, None))
+        if base is None:
+            base = pygame.Surface((width + 10, height + 10), pygame.SRCALPHA)
+            pygame.draw.rect(base, color, (5, 10, 15, 5))
+            pygame.draw.circle(base, color, (15, 7), 7)
+            pygame.draw.circle(base, (0, 0, 0), (15, 7), 3)
+            _key_cache[(color, width, height, None)] = base
+        sprite = pygame.transform.rotate(base, step * 360 / ROTATION_STEPS)
+        _key_cache[key] = sprite
+    return sprite
+
+def get_shape_sprite(shape, color, size):
+    """
+    Item shape of half-size size with its highlight dot, drawn on a
+    (2 * size + 2) square surface centered at (size + 1, size + 1).
+    """
+    key = (shape, color, size)
+    sprite = _shape_cache.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((size * 2 + 2, size * 2 + 2), pygame.SRCALPHA)
+        c = size + 1
+        highlight = (c - size // 3, c - size // 3)
+        if shape == "circle":
+            pygame.draw.circle(sprite, color, (c, c), size)
+        elif shape == "square":
+            pygame.draw.rect(sprite, color, (c - size, c - size, size * 2, size * 2))
+            highlight = (c - size // 2, c - size // 2)
+        elif shape == "diamond":
+            pygame.draw.polygon(sprite, color, [(c, c - size), (c + size, c), (c, c + size), (c - size, c)])
+        elif shape == "triangle":
+            pygame.draw.polygon(sprite, color, [(c, c - size), (c + size, c + size), (c - size, c + size)])
+        elif shape == "star":
+            points = []
+            for i in range(10):
+                angle = math.pi/2 + (2*math.pi * i / 10)
+                radius = size if i % 2 == 0 else size/2
+                points.append((c + radius * math.cos(angle), c + radius * math.sin(angle)))
+            pygame.draw.polygon(sprite, color, points)
+        pygame.draw.circle(sprite, (255, 255, 255), highlight, size // 4)
+        _shape_cache[key] = sprite
+    return sprite
+
+@register_cache
+def clear_item_sprite_cache():
+    _key_cache.clear()
+    _shape_cache.clear()
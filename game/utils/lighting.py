@@ -0,0 +1,68 @@
+import numpy as np
+import pygame
+from game.utils.constants import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.utils.shared import shared_across_resets
+
+# Cache mask cahaya: (radius, ambient_light) -> array alpha (NumPy)
+_mask_cache = {}
+
+def get_light_mask(radius, ambient_light):
+    """
+    Return the alpha array of a radial light gradient, computed once
+    per (radius, ambient_light) pair.
+    """
+    key = (radius, ambient_light)
+    mask = _mask_cache.get(key)
+    if mask is None:
+        size = radius * 2 + 1
+        mask_surface = pygame.Surface((size, size), pygame.SRCALPHA)
+        mask_surface.fill((0, 0, 0, 255 - ambient_light))
+        for r in range(radius, 0, -1):
+            alpha = int(255 * (1 - r / radius))
+            pygame.draw.circle(mask_surface, (0, 0, 0, alpha), (radius, radius), r, 1)
+        mask = pygame.surfarray.array_alpha(mask_surface)
+        _mask_cache[key] = mask
+    return mask
+
+@shared_across_resets
+class LightingLayer:
+    """
+    Darkness overlay with radial light sources stamped from
+    precomputed masks.
+    """
+    def __init__(self, ambient_light, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.ambient_light = ambient_light
+        self.size = size
+        self.surface = None  # Dibuat saat render pertama
+        self.lights = []
+
+    def add_light(self, x, y, radius):
+        """Add a light source centered at (x, y) for the next render"""
+        self.lights.append((int(x), int(y), radius))
+
+    def clear_lights(self):
+        self.lights = []
+
+    def stamp_light(self, x, y, radius):
+        """Lower the overlay alpha around (x, y) to the light mask; overlapping lights combine"""
+        mask = get_light_mask(radius, self.ambient_light)
+        width, height = self.surface.get_size()
+        left, top = x - radius, y - radius
+        x0, y0 = max(left, 0), max(top, 0)
+        x1, y1 = min(left + mask.shape[0], width), min(top + mask.shape[1], height)
+        if x0 >= x1 or y0 >= y1:
+            return
+
+        alpha = pygame.surfarray.pixels_alpha(self.surface)
+        region = alpha[x0:x1, y0:y1]
+        np.minimum(region, mask[x0 - left:x1 - left, y0 - top:y1 - top], out=region)
+        del alpha  # Lepas lock surface
+
+    def render(self, target):
+        """Rebuild the overlay from the current lights and apply it to target"""
+        if self.surface is None:
+            self.surface = pygame.Surface(self.size, pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 255 - self.ambient_light))
+        for x, y, radius in self.lights:
+            self.stamp_light(x, y, radius)
+        target.blit(self.surface, (0, 0), special_flags=pygame.BLEND_RGBA_SUB)
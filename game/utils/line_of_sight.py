@@ -0,0 +1,163 @@
+import hashlib
+import os
+import numpy as np
+from game.utils.constants import TILE_SIZE, CACHE_DIR
+from game.utils.shared import shared_across_resets
+
+# Jarak maksimum (dalam sel) antar pasangan sel yang disimpan di tabel;
+# cukup untuk jangkauan pandang guard terbesar (300 px)
+LOS_MAX_CELLS = 6
+
+def _segments_hit_rect(x1, y1, x2, y2, left, top, right, bottom):
+    """Vectorized Liang-Barsky: which segments touch the closed rect"""
+    dx = x2 - x1
+    dy = y2 - y1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tx1 = (left - x1) / dx
+        tx2 = (right - x1) / dx
+        ty1 = (top - y1) / dy
+        ty2 = (bottom - y1) / dy
+    inside_x = (x1 >= left) & (x1 <= right)
+    inside_y = (y1 >= top) & (y1 <= bottom)
+    t_enter_x = np.where(dx == 0, np.where(inside_x, -np.inf, np.inf), np.minimum(tx1, tx2))
+    t_exit_x = np.where(dx == 0, np.where(inside_x, np.inf, -np.inf), np.maximum(tx1, tx2))
+    t_enter_y = np.where(dy == 0, np.where(inside_y, -np.inf, np.inf), np.minimum(ty1, ty2))
+    t_exit_y = np.where(dy == 0, np.where(inside_y, np.inf, -np.inf), np.maximum(ty1, ty2))
+    t_enter = np.maximum(np.maximum(t_enter_x, t_enter_y), 0.0)
+    t_exit = np.minimum(np.minimum(t_exit_x, t_exit_y), 1.0)
+    return t_enter <= t_exit
+
+@shared_across_resets
+class LineOfSightTable:
+    """
+    Cell-to-cell visibility table for a room.
+    A pair of cells is marked clear when no collider touches the convex hull
+    of the two cells. Every line between points in those cells is then
+    unobstructed. Other pairs fall back to an exact segment test against the
+    collision grid.
+    """
+    def __init__(self, collision_grid, columns, rows, cell_size=TILE_SIZE, max_cells=LOS_MAX_CELLS, name=None):
+        self.collision_grid = collision_grid
+        self.name = name  # Nama file cache disk; None = tanpa cache disk
+        self.columns = columns
+        self.rows = rows
+        self.cell_size = cell_size
+        self.max_cells = max_cells
+        self.colliders = []
+        self.clear = None
+        self._build_pairs()
+        self.update(collision_grid.colliders)
+
+    def _build_pairs(self):
+        # Pasangan disimpan sebagai (sel, offset) dengan offset "ke depan" saja,
+        # sehingga indeks tabel bisa dihitung langsung tanpa pencarian
+        self.offsets = [(dx, dy) for dy in range(0, self.max_cells + 1)
+                        for dx in range(-self.max_cells, self.max_cells + 1) if dy > 0 or dx >= 0]
+        self.offset_index = {offset: i for i, offset in enumerate(self.offsets)}
+
+        cells = np.arange(self.columns * self.rows)
+        xs = np.repeat(cells % self.columns, len(self.offsets))
+        ys = np.repeat(cells // self.columns, len(self.offsets))
+        other_x = xs + np.tile([dx for dx, _ in self.offsets], len(cells))
+        other_y = ys + np.tile([dy for _, dy in self.offsets], len(cells))
+        self.valid = (other_x >= 0) & (other_x < self.columns) & (other_y < self.rows)
+
+        half = self.cell_size / 2
+        self.pair_x1 = xs * self.cell_size + half
+        self.pair_y1 = ys * self.cell_size + half
+        self.pair_x2 = other_x * self.cell_size + half
+        self.pair_y2 = other_y * self.cell_size + half
+
+    def _pairs_touching(self, rects, mask=None):
+        """Pairs whose hull touches any of rects, optionally limited to mask"""
+        x1, y1, x2, y2 = self.pair_x1, self.pair_y1, self.pair_x2, self.pair_y2
+        if mask is not None:
+            x1, y1, x2, y2 = x1[mask], y1[mask], x2[mask], y2[mask]
+        hit = np.zeros(len(x1), dtype=bool)
+        # Hull dua sel menyentuh rect <=> garis antar pusat sel menyentuh rect yang diperbesar setengah sel
+        half = self.cell_size / 2
+        for left, top, width, height in rects:
+            hit |= _segments_hit_rect(x1, y1, x2, y2, left - half, top - half,
+                                      left + width + half, top + height + half)
+        return hit
+
+    def _cache_key(self, colliders):
+        key = repr((self.columns, self.rows, self.cell_size, self.max_cells, sorted(colliders)))
+        return hashlib.sha1(key.encode()).hexdigest()
+
+    def _cache_path(self):
+        # Satu file per ruangan; isinya ditimpa saat tilemap/collider berubah
+        return os.path.join(CACHE_DIR, f"los_{self.name}.npz")
+
+    def _store(self, colliders):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(self._cache_path(), "wb") as f:
+                np.savez(f, key=np.array(self._cache_key(colliders)), clear=np.packbits(self.clear))
+        except OSError as e:
+            print(f"Tidak dapat menyimpan cache line of sight: {e}")
+
+    def _load(self, colliders):
+        path = self._cache_path()
+        if not os.path.exists(path):
+            return False
+        try:
+            with np.load(path) as data:
+                if str(data["key"]) != self._cache_key(colliders):
+                    return False
+                clear = np.unpackbits(data["clear"])[:len(self.valid)].astype(bool)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Tidak dapat memuat cache line of sight: {e}")
+            return False
+        if len(clear) != len(self.valid):
+            return False
+        self.clear = clear
+        return True
+
+    def update(self, colliders):
+        """
+        Bring the table in line with a new collider list. The first build
+        is loaded from (or saved to) the room's disk cache; later changes
+        only recompute the pairs touched by added or removed colliders.
+        """
+        colliders = [tuple(rect) for rect in colliders]
+        if self.clear is not None and colliders == self.colliders:
+            return
+        previous = self.colliders
+        self.colliders = colliders
+
+        if self.clear is None:
+            if self.name is not None and self._load(colliders):
+                return
+            self.clear = self.valid & ~self._pairs_touching(colliders)
+            if self.name is not None:
+                self._store(colliders)
+        else:
+            changed = set(previous).symmetric_difference(colliders)
+            affected = self.valid & self._pairs_touching(changed)
+            self.clear[affected] = ~self._pairs_touching(colliders, affected)
+
+    def _cell_index(self, x, y):
+        cx, cy = int(x // self.cell_size), int(y // self.cell_size)
+        if 0 <= cx < self.columns and 0 <= cy < self.rows:
+            return cy * self.columns + cx
+        return None
+
+    def _pair_index(self, a, b):
+        if a > b:
+            a, b = b, a
+        offset = self.offset_index.get((b % self.columns - a % self.columns, b // self.columns - a // self.columns))
+        if offset is None:
+            return None
+        return a * len(self.offsets) + offset
+
+    def is_visible(self, x1, y1, x2, y2):
+        """True if nothing blocks the line between the two points"""
+        a = self._cell_index(x1, y1)
+        b = self._cell_index(x2, y2)
+        if a is not None and b is not None:
+            index = self._pair_index(a, b)
+            if index is not None and self.clear[index]:
+                return True
+        # Kasus perbatasan: uji segmen yang tepat
+        return not self.collision_grid.segment_blocked(x1, y1, x2, y2)
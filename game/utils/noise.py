@@ -0,0 +1,123 @@
+import heapq
+import math
+import numpy as np
+from game.utils.shared import shared_across_resets
+
+# Kekerasan suara yang hilang per pixel jarak tempuh;
+# suara jalan biasa (50) habis setelah 150 px, sama dengan jangkauan dengar guard
+NOISE_FALLOFF = 1 / 3
+
+# Jangkauan dengar guard standar; _hearing_range guard lain menskalakan jarak tempuh suara
+BASE_HEARING_RANGE = 150
+
+# Batas jumlah field yang disimpan (per sel sumber dan level suara)
+NOISE_CACHE_SIZE = 64
+
+@shared_across_resets
+class NoiseField:
+    """
+    Player noise propagated over a GridPathfinder's walkable cells.
+    Loudness drops with walking distance, so sound goes around walls
+    instead of through them. Fields are cached per (source cell, level)
+    and reach as far as the longest hearing_range among the room's guards.
+    """
+    def __init__(self, pathfinder, hearing_range=BASE_HEARING_RANGE):
+        self.pathfinder = pathfinder
+        self.hearing_range = hearing_range
+        self.version = pathfinder.version
+        self.walkable = np.array(pathfinder.walkable, dtype=bool)
+        self.cache = {}
+        self.source = None
+        self.level = 0
+        self.distance = {}  # sel -> jarak tempuh dari sumber (px)
+        self.grid = None    # jarak yang sama sebagai array [row, column], inf = tidak sampai
+
+    def update(self, source_pos, noise_level):
+        """Set the noise source for this frame, propagating only on a cache miss"""
+        if self.version != self.pathfinder.version:
+            self.cache = {}
+            self.version = self.pathfinder.version
+            self.walkable = np.array(self.pathfinder.walkable, dtype=bool)
+
+        self.source = source_pos
+        self.level = noise_level
+        cell = self.pathfinder.nearest_walkable(self.pathfinder.cell_at(*source_pos))
+        if noise_level <= 0 or cell is None:
+            self.distance = {}
+            self.grid = None
+            return
+
+        key = (cell, noise_level)
+        cached = self.cache.get(key)
+        if cached is None:
+            distance = self._propagate(cell, noise_level / NOISE_FALLOFF * self.hearing_range / BASE_HEARING_RANGE)
+            grid = np.full((self.pathfinder.rows, self.pathfinder.columns), np.inf)
+            for (cx, cy), cell_distance in distance.items():
+                grid[cy, cx] = cell_distance
+            cached = (distance, grid)
+            if len(self.cache) >= NOISE_CACHE_SIZE:
+                self.cache = {}
+            self.cache[key] = cached
+        self.distance, self.grid = cached
+
+    def _propagate(self, source, reach):
+        # Dijkstra terbatas: berhenti saat suara sudah habis (plus satu sel, lihat loudness_at)
+        cell_size = self.pathfinder.cell_size
+        max_distance = reach + cell_size
+        distance = {source: 0.0}
+        open_heap = [(0.0, source)]
+        while open_heap:
+            current_distance, current = heapq.heappop(open_heap)
+            if current_distance > distance[current]:
+                continue
+            for neighbour, step in self.pathfinder.neighbours(current):
+                new_distance = current_distance + step * cell_size
+                if new_distance < max_distance and new_distance < distance.get(neighbour, float('inf')):
+                    distance[neighbour] = new_distance
+                    heapq.heappush(open_heap, (new_distance, neighbour))
+        return distance
+
+    def _travelled(self, pos, along_path):
+        # Jarak antar pusat sel kasar untuk titik yang berdekatan; suara tidak
+        # pernah menempuh jarak lebih pendek dari garis lurus
+        direct = math.hypot(pos[0] - self.source[0], pos[1] - self.source[1])
+        return max(direct, along_path - self.pathfinder.cell_size)
+
+    def travelled_at(self, positions):
+        """
+        Array of distances the noise travelled to each (x, y) in positions,
+        inf where it does not reach. Reads the per-cell grid in one pass.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+        if self.grid is None:
+            return np.full(len(positions), np.inf)
+        pathfinder = self.pathfinder
+        cells = (positions // pathfinder.cell_size).astype(int)
+        inside = ((cells[:, 0] >= 0) & (cells[:, 0] < pathfinder.columns) &
+                  (cells[:, 1] >= 0) & (cells[:, 1] < pathfinder.rows))
+        cx = np.clip(cells[:, 0], 0, pathfinder.columns - 1)
+        cy = np.clip(cells[:, 1], 0, pathfinder.rows - 1)
+        along_path = np.where(inside, self.grid[cy, cx], np.inf)
+
+        # Posisi di sel yang tidak walkable memakai sel walkable terdekat (jarang terjadi)
+        for i in np.flatnonzero(~inside | ~self.walkable[cy, cx]):
+            cell = pathfinder.nearest_walkable(tuple(cells[i].tolist()))
+            if cell is not None:
+                along_path[i] = self.distance.get(cell, np.inf)
+
+        direct = np.hypot(positions[:, 0] - self.source[0], positions[:, 1] - self.source[1])
+        return np.maximum(direct, along_path - pathfinder.cell_size)
+
+    def loudness_at(self, pos, hearing_range=BASE_HEARING_RANGE):
+        """
+        Loudness at pos as heard by a guard with hearing_range (0 when the
+        noise does not reach it). A longer range makes the noise fade slower.
+        """
+        if not self.distance:
+            return 0
+        cell = self.pathfinder.nearest_walkable(self.pathfinder.cell_at(*pos))
+        along_path = self.distance.get(cell)
+        if along_path is None:
+            return 0
+        travelled = self._travelled(pos, along_path)
+        return max(0, self.level - travelled * NOISE_FALLOFF * BASE_HEARING_RANGE / hearing_range)
@@ -0,0 +1,113 @@
+import math
+import random
+import numpy as np
+import pygame
+from game.utils.asset_loader import register_cache
+from game.utils.shared import shared_across_resets
+
+# Jumlah partikel maksimum yang hidup bersamaan
+MAX_PARTICLES = 1024
+
+# Jumlah tingkat alpha untuk sprite titik yang di-cache
+ALPHA_STEPS = 16
+
+# Cache sprite titik: (color, radius, alpha_step) -> Surface
+_dot_cache = {}
+
+def get_dot_sprite(color, radius, step):
+    """Pre-rendered SRCALPHA dot; step is the alpha level, 1..ALPHA_STEPS"""
+    key = (color, radius, step)
+    sprite = _dot_cache.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color + (step * 255 // ALPHA_STEPS,), (radius, radius), radius)
+        _dot_cache[key] = sprite
+    return sprite
+
+@register_cache
+def clear_dot_cache():
+    _dot_cache.clear()
+
+@shared_across_resets
+class ParticleSystem:
+    """
+    Fixed-capacity particle pool stored in NumPy arrays.
+    Dead slots go on a free list and are reused by the next burst; all
+    live particles are updated in one vectorized step.
+    """
+    def __init__(self, capacity=MAX_PARTICLES):
+        self.capacity = capacity
+        self.origin = np.zeros((capacity, 2))
+        self.velocity = np.zeros((capacity, 2))
+        self.age = np.zeros(capacity)
+        self.duration = np.zeros(capacity)
+        self.alpha = np.zeros(capacity)
+        self.size = np.zeros(capacity, dtype=np.int32)
+        self.color = np.zeros(capacity, dtype=np.int32)  # indeks ke palette
+        self.palette = []
+        self.palette_index = {}
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.free = list(range(capacity - 1, -1, -1))
+
+    def emit_burst(self, x, y, color, count=20, speed=(0.5, 2.0), size=(2, 5), duration=500):
+        """Spawn count particles flying out of (x, y) in random directions"""
+        count = min(count, len(self.free))
+        if count <= 0:
+            return
+        slots = [self.free.pop() for _ in range(count)]
+        angles = np.array([random.uniform(0, math.pi * 2) for _ in range(count)])
+        speeds = np.array([random.uniform(*speed) for _ in range(count)])
+
+        self.origin[slots] = (x, y)
+        self.velocity[slots, 0] = np.cos(angles) * speeds
+        self.velocity[slots, 1] = np.sin(angles) * speeds
+        self.size[slots] = [random.randint(*size) for _ in range(count)]
+        color = tuple(color[:3])
+        if color not in self.palette_index:
+            self.palette_index[color] = len(self.palette)
+            self.palette.append(color)
+        self.color[slots] = self.palette_index[color]
+        self.age[slots] = 0
+        self.duration[slots] = duration
+        self.alpha[slots] = 255
+        self.alive[slots] = True
+
+    def update(self, dt):
+        live = self.alive
+        if not live.any():
+            return
+        frames = dt / 16.67
+        self.age[live] += dt
+        self.velocity[live] *= 0.95 ** frames
+        self.alpha[live] = np.maximum(0, self.alpha[live] - 5 * frames)
+
+        expired = live & (self.age >= self.duration)
+        if expired.any():
+            self.alive[expired] = False
+            self.free.extend(np.flatnonzero(expired).tolist())
+
+    def draw(self, surface):
+        visible = np.flatnonzero(self.alive & (self.alpha > 0))
+        if not len(visible):
+            return
+        # Posisi = asal + kecepatan saat ini * umur (sama dengan efek lama)
+        sizes = self.size[visible]
+        positions = self.origin[visible] + self.velocity[visible] * (self.age[visible] / 16.67)[:, None]
+        corners = (positions.astype(np.int32) - sizes[:, None]).tolist()
+        steps = np.clip(np.rint(self.alpha[visible] * ALPHA_STEPS / 255), 1, ALPHA_STEPS).astype(np.int32)
+
+        sprites = []
+        for color, size, step in zip(self.color[visible].tolist(), sizes.tolist(), steps.tolist()):
+            key = (self.palette[color], size, step)
+            sprite = _dot_cache.get(key)
+            if sprite is None:
+                sprite = get_dot_sprite(*key)
+            sprites.append(sprite)
+        surface.blits(list(zip(sprites, corners)), doreturn=False)
+
+    def clear(self):
+        self.alive[:] = False
+        self.free = list(range(self.capacity - 1, -1, -1))
+
+    def __len__(self):
+        return int(self.alive.sum())
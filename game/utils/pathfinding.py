@@ -0,0 +1,246 @@
+import heapq
+import math
+import pygame
+from game.utils.constants import TILE_SIZE, SCALE
+from game.utils.shared import shared_across_resets
+
+# Area kaki guard relatif terhadap titik tengahnya (sama dengan Guard.get_rect)
+GUARD_WIDTH = 24 * SCALE
+GUARD_HEIGHT = 32 * SCALE
+GUARD_FEET = pygame.Rect(10 - GUARD_WIDTH // 2, GUARD_HEIGHT - 20 - GUARD_HEIGHT // 2, GUARD_WIDTH - 20, 18)
+
+# Batas jumlah path yang disimpan di cache
+PATH_CACHE_SIZE = 1024
+
+NEIGHBOURS = [
+    (1, 0, 1.0), (-1, 0, 1.0), (0, 1, 1.0), (0, -1, 1.0),
+    (1, 1, math.sqrt(2)), (1, -1, math.sqrt(2)), (-1, 1, math.sqrt(2)), (-1, -1, math.sqrt(2)),
+]
+
+@shared_across_resets
+class GridPathfinder:
+    """
+    A* over the room's tile grid. A cell is walkable when a guard standing
+    at its center does not overlap any collider.
+    """
+    def __init__(self, collision_grid, columns, rows, cell_size=TILE_SIZE, probe=GUARD_FEET):
+        self.collision_grid = collision_grid
+        self.columns = columns
+        self.rows = rows
+        self.cell_size = cell_size
+        self.probe = probe
+        self.walkable = []
+        self.edge_cache = {}
+        self.path_cache = {}
+        self.version = 0
+        self.rebuild()
+
+    def rebuild(self):
+        """Recompute walkable cells and drop cached paths (call after colliders change)"""
+        self.walkable = [[not self.collision_grid.collides_rect(self.probe.move(center))
+                          for center in (self.cell_center((cx, cy)) for cx in range(self.columns))]
+                         for cy in range(self.rows)]
+        self.edge_cache = {}
+        self.path_cache = {}
+        self.version += 1
+
+    def segment_clear(self, start_pos, end_pos):
+        """
+        True if a guard can walk straight from start_pos to end_pos (centers).
+        The corners of the feet rect are swept along the segment.
+        """
+        dx = end_pos[0] - start_pos[0]
+        dy = end_pos[1] - start_pos[1]
+        corners = [(self.probe.left, self.probe.top), (self.probe.right - 1, self.probe.top),
+                   (self.probe.left, self.probe.bottom - 1), (self.probe.right - 1, self.probe.bottom - 1)]
+        for ox, oy in corners:
+            x1, y1 = start_pos[0] + ox, start_pos[1] + oy
+            if self.collision_grid.segment_blocked(x1, y1, x1 + dx, y1 + dy):
+                return False
+        return True
+
+    def edge_clear(self, a, b):
+        key = (a, b) if a <= b else (b, a)
+        clear = self.edge_cache.get(key)
+        if clear is None:
+            clear = self.segment_clear(self.cell_center(a), self.cell_center(b))
+            self.edge_cache[key] = clear
+        return clear
+
+    def cell_at(self, x, y):
+        return (int(x // self.cell_size), int(y // self.cell_size))
+
+    def cell_center(self, cell):
+        return (cell[0] * self.cell_size + self.cell_size // 2, cell[1] * self.cell_size + self.cell_size // 2)
+
+    def is_walkable(self, cell):
+        cx, cy = cell
+        return 0 <= cx < self.columns and 0 <= cy < self.rows and self.walkable[cy][cx]
+
+    def neighbours(self, cell):
+        """Yield (neighbour, step_cost) for every cell reachable in one move"""
+        for dx, dy, step in NEIGHBOURS:
+            neighbour = (cell[0] + dx, cell[1] + dy)
+            if not self.is_walkable(neighbour):
+                continue
+            # Jangan memotong sudut dinding saat bergerak diagonal
+            if dx and dy and not (self.is_walkable((cell[0] + dx, cell[1])) and
+                                  self.is_walkable((cell[0], cell[1] + dy))):
+                continue
+            if not self.edge_clear(cell, neighbour):
+                continue
+            yield neighbour, step
+
+    def nearest_walkable(self, cell, max_radius=3):
+        """Closest walkable cell to cell within max_radius rings, or None"""
+        if self.is_walkable(cell):
+            return cell
+        best = None
+        for radius in range(1, max_radius + 1):
+            for dy in range(-radius, radius + 1):
+                for dx in range(-radius, radius + 1):
+                    if max(abs(dx), abs(dy)) != radius:
+                        continue
+                    candidate = (cell[0] + dx, cell[1] + dy)
+                    if self.is_walkable(candidate):
+                        distance = dx * dx + dy * dy
+                        if best is None or distance < best[0]:
+                            best = (distance, candidate)
+            if best:
+                return best[1]
+        return None
+
+    def find_cells(self, start, goal):
+        """A* between two walkable cells; returns the cell list after start, or None"""
+        key = (start, goal)
+        if key in self.path_cache:
+            return self.path_cache[key]
+
+        open_heap = [(0.0, 0.0, start)]
+        came_from = {start: None}
+        cost = {start: 0.0}
+        found = False
+        while open_heap:
+            _, current_cost, current = heapq.heappop(open_heap)
+            if current == goal:
+                found = True
+                break
+            if current_cost > cost[current]:
+                continue
+            for neighbour, step in self.neighbours(current):
+                new_cost = current_cost + step
+                if new_cost < cost.get(neighbour, float('inf')):
+                    cost[neighbour] = new_cost
+                    came_from[neighbour] = current
+                    hx, hy = abs(goal[0] - neighbour[0]), abs(goal[1] - neighbour[1])
+                    heuristic = max(hx, hy) + (math.sqrt(2) - 1) * min(hx, hy)
+                    heapq.heappush(open_heap, (new_cost + heuristic, new_cost, neighbour))
+
+        cells = None
+        if found:
+            cells = []
+            node = goal
+            while node != start:
+                cells.append(node)
+                node = came_from[node]
+            cells.reverse()
+            cells = self._drop_collinear(start, cells)
+
+        if len(self.path_cache) >= PATH_CACHE_SIZE:
+            self.path_cache = {}
+        self.path_cache[key] = cells
+        return cells
+
+    def _drop_collinear(self, start, cells):
+        # Simpan hanya sel tempat arah gerak berubah
+        result = []
+        previous = start
+        for i, cell in enumerate(cells):
+            if i + 1 < len(cells):
+                following = cells[i + 1]
+                if (cell[0] - previous[0], cell[1] - previous[1]) == (following[0] - cell[0], following[1] - cell[1]):
+                    previous = cell
+                    continue
+            result.append(cell)
+            previous = cell
+        return result
+
+    def find_path(self, start_pos, goal_pos):
+        """
+        Return pixel waypoints from start_pos to goal_pos, or None if no
+        path exists. The last waypoint is goal_pos itself when its cell is walkable.
+        """
+        start = self.nearest_walkable(self.cell_at(*start_pos))
+        goal_cell = self.cell_at(*goal_pos)
+        goal = self.nearest_walkable(goal_cell)
+        if start is None or goal is None:
+            return None
+        if start == goal:
+            return [goal_pos if goal == goal_cell else self.cell_center(goal)]
+
+        cells = self.find_cells(start, goal)
+        if cells is None:
+            return None
+        path = [self.cell_center(cell) for cell in cells]
+        if goal == goal_cell:
+            path[-1] = goal_pos
+        return path
+
+@shared_across_resets
+class FlowField:
+    """
+    Dijkstra field over a GridPathfinder's walkable cells toward one goal
+    cell. Every reachable cell stores the next cell on a shortest path, so
+    any number of guards can head for the same target with one search.
+    """
+    def __init__(self, pathfinder):
+        self.pathfinder = pathfinder
+        self.goal_cell = None
+        self.version = None
+        self.distance = {}
+        self.next_cell = {}
+
+    def update(self, goal_pos):
+        """Recompute the field if the goal moved to another cell or the map changed"""
+        goal = self.pathfinder.nearest_walkable(self.pathfinder.cell_at(*goal_pos))
+        if goal == self.goal_cell and self.version == self.pathfinder.version:
+            return False
+
+        self.goal_cell = goal
+        self.version = self.pathfinder.version
+        self.distance = {}
+        self.next_cell = {}
+        if goal is None:
+            return True
+
+        self.distance[goal] = 0.0
+        open_heap = [(0.0, goal)]
+        while open_heap:
+            current_cost, current = heapq.heappop(open_heap)
+            if current_cost > self.distance[current]:
+                continue
+            for neighbour, step in self.pathfinder.neighbours(current):
+                new_cost = current_cost + step
+                if new_cost < self.distance.get(neighbour, float('inf')):
+                    self.distance[neighbour] = new_cost
+                    self.next_cell[neighbour] = current
+                    heapq.heappush(open_heap, (new_cost, neighbour))
+        return True
+
+    def next_step(self, pos, goal_pos):
+        """
+        Return the next pixel waypoint from pos toward goal_pos, or None if
+        the field was built for another goal or pos cannot reach it.
+        """
+        goal_cell = self.pathfinder.cell_at(*goal_pos)
+        if self.goal_cell is None or self.pathfinder.nearest_walkable(goal_cell) != self.goal_cell:
+            return None
+        cell = self.pathfinder.nearest_walkable(self.pathfinder.cell_at(*pos))
+        if cell == self.goal_cell:
+            return goal_pos if goal_cell == self.goal_cell else self.pathfinder.cell_center(self.goal_cell)
+        next_cell = self.next_cell.get(cell)
+        if next_cell is None:
+            return None
+        if next_cell == self.goal_cell and goal_cell == self.goal_cell:
+            return goal_pos
+        return self.pathfinder.cell_center(next_cell)
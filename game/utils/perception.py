@@ -0,0 +1,85 @@
+import math
+import numpy as np
+from game.utils.constants import RUN_SPEED
+from game.utils.noise import NOISE_FALLOFF, BASE_HEARING_RANGE
+from game.utils.shared import shared_across_resets
+
+# Sudut hadap guard per arah (radian, sama dengan atan2 di Guard.can_see_player)
+DIRECTION_ANGLES = {'up': -math.pi / 2, 'down': math.pi / 2, 'left': math.pi, 'right': 0.0}
+
+class PerceptionContext:
+    """
+    Snapshot of the player for one frame, built once by BaseRoom.update and
+    shared by guards, lasers and items so they all see the same state.
+    """
+    def __init__(self, player, noise_level=0):
+        self.player = player
+        self.rect = player.get_rect()
+        self.center = (player.x + player.width // 2, player.y + player.height // 2)
+        self.is_crouching = player.is_crouching
+        self.is_running = player.speed >= RUN_SPEED
+        self.noise_level = noise_level
+        self.hidden = False
+        self.hiding_spot = None
+        self.senses = {}  # guard -> (in_view, can_hear) dari perceive_player
+
+@shared_across_resets
+class GuardArrays:
+    """
+    Persistent per-guard rows (center, facing, vision range, hearing range,
+    half FOV) for a room's guards. Each guard rewrites its own row at the
+    end of update_movement, so perceive_player reads ready-made arrays.
+    """
+    def __init__(self, guards):
+        self.guards = list(guards)
+        self.rows = np.zeros((len(self.guards), 6))
+        self.centers = self.rows[:, 0:2]
+        self.facing = self.rows[:, 2]
+        self.vision_range = self.rows[:, 3]
+        self.hearing_range = self.rows[:, 4]
+        self.half_fov = self.rows[:, 5]
+        for index, guard in enumerate(self.guards):
+            guard.perception_arrays = self
+            guard.perception_index = index
+            self.write(guard)
+
+    def write(self, guard):
+        self.rows[guard.perception_index] = (guard.x + guard.width // 2, guard.y + guard.height // 2,
+                                             DIRECTION_ANGLES.get(guard.direction, 0.0),
+                                             guard.get_vision_range(), guard.get_hearing_range(),
+                                             math.radians(guard.get_fov()) / 2)
+
+def perceive_player(arrays, player, noise_field=None):
+    """
+    Vision (range + FOV, without line of sight) and hearing checks for
+    every guard in arrays against the player in one vectorized pass. With
+    a noise_field, hearing comes from the propagated loudness instead, with
+    each guard's hearing range scaling how far the noise carries.
+    Returns two bool arrays indexed like arrays.guards: in_view, can_hear.
+    """
+    centers = arrays.centers
+    vision_range = arrays.vision_range
+    hearing_range = arrays.hearing_range
+
+    dx = (player.x + player.width // 2) - centers[:, 0]
+    dy = (player.y + player.height // 2) - centers[:, 1]
+    distance = np.hypot(dx, dy)
+
+    angle_diff = np.abs(np.arctan2(dy, dx) - arrays.facing)
+    angle_diff = np.minimum(angle_diff, 2 * math.pi - angle_diff)
+
+    if player.is_crouching:
+        vision_range = np.maximum(vision_range - player.stealth_bonus, vision_range * 0.7)
+    in_view = (distance <= vision_range) & (angle_diff <= arrays.half_fov)
+
+    if noise_field is not None:
+        travelled = noise_field.travelled_at(centers)
+        can_hear = noise_field.level - travelled * NOISE_FALLOFF * BASE_HEARING_RANGE / hearing_range > 0
+    else:
+        if player.speed >= RUN_SPEED:
+            hearing_range = hearing_range * 1.5
+        elif player.is_crouching:
+            hearing_range = hearing_range * 0.6
+        can_hear = distance <= hearing_range
+
+    return in_view, can_hear
@@ -0,0 +1,114 @@
+import time
+from collections import deque
+from contextlib import contextmanager
+import pygame
+from game.utils.text import get_font, render_text
+
+# Budget satu frame pada 60 FPS (ms)
+FRAME_BUDGET_MS = 1000 / 60
+
+class FrameProfiler:
+    """
+    Times named phases of each frame and keeps a rolling history per phase.
+    Nested phases are exclusive: a parent does not include time spent in
+    its children (e.g. "guards" excludes "cones"). The frame total is wall
+    time from begin_frame() to end_frame(), so untimed work still counts.
+    """
+    def __init__(self, history=120):
+        self.history = history
+        self.enabled = False
+        self.samples = {}  # name -> deque of ms per frame
+        self.totals = deque(maxlen=history)  # ms wall time per frame
+        self.current = {}
+        self.stack = []
+        self.frame_start = None
+        self.panel = None  # Surface overlay, dipakai ulang selama ukurannya sama
+
+    @contextmanager
+    def measure(self, name):
+        if not self.enabled:
+            yield
+            return
+
+        entry = [time.perf_counter(), 0.0]  # start, waktu anak
+        self.stack.append(entry)
+        try:
+            yield
+        finally:
+            self.stack.pop()
+            elapsed = time.perf_counter() - entry[0]
+            self.current[name] = self.current.get(name, 0.0) + (elapsed - entry[1]) * 1000
+            if self.stack:
+                self.stack[-1][1] += elapsed
+
+    def begin_frame(self):
+        """Mark the start of a frame (before update)"""
+        self.frame_start = time.perf_counter() if self.enabled else None
+
+    def end_frame(self):
+        """Push the wall time and phase times of the finished frame into the history"""
+        if not self.enabled or self.frame_start is None:
+            self.current = {}
+            return
+        for name in self.current:
+            if name not in self.samples:
+                self.samples[name] = deque([0.0] * len(self.totals), maxlen=self.history)
+        for name, values in self.samples.items():
+            values.append(self.current.get(name, 0.0))
+        self.totals.append((time.perf_counter() - self.frame_start) * 1000)
+        self.current = {}
+        self.frame_start = None
+
+    def reset(self):
+        self.samples = {}
+        self.totals.clear()
+        self.current = {}
+
+    def stats(self):
+        """Return {name: (mean_ms, max_ms)} over the history window"""
+        return {name: (sum(values) / len(values), max(values))
+                for name, values in self.samples.items() if values}
+
+    def draw(self, surface, x=None, y=10, width=240, graph_height=60):
+        """
+        Draw a compact frame-time graph plus the per-phase table. Numbers
+        change every frame, so they are rendered with font.render and kept
+        out of the shared text cache; only phase names go through it.
+        """
+        font = get_font(18)
+        stats = sorted(self.stats().items(), key=lambda item: item[1][0], reverse=True)
+        line_height = 16
+        height = graph_height + 24 + line_height * len(stats)
+        if x is None:
+            x = surface.get_width() - width - 10
+
+        if self.panel is None or self.panel.get_size() != (width, height):
+            self.panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel = self.panel
+        panel.fill((0, 0, 0, 170))
+
+        # Grafik waktu frame, garis kuning = budget 60 FPS
+        scale = graph_height / (FRAME_BUDGET_MS * 2)
+        bar_width = width / self.history
+        for i, total in enumerate(self.totals):
+            bar_height = min(graph_height, total * scale)
+            color = (80, 220, 80) if total <= FRAME_BUDGET_MS else (230, 60, 60)
+            pygame.draw.rect(panel, color, (i * bar_width, graph_height - bar_height, max(1, bar_width), bar_height))
+        budget_y = graph_height - FRAME_BUDGET_MS * scale
+        pygame.draw.line(panel, (255, 220, 0), (0, budget_y), (width, budget_y))
+
+        mean_total = sum(self.totals) / len(self.totals) if self.totals else 0.0
+        panel.blit(font.render(f"frame {mean_total:5.2f} ms  max {max(self.totals, default=0):5.2f}", True, (255, 255, 255)), (4, graph_height + 4))
+
+        # Tabel per subsistem: rata-rata dan maksimum
+        for i, (name, (mean, peak)) in enumerate(stats):
+            color = (230, 60, 60) if peak > FRAME_BUDGET_MS / 2 else (220, 220, 220)
+            row_y = graph_height + 24 + i * line_height
+            panel.blit(render_text(font, name, color), (4, row_y))
+            panel.blit(font.render(f"{mean:.2f}", True, color), (width - 100, row_y))
+            panel.blit(font.render(f"{peak:.2f}", True, color), (width - 50, row_y))
+
+        surface.blit(panel, (x, y))
+
+# Profiler bersama untuk seluruh game
+profiler = FrameProfiler()
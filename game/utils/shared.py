@@ -0,0 +1,14 @@
+import pygame
+
+# Tipe yang dipakai bersama antar reset ruangan: BaseRoom.reset tidak pernah
+# men-snapshot objek ini, hanya menyimpan referensinya (aset, subsistem, manager)
+_shared_types = (pygame.Surface, pygame.font.Font, pygame.mixer.Sound, pygame.time.Clock)
+
+def shared_across_resets(cls):
+    """Class decorator: room resets keep instances by reference instead of snapshotting them"""
+    global _shared_types
+    _shared_types = _shared_types + (cls,)
+    return cls
+
+def is_shared(value):
+    return isinstance(value, _shared_types)
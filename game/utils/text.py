@@ -0,0 +1,50 @@
+import pygame
+from collections import OrderedDict
+from game.utils.asset_loader import register_cache
+
+# Batas jumlah surface teks yang disimpan di cache
+TEXT_CACHE_SIZE = 256
+
+# Registry font: (name, size) -> pygame.font.Font
+_fonts = {}
+
+# Cache LRU teks: (font, text, color, antialias) -> Surface
+_text_cache = OrderedDict()
+
+def get_font(size, name=None):
+    """
+    Return a shared font for (name, size). name may be a system font
+    name, a path to a .ttf file or None for the default font.
+    """
+    key = (name, size)
+    font = _fonts.get(key)
+    if font is None:
+        if name is not None and name.lower().endswith((".ttf", ".otf")):
+            font = pygame.font.Font(name, size)
+        else:
+            font = pygame.font.SysFont(name, size)
+        _fonts[key] = font
+    return font
+
+def render_text(font, text, color, antialias=True):
+    """
+    Return a cached rendered text surface. The surface is shared,
+    so callers must copy it before modifying it.
+    """
+    key = (font, text, tuple(color), antialias)
+    surface = _text_cache.get(key)
+    if surface is not None:
+        _text_cache.move_to_end(key)
+        return surface
+
+    surface = font.render(text, antialias, color)
+    _text_cache[key] = surface
+    if len(_text_cache) > TEXT_CACHE_SIZE:
+        _text_cache.popitem(last=False)
+    return surface
+
+@register_cache
+def clear_text_cache():
+    """Drop every cached text surface and font"""
+    _text_cache.clear()
+    _fonts.clear()
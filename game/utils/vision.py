@@ -0,0 +1,56 @@
+import math
+import pygame
+from game.utils.asset_loader import register_cache
+
+# Arah hadap guard -> vektor arah
+DIRECTION_VECTORS = {
+    'up': (0, -1),
+    'down': (0, 1),
+    'left': (-1, 0),
+    'right': (1, 0),
+}
+
+# Cache cone surface: (direction, vision_range, fov, color) -> (surface, offset)
+_cone_cache = {}
+
+def get_vision_cone(direction, vision_range, fov_degrees, color):
+    """
+    Return a cached (surface, offset) pair for a vision cone.
+    The surface only covers the cone's bounding box; offset is the
+    position of its top-left corner relative to the cone origin.
+    """
+    key = (direction, vision_range, fov_degrees, color)
+    cached = _cone_cache.get(key)
+    if cached is not None:
+        return cached
+
+    dir_x, dir_y = DIRECTION_VECTORS.get(direction, (1, 0))
+    angle = math.atan2(dir_y, dir_x)
+    fov_rad = math.radians(fov_degrees)
+
+    points = [(0, 0)]
+    for i in range(21):
+        a = angle - fov_rad/2 + (fov_rad * i / 20)
+        points.append((math.cos(a) * vision_range, math.sin(a) * vision_range))
+
+    left = math.floor(min(p[0] for p in points))
+    top = math.floor(min(p[1] for p in points))
+    right = math.ceil(max(p[0] for p in points))
+    bottom = math.ceil(max(p[1] for p in points))
+
+    cone_surface = pygame.Surface((right - left + 1, bottom - top + 1), pygame.SRCALPHA)
+    pygame.draw.polygon(cone_surface, color, [(x - left, y - top) for x, y in points])
+
+    cached = (cone_surface, (left, top))
+    _cone_cache[key] = cached
+    return cached
+
+def draw_vision_cone(surface, center_x, center_y, direction, vision_range, fov_degrees, color):
+    """Blit a cached vision cone with its origin at (center_x, center_y)"""
+    cone_surface, (offset_x, offset_y) = get_vision_cone(direction, vision_range, fov_degrees, color)
+    surface.blit(cone_surface, (int(center_x) + offset_x, int(center_y) + offset_y))
+
+@register_cache
+def clear_vision_cache():
+    """Drop every cached cone surface"""
+    _cone_cache.clear()
@@ -5,6 +5,13 @@ from game.maps.gameplay import run_gameplay
 from game.cutscenes.intro_mission import run_cutscene_intro_mission
 
 if __name__ == "__main__":
+    # python main.py --build-cache: siapkan cache aset di disk lalu keluar
+    if "--build-cache" in sys.argv[1:]:
+        from game.utils.asset_loader import build_asset_cache, ASSET_CACHE_DIR
+        cached, removed = build_asset_cache()
+        print(f"{cached} surface di {ASSET_CACHE_DIR}, {removed} file lama dihapus")
+        sys.exit()
+    
     pygame.init()
     
     # Inisialisasi mixer untuk suara
@@ -0,0 +1,35 @@
+import pygame
+
+from game.utils.atlas import TextureAtlas
+
+def sprite(color, size=(40, 30)):
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+def test_released_slot_is_reused():
+    atlas = TextureAtlas(page_size=128)
+    first = atlas.add(sprite((255, 0, 0, 255)), key="a", owner="a.png")
+    atlas.add(sprite((0, 255, 0, 255)), key="pin")  # Sprite tanpa owner menahan halamannya
+    atlas.release("a.png")
+
+    again = atlas.get("a")
+    assert again is not None
+    assert again.get_abs_offset() == first.get_abs_offset()
+    assert again.get_at((0, 0)) == (255, 0, 0, 255)
+    assert len(atlas) == 2
+
+def test_page_is_dropped_when_all_sprites_are_released():
+    atlas = TextureAtlas(page_size=64)
+    atlas.add(sprite((255, 0, 0, 255), (60, 60)), key="a", owner="a.png")
+    atlas.add(sprite((0, 0, 255, 255), (60, 60)), key="b", owner="b.png")
+    assert len(atlas.pages) == 2
+
+    atlas.release("a.png")
+    assert atlas.pages[0] is None
+    assert atlas.get("a") is None
+
+    # Halaman baru memakai indeks halaman yang dilepas
+    atlas.add(sprite((0, 255, 0, 255), (60, 60)), key="c", owner="c.png")
+    assert len(atlas.pages) == 2
+    assert atlas.get("b").get_at((0, 0)) == (0, 0, 255, 255)
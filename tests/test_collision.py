@@ -0,0 +1,20 @@
+import pygame
+
+from game.utils.collision import CollisionGrid
+
+def test_point_solid():
+    wall = pygame.Rect(64, 64, 128, 32)
+    grid = CollisionGrid([wall], cell_size=64)
+    assert grid.point_solid(64, 64)
+    assert grid.point_solid(191.5, 95)
+    assert not grid.point_solid(192, 80)  # Sisi kanan/bawah Rect tidak termasuk
+    assert not grid.point_solid(100, 96)
+    assert not grid.point_solid(10, 10)
+    assert not grid.point_solid(-5, -5)
+
+def test_point_solid_matches_brute_force():
+    colliders = [pygame.Rect(64, 64, 128, 32), pygame.Rect(300, 10, 20, 200), pygame.Rect(130, 90, 70, 70)]
+    grid = CollisionGrid(colliders, cell_size=64)
+    for y in range(0, 260, 7):
+        for x in range(0, 360, 7):
+            assert grid.point_solid(x, y) == any(rect.collidepoint(x, y) for rect in colliders)
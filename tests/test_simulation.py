@@ -0,0 +1,120 @@
+import random
+import pytest
+
+from game.game_manager import GameManager
+from game.simulation import ScriptedInput, run_simulation, FIXED_DT
+from benchmarks.routes import ROUTES
+
+ROOM_COUNT = 4
+
+# Atribut pola patroli StaticGuard yang diacak ulang oleh Room4.randomize
+PATROL_ATTRIBUTES = ("speed_change_interval", "direction_change_interval", "move_direction",
+                     "pattern_change_interval", "zigzag_amplitude", "zigzag_frequency")
+
+def observable_state(room):
+    """What a player can see of a room: guards, items, lasers, door and alarm"""
+    return {
+        "guards": [(guard.x, guard.y, guard.state, guard.alert_level, guard.direction) for guard in room.guards],
+        "items": [(item.x, item.y, item.collected) for item in room.collectible_items],
+        "lasers": [(laser.x1, laser.y1, laser.x2, laser.y2, laser.active, laser.triggered)
+                   for laser in getattr(room, "lasers", [])],
+        "moving_lasers": [(moving["progress"], moving["laser"].x1, moving["laser"].y1, moving["laser"].active)
+                          for moving in getattr(room, "moving_lasers", [])],
+        "colliders": [tuple(rect) for rect in room.colliders],
+        "door": (room.door_opened, room.key_spawned, room.key_collected, room.all_items_collected),
+        "alarm": getattr(room, "alarm_triggered", None),
+        "hidden": room.player_is_hidden,
+    }
+
+def random_content(room):
+    """The parts of a room that randomize() re-rolls"""
+    if type(room).__name__ == "Room4":
+        return [tuple(repr(getattr(guard, name)) for name in PATROL_ATTRIBUTES) for guard in room.guards]
+    return [(item.x, item.y, item.shape, item.color) for item in room.collectible_items]
+
+@pytest.fixture
+def game_manager():
+    return GameManager(headless=True, seed=0)
+
+def play(game_manager, room_index, frames):
+    """Walk the room's benchmark route for frames steps, drawing every frame"""
+    route = ROUTES[room_index]
+    game_manager.current_room_index = room_index
+    game_manager.current_room = room = game_manager.get_room(room_index)
+    game_manager.player.x, game_manager.player.y = route["start"]
+    script = ScriptedInput.follow_route(route["waypoints"], 60, run=route["run"])
+    for frame in range(frames):
+        events, game_manager.mouse_pos = script.poll(frame)
+        for event in events:
+            game_manager.handle_event(event)
+        room.update(FIXED_DT, game_manager.mouse_held, game_manager.mouse_pos)
+        room.draw()
+        game_manager.game_over = False
+    return room
+
+def test_seeded_runs_are_deterministic():
+    script = lambda: ScriptedInput.follow_route(ROUTES[0]["waypoints"], 60)
+    first = run_simulation(script(), frames=400, seed=3)
+    second = run_simulation(script(), frames=400, seed=3)
+    first.pop("elapsed")
+    second.pop("elapsed")
+    assert first == second
+
+@pytest.mark.parametrize("room_index", range(ROOM_COUNT))
+def test_reset_restores_snapshot(game_manager, room_index, monkeypatch):
+    before = observable_state(game_manager.get_room(room_index))
+    room = play(game_manager, room_index, 180)
+    room.open_door()
+    for item in room.collectible_items:
+        item.collected = True
+    assert observable_state(room) != before
+
+    # Acakan ulang (randomize) diuji terpisah; di sini reset harus sama persis dengan snapshot
+    monkeypatch.setattr(type(room), "randomize", lambda self: None)
+    room.reset()
+    assert observable_state(room) == before
+
+# Room1, Room2 (posisi item) dan Room4 (pola patroli) mengacak ulang isinya saat reset
+@pytest.mark.parametrize("room_index", [0, 1, 3])
+def test_reset_rerolls_random_content(game_manager, room_index):
+    room = game_manager.get_room(room_index)
+    before = random_content(room)
+    items = len(room.collectible_items)
+
+    random.seed(12345)
+    room.reset()
+    assert random_content(room) != before
+    assert len(room.collectible_items) == items
+    assert not any(item.collected for item in room.collectible_items)
+
+def test_dropped_room_is_rebuilt_with_its_state(game_manager):
+    room = play(game_manager, 0, 180)
+    room.collectible_items[0].collected = True
+    room.open_door()
+    before = observable_state(room)
+
+    # Ruangan 1 keluar dari MAX_RESIDENT_ROOMS dan bukan ruangan berikutnya: dilepas
+    for room_index in (1, 2):
+        game_manager.transition_to_room(room_index)
+    assert game_manager.rooms[0] is None
+
+    rebuilt = game_manager.get_room(0)
+    assert rebuilt is not room
+    assert observable_state(rebuilt) == before
+
+def test_next_room_is_prefetched_in_steps(game_manager):
+    assert game_manager.rooms[1] is None
+    assert 1 in game_manager.room_builds
+    steps = 0
+    while game_manager.advance_prefetch():
+        steps += 1
+        assert game_manager.rooms[1] is None or not game_manager.room_builds
+    assert steps > 1
+    assert game_manager.rooms[1] is not None
+
+def test_smoke_all_rooms(game_manager):
+    for room_index in range(ROOM_COUNT):
+        room = play(game_manager, room_index, 120)
+        assert room is game_manager.rooms[room_index]
+        assert game_manager.player.x != ROUTES[room_index]["start"][0] or \
+            game_manager.player.y != ROUTES[room_index]["start"][1]